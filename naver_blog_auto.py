@@ -1,13 +1,16 @@
 import sys
 import time
 import json
+import threading
 import os.path
+from functools import partial
 from PyQt5.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout, 
                             QHBoxLayout, QLabel, QLineEdit, QPushButton, 
                             QCheckBox, QMessageBox, QTabWidget, QGroupBox,
                             QFormLayout, QTextEdit, QProgressBar, QFileDialog,
-                            QComboBox)
-from PyQt5.QtCore import Qt, QThread, pyqtSignal
+                            QComboBox, QListWidget, QListWidgetItem, QSpinBox, QDateTimeEdit,
+                            QDialog)
+from PyQt5.QtCore import Qt, QThread, pyqtSignal, QTimer, QObject, QDateTime
 from PyQt5.QtGui import QIcon, QPixmap
 from selenium import webdriver
 from selenium.webdriver.chrome.service import Service
@@ -18,16 +21,50 @@ from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.common.action_chains import ActionChains
 from selenium.webdriver.common.keys import Keys
 from webdriver_manager.chrome import ChromeDriverManager
+from naver_navigation import (PAGE_LOAD_STRATEGIES, DEFAULT_PAGE_LOAD_STRATEGY,
+                              apply_page_load_strategy, navigate, WriteRouteRouter,
+                              WritePagePrefetcher, BACKGROUND_TAB_ARGUMENTS, find_post_by_title,
+                              latest_log_no)
+from naver_markdown import SmartEditorBlockInserter, parse_rich_text
+from naver_images import ImagePipeline, EditorImageUploader, IMAGE_FILE_FILTER
+from naver_journal import (PostJournal, JOB_STATES, AMBIGUOUS_STATES, STATE_QUEUED, STATE_EDITOR_OPEN, STATE_TYPED,
+                           STATE_PUBLISH_CLICKED, STATE_CONFIRMED, STATE_FAILED, resolve_ambiguous_job)
+from naver_publish import PublishConfirmer, PUBLISHED, REJECTED, enable_network_log
+from naver_display import (DISPLAY_MODES, DEFAULT_DISPLAY_MODE, apply_display_mode, prepare_driver,
+                           has_screen, stop_virtual_display)
+from naver_rate_limit import RateLimiter, ACCOUNT_POSTS_PER_HOUR, RATE_WINDOW, format_rates
+from naver_schedule import ScheduleStore, PublishScheduler
+from naver_store import AccountStore, POST_PUBLISHED
+from naver_dedup import DuplicateIndex, describe_duplicate
+from naver_keywords import KeywordScanner, summarize_matches, has_blocked
+from naver_drafts import DraftLibrary, split_draft, read_draft
+
+# 기본 블로그 ID
+DEFAULT_BLOG_ID = "rxd0119"
+
+# 예약 발행으로 띄운 브라우저는 다음 예약까지 이 시간보다 많이 남으면 닫음 (초)
+IDLE_CLOSE_AFTER = 1800
+
+# 대기열 목록에 표시할 최대 예약 작업 수
+SCHEDULE_LIST_LIMIT = 50
+
+class ScheduleSignals(QObject):
+    """예약 스레드에서 GUI 스레드로 예약 작업을 넘기는 신호"""
+    due = pyqtSignal(object)
+    prewarm = pyqtSignal(object)
 
 class NaverLoginThread(QThread):
     update_signal = pyqtSignal(str)
     finished_signal = pyqtSignal(bool, str)
     
-    def __init__(self, username, password, save_credentials=False):
+    def __init__(self, username, password, save_credentials=False,
+                 page_load_strategy=DEFAULT_PAGE_LOAD_STRATEGY, display_mode=DEFAULT_DISPLAY_MODE):
         super().__init__()
         self.username = username
         self.password = password
         self.save_credentials = save_credentials
+        self.page_load_strategy = page_load_strategy
+        self.display_mode = display_mode  # 브라우저 표시 방식
         self.driver = None
         
     def run(self):
@@ -36,19 +73,23 @@ class NaverLoginThread(QThread):
             
             # 크롬 옵션 설정
             chrome_options = Options()
-            chrome_options.add_argument("--start-maximized")
+            apply_display_mode(chrome_options, self.display_mode)  # 화면 표시/헤드리스/가상 디스플레이
             chrome_options.add_argument("--disable-notifications")
             chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
             chrome_options.add_experimental_option('useAutomationExtension', False)
+            apply_page_load_strategy(chrome_options, self.page_load_strategy)
+            for argument in BACKGROUND_TAB_ARGUMENTS:
+                chrome_options.add_argument(argument)
+            enable_network_log(chrome_options)  # 발행 요청 응답 확인용
             
             # 크롬 드라이버 설치 및 시작
             service = Service(ChromeDriverManager().install())
             self.driver = webdriver.Chrome(service=service, options=chrome_options)
+            prepare_driver(self.driver, self.display_mode)
             
             # 네이버 로그인 페이지 열기
             self.update_signal.emit("네이버 로그인 페이지로 이동 중...")
-            self.driver.get("https://nid.naver.com/nidlogin.login")
-            time.sleep(2)
+            navigate(self.driver, "https://nid.naver.com/nidlogin.login", "login")
             
             # 자바스크립트를 통한 로그인 (봇 감지 우회)
             self.update_signal.emit("로그인 중...")
@@ -74,6 +115,9 @@ class NaverLoginThread(QThread):
             
             # 자동입력 방지 문자가 나타났는지 확인
             if "자동입력 방지" in self.driver.page_source or "보안 문자" in self.driver.page_source:
+                if not has_screen(self.display_mode):
+                    # 화면이 없으면 직접 입력할 수 없으므로 기다리지 않음
+                    raise Exception("보안 문자 인증이 필요합니다. 화면 표시 방식으로 다시 로그인해주세요.")
                 self.update_signal.emit("보안 문자 인증이 필요합니다. 직접 입력해주세요.")
                 
                 # 사용자가 보안 문자를 입력할 시간을 줌
@@ -94,8 +138,7 @@ class NaverLoginThread(QThread):
                     self.save_credentials_to_file()
                 
                 # 블로그로 이동
-                self.driver.get("https://blog.naver.com/rxd0119")
-                time.sleep(3)
+                navigate(self.driver, f"https://blog.naver.com/{DEFAULT_BLOG_ID}", "blog_home")
                 
                 # 성공 신호 전송
                 self.finished_signal.emit(True, "로그인 및 블로그 접속 성공")
@@ -135,42 +178,62 @@ class BlogPostThread(QThread):
     update_signal = pyqtSignal(str)
     finished_signal = pyqtSignal(bool, str)
     
-    def __init__(self, driver, title, content, category=None):
+    def __init__(self, driver, title, content, category=None, blog_id=DEFAULT_BLOG_ID,
+                 write_router=None, prefetcher=None, blocks=None, images=None, journal=None, job_id=None):
         super().__init__()
         self.driver = driver
         self.title = title
         self.content = content
         self.category = category
+        self.blog_id = blog_id
+        self.write_router = write_router or WriteRouteRouter()
+        self.prefetcher = prefetcher  # 설정 시 입력 중 다음 글쓰기 페이지를 미리 열어둠
+        self.blocks = blocks  # 설정 시 본문을 서식 블록 단위로 붙여넣음
+        self.images = images  # 본문 뒤에 업로드할 이미지 변환 작업 (ImageBatch)
+        self.journal = journal  # 설정 시 단계마다 작업 상태를 먼저 기록
+        self.job_id = job_id
+        self.post_url = None  # 발행된 글 주소
+    
+    def mark(self, state, **fields):
+        """작업 상태 기록 (대기열 작업일 때만)"""
+        if self.journal and self.job_id:
+            self.journal.append(self.job_id, state, **fields)
+    
+    def fail(self, message):
+        """작업 실패 처리 (발행 버튼을 누른 뒤라면 발행 여부를 확인할 수 있도록 상태 유지)"""
+        if self.journal and self.journal.state(self.job_id) not in AMBIGUOUS_STATES:
+            self.mark(STATE_FAILED, error=message)
+        self.finished_signal.emit(False, message)
     
     def run(self):
         try:
             if not self.driver:
                 self.update_signal.emit("브라우저가 실행되지 않았습니다. 먼저 로그인해주세요.")
-                self.finished_signal.emit(False, "브라우저 오류")
+                self.fail("브라우저 오류")
                 return
-                
-            self.update_signal.emit("글쓰기 페이지로 이동 중...")
-            
-            # 네이버 블로그 글쓰기 페이지로 이동
-            self.driver.get("https://blog.naver.com/rxd0119")
-            time.sleep(3)
             
-            # 글쓰기 버튼 클릭
-            try:
-                # 먼저 헤더에서 글쓰기 버튼 찾기
-                write_button = WebDriverWait(self.driver, 10).until(
-                    EC.element_to_be_clickable((By.CSS_SELECTOR, ".btn_write, .link_write"))
-                )
-                write_button.click()
-                self.update_signal.emit("글쓰기 버튼 클릭 완료")
-            except Exception as e:
-                self.update_signal.emit(f"글쓰기 버튼을 찾을 수 없습니다: {str(e)}")
+            # 발행 버튼을 누른 뒤 중단됐던 작업은 실제로 발행됐는지부터 확인 (중복 발행 방지)
+            if self.journal and self.journal.state(self.job_id) in AMBIGUOUS_STATES:
+                self.update_signal.emit("발행 여부가 확인되지 않은 글입니다. 블로그에서 확인 중...")
+                find_post = partial(find_post_by_title, self.driver)
+                if resolve_ambiguous_job(self.journal, self.job_id, find_post, self.update_signal.emit):
+                    self.finished_signal.emit(True, "이미 발행된 글입니다.")
+                    return
                 
-                # 대체 방법: 직접 글쓰기 URL로 이동
-                self.driver.get("https://blog.naver.com/PostWrite.naver?blogId=rxd0119")
-                self.update_signal.emit("글쓰기 페이지로 직접 이동합니다.")
+            self.update_signal.emit("글쓰기 페이지로 이동 중...")
             
-            time.sleep(5)  # 글쓰기 페이지 로딩 대기
+            # 이전 글 입력 중 미리 열어둔 글쓰기 탭이 있으면 바로 전환
+            if self.prefetcher and self.prefetcher.activate(self.driver, self.blog_id):
+                route = "prefetched"
+                self.update_signal.emit("미리 열어둔 글쓰기 페이지로 전환했습니다.")
+            else:
+                # 네이버 블로그 글쓰기 페이지로 이동 (성공했던 경로 우선, 블로그 홈은 필요할 때만 경유)
+                route = self.write_router.open_write_page(self.driver, self.blog_id, self.update_signal.emit)
+            if not route:
+                self.update_signal.emit("글쓰기 페이지로 이동하지 못했습니다.")
+                self.fail("글쓰기 페이지 이동 실패")
+                return
+            self.mark(STATE_EDITOR_OPEN)
             
             # iframe 전환 (에디터는 iframe 내부에 있음)
             try:
@@ -220,6 +283,13 @@ class BlogPostThread(QThread):
                 except Exception as e2:
                     self.update_signal.emit(f"제목 입력 실패: {str(e2)}")
             
+            # 본문을 입력하고 발행하는 동안 다음 글쓰기 페이지를 백그라운드 탭에 미리 열기
+            if self.prefetcher:
+                try:
+                    self.prefetcher.prefetch(self.driver, self.blog_id)
+                except Exception as e:
+                    self.update_signal.emit(f"다음 글쓰기 페이지 미리 열기 실패: {str(e)}")
+            
             # 본문 입력 (iframe 내부)
             try:
                 # 먼저 본문 영역 클릭
@@ -229,26 +299,44 @@ class BlogPostThread(QThread):
                 content_field.click()
                 time.sleep(1)
                 
-                # 내용 입력 (여러 방식 시도)
-                try:
-                    # 1. 직접 send_keys
-                    content_field.send_keys(self.content)
-                except Exception:
+                # 서식 블록은 블록마다 한 번의 서식 붙여넣기로 입력
+                if self.blocks:
+                    inserter = SmartEditorBlockInserter(self.driver)
+                    for block in self.blocks:
+                        inserter.insert(content_field, block)
+                        time.sleep(0.3)
+                    self.update_signal.emit(f"서식 블록 {len(self.blocks)}개 입력 완료")
+                else:
+                    # 내용 입력 (여러 방식 시도)
                     try:
-                        # 2. JavaScript 사용
-                        self.driver.execute_script("arguments[0].textContent = arguments[1]", content_field, self.content)
+                        # 1. 직접 send_keys
+                        content_field.send_keys(self.content)
                     except Exception:
-                        # 3. ActionChains 사용
-                        actions = ActionChains(self.driver)
-                        actions.move_to_element(content_field)
-                        actions.click()
-                        actions.send_keys(self.content)
-                        actions.perform()
+                        try:
+                            # 2. JavaScript 사용
+                            self.driver.execute_script("arguments[0].textContent = arguments[1]", content_field, self.content)
+                        except Exception:
+                            # 3. ActionChains 사용
+                            actions = ActionChains(self.driver)
+                            actions.move_to_element(content_field)
+                            actions.click()
+                            actions.send_keys(self.content)
+                            actions.perform()
                 
                 self.update_signal.emit("본문 입력 완료")
             except Exception as e:
                 self.update_signal.emit(f"본문 입력 실패: {str(e)}")
             
+            # 이미지 업로드 (변환은 별도 프로세스에서 미리 진행됨)
+            if self.images:
+                try:
+                    paths = self.images.result()
+                    added = EditorImageUploader(self.driver, self.update_signal.emit).upload(paths)
+                    self.update_signal.emit(f"이미지 {added}/{len(paths)}개 업로드 완료")
+                except Exception as e:
+                    self.update_signal.emit(f"이미지 업로드 실패: {str(e)}")
+            self.mark(STATE_TYPED)
+            
             # 발행 버튼 찾기 (iframe 밖으로 나가야 함)
             self.driver.switch_to.default_content()
             time.sleep(1)
@@ -258,6 +346,20 @@ class BlogPostThread(QThread):
                 publish_button = WebDriverWait(self.driver, 10).until(
                     EC.element_to_be_clickable((By.CSS_SELECTOR, ".btn_publish, .publish_btn, button[contains(text(), '발행')]"))
                 )
+                # 누르기 전의 가장 최근 글 번호 (중단 후 발행 여부를 확인할 때 이 뒤에 올라온 글만 인정)
+                last_log_no = None
+                if self.journal and self.job_id:
+                    try:
+                        last_log_no = latest_log_no(self.driver, self.blog_id)
+                    except Exception as e:
+                        self.update_signal.emit(f"최근 글 번호 확인 실패: {e}")
+                
+                # 발행 요청 응답을 놓치지 않도록 누르기 전에 감시 시작
+                confirmer = PublishConfirmer(self.driver, self.blog_id)
+                confirmer.start()
+                
+                # 누르기 전에 먼저 기록 (기록 후 중단되면 다음 실행에서 발행 여부를 확인)
+                self.mark(STATE_PUBLISH_CLICKED, last_log_no=last_log_no)
                 publish_button.click()
                 self.update_signal.emit("발행 버튼 클릭 완료")
                 
@@ -272,17 +374,28 @@ class BlogPostThread(QThread):
                     # 확인 버튼이 없을 수도 있음
                     pass
                 
-                # 발행 완료 대기
-                time.sleep(5)
-                self.finished_signal.emit(True, "글 발행이 완료되었습니다.")
+                # 발행 결과 확인 (발행 요청 응답, 글 주소로 이동, 오류 안내 중 먼저 오는 신호)
+                status, detail = confirmer.wait()
+                if status == PUBLISHED:
+                    self.post_url = detail
+                    self.mark(STATE_CONFIRMED, post_url=detail)
+                    self.update_signal.emit(f"발행된 글 주소: {detail}")
+                    self.finished_signal.emit(True, "글 발행이 완료되었습니다.")
+                elif status == REJECTED:
+                    # 발행되지 않은 것이 확실하므로 실패로 기록
+                    self.mark(STATE_FAILED, error=detail)
+                    self.update_signal.emit(f"발행이 거부되었습니다: {detail}")
+                    self.finished_signal.emit(False, f"글 발행 실패: {detail}")
+                else:
+                    self.fail(f"글 발행 실패: {detail}")
             except Exception as e:
                 self.update_signal.emit(f"발행 버튼 클릭 실패: {str(e)}")
-                self.finished_signal.emit(False, f"글 발행 실패: {str(e)}")
+                self.fail(f"글 발행 실패: {str(e)}")
                 
         except Exception as e:
             error_msg = f"글쓰기 오류 발생: {str(e)}"
             self.update_signal.emit(error_msg)
-            self.finished_signal.emit(False, error_msg)
+            self.fail(error_msg)
 
 class NaverBlogApp(QMainWindow):
     def __init__(self):
@@ -290,8 +403,39 @@ class NaverBlogApp(QMainWindow):
         self.login_thread = None
         self.post_thread = None
         self.driver = None
+        self.write_router = WriteRouteRouter()
+        self.prefetcher = WritePagePrefetcher(self.write_router)
+        self.image_pipeline = ImagePipeline()
+        self.image_batch = None
+        self.journal = PostJournal()  # 발행 대기열 작업 기록
+        # 정리하기 전에 최근 발행 기록을 남겨 두었다가 로그인하면 발행 속도 제한에 반영
+        self.recent_posts = self.journal.confirmed_posts(time.time() - RATE_WINDOW)
+        self.journal.compact()
+        self.queue_running = False
+        self.queue_attempted = set()  # 이번 대기열 실행에서 시도한 작업
+        self.account = None  # 로그인한 계정
+        self.account_store = AccountStore()  # 발행한 글 기록
+        self.duplicate_index = DuplicateIndex()  # 블로그별로 발행한 글 (같은 글 다시 발행 방지)
+        self.keyword_scanner = KeywordScanner()  # 발행 전 금지어 검사
+        self.draft_library = DraftLibrary()  # 초안 폴더 전문 검색
+        threading.Thread(target=self.draft_library.sync, daemon=True).start()  # 바뀐 초안만 다시 색인
+        self.rate_limiter = RateLimiter()  # 계정/블로그별 발행 속도 제한
+        self.queue_timer = QTimer(self)  # 발행 속도 제한으로 기다렸다가 다음 작업 진행
+        self.queue_timer.setSingleShot(True)
+        self.queue_timer.timeout.connect(self.run_next_job)
+        self.rate_timer = QTimer(self)  # 실제 발행 속도 표시 갱신
+        self.rate_timer.timeout.connect(self.refresh_rate_label)
+        self.rate_timer.start(10000)
+        self.auto_login = False  # 예약 발행을 위해 자동으로 로그인 중
+        self.scheduled_browser = False  # 예약 발행을 위해 띄운 브라우저 (한가하면 닫음)
+        self.schedule_signals = ScheduleSignals()
+        self.schedule_signals.due.connect(self.on_schedule_due)
+        self.schedule_signals.prewarm.connect(self.on_schedule_prewarm)
+        self.scheduler = PublishScheduler(ScheduleStore(), self.schedule_signals.due.emit,
+                                          self.schedule_signals.prewarm.emit)
         self.initUI()
         self.load_credentials()
+        self.scheduler.start()
         
     def initUI(self):
         self.setWindowTitle("네이버 블로그 자동화")
@@ -327,6 +471,20 @@ class NaverBlogApp(QMainWindow):
         self.save_credentials_checkbox = QCheckBox("로그인 정보 저장")
         login_form.addRow("", self.save_credentials_checkbox)
         
+        # 페이지 로딩 전략 선택
+        self.page_load_combo = QComboBox()
+        for strategy, description in PAGE_LOAD_STRATEGIES.items():
+            self.page_load_combo.addItem(description, strategy)
+        self.page_load_combo.setCurrentIndex(self.page_load_combo.findData(DEFAULT_PAGE_LOAD_STRATEGY))
+        login_form.addRow("페이지 로딩:", self.page_load_combo)
+        
+        # 브라우저 표시 방식 선택
+        self.display_mode_combo = QComboBox()
+        for mode, description in DISPLAY_MODES.items():
+            self.display_mode_combo.addItem(description, mode)
+        self.display_mode_combo.setCurrentIndex(self.display_mode_combo.findData(DEFAULT_DISPLAY_MODE))
+        login_form.addRow("브라우저 표시:", self.display_mode_combo)
+        
         login_group.setLayout(login_form)
         login_layout.addWidget(login_group)
         
@@ -373,6 +531,20 @@ class NaverBlogApp(QMainWindow):
         self.content_editor = QTextEdit()
         post_form.addRow("내용:", self.content_editor)
         
+        # 다음 글쓰기 페이지 미리 열기
+        self.prefetch_checkbox = QCheckBox("입력 중 다음 글쓰기 페이지 미리 열기")
+        self.prefetch_checkbox.toggled.connect(self.on_prefetch_toggled)
+        post_form.addRow("", self.prefetch_checkbox)
+        
+        # Markdown/서식 블록 입력
+        self.format_blocks_checkbox = QCheckBox("Markdown/서식을 에디터 블록으로 입력")
+        post_form.addRow("", self.format_blocks_checkbox)
+        
+        # 이미지 추가 (선택 즉시 변환 시작)
+        self.image_button = QPushButton("이미지 추가")
+        self.image_button.clicked.connect(self.toggle_images)
+        post_form.addRow("이미지:", self.image_button)
+        
         post_group.setLayout(post_form)
         post_layout.addWidget(post_group)
         
@@ -392,6 +564,60 @@ class NaverBlogApp(QMainWindow):
         
         post_layout.addLayout(post_button_layout)
         
+        # 발행 대기열 (작업 상태는 파일에 먼저 기록되어 재시작해도 이어서 발행)
+        queue_group = QGroupBox("발행 대기열")
+        queue_layout = QVBoxLayout()
+        self.job_list = QListWidget()
+        queue_layout.addWidget(self.job_list)
+        
+        queue_button_layout = QHBoxLayout()
+        self.queue_button = QPushButton("대기열에 추가")
+        self.queue_button.clicked.connect(self.add_to_queue)
+        queue_button_layout.addWidget(self.queue_button)
+        
+        self.find_draft_button = QPushButton("초안 찾기")
+        self.find_draft_button.clicked.connect(self.open_draft_library)
+        queue_button_layout.addWidget(self.find_draft_button)
+        
+        self.run_queue_button = QPushButton("대기열 발행")
+        self.run_queue_button.clicked.connect(self.start_queue)
+        self.run_queue_button.setEnabled(False)  # 로그인 전에는 비활성화
+        queue_button_layout.addWidget(self.run_queue_button)
+        queue_layout.addLayout(queue_button_layout)
+        
+        # 예약 발행 (예약은 파일에 저장되어 재시작해도 유지, 발행 직전에 브라우저를 준비)
+        schedule_layout = QHBoxLayout()
+        self.schedule_input = QDateTimeEdit(QDateTime.currentDateTime().addSecs(3600))
+        self.schedule_input.setDisplayFormat("yyyy-MM-dd HH:mm")
+        self.schedule_input.setCalendarPopup(True)
+        schedule_layout.addWidget(self.schedule_input)
+        
+        self.schedule_button = QPushButton("예약 발행")
+        self.schedule_button.clicked.connect(self.add_to_schedule)
+        schedule_layout.addWidget(self.schedule_button)
+        
+        self.cancel_schedule_button = QPushButton("예약 취소")
+        self.cancel_schedule_button.clicked.connect(self.cancel_schedule)
+        schedule_layout.addWidget(self.cancel_schedule_button)
+        queue_layout.addLayout(schedule_layout)
+        
+        # 발행 속도 제한 (계정별 시간당 발행 수, 발행 사이 간격은 무작위로 흔듦)
+        rate_layout = QHBoxLayout()
+        rate_layout.addWidget(QLabel("시간당 발행 수:"))
+        self.rate_input = QSpinBox()
+        self.rate_input.setRange(1, 60)
+        self.rate_input.setSuffix("개")
+        self.rate_input.setValue(ACCOUNT_POSTS_PER_HOUR)
+        self.rate_input.valueChanged.connect(self.on_rate_changed)
+        rate_layout.addWidget(self.rate_input)
+        self.rate_label = QLabel(format_rates([]))
+        rate_layout.addWidget(self.rate_label, 1)
+        queue_layout.addLayout(rate_layout)
+        
+        queue_group.setLayout(queue_layout)
+        post_layout.addWidget(queue_group)
+        self.refresh_job_list()
+        
         # 글쓰기 진행 상태 표시줄
         self.post_progress_bar = QProgressBar()
         self.post_progress_bar.setRange(0, 0)
@@ -437,7 +663,9 @@ class NaverBlogApp(QMainWindow):
         self.login_thread = NaverLoginThread(
             username, 
             password,
-            self.save_credentials_checkbox.isChecked()
+            self.save_credentials_checkbox.isChecked(),
+            self.page_load_combo.currentData(),
+            self.display_mode_combo.currentData()
         )
         self.login_thread.update_signal.connect(self.update_login_status)
         self.login_thread.finished_signal.connect(self.login_finished)
@@ -456,6 +684,14 @@ class NaverBlogApp(QMainWindow):
             self.login_status_label.setText(message)
             self.statusBar().showMessage(message)
             self.driver = self.login_thread.driver
+            self.scheduled_browser = self.auto_login
+            auto_login = self.auto_login
+            self.auto_login = False
+            if self.account != self.login_thread.username:
+                # 이전 실행 기록은 이 앱으로 발행한 계정의 것으로 보고 반영
+                self.account = self.login_thread.username
+                self.rate_limiter.restore(self.account, self.recent_posts)
+                self.refresh_rate_label()
             
             # 로그인 성공 시 버튼 텍스트 변경
             self.login_button.setText("다시 로그인")
@@ -464,11 +700,25 @@ class NaverBlogApp(QMainWindow):
             # 글쓰기 탭 활성화
             self.tab_widget.setTabEnabled(1, True)
             self.post_button.setEnabled(True)
+            self.run_queue_button.setEnabled(True)
             self.post_status_label.setText("블로그에 글을 작성할 수 있습니다.")
             
             # 글쓰기 탭으로 전환
             self.tab_widget.setCurrentIndex(1)
+            
+            # 이전 실행에서 끝나지 않은 작업이 있으면 이어서 발행
+            pending = self.journal.pending_jobs()
+            if pending and not self.queue_running and auto_login:
+                self.start_queue(unattended=True)  # 예약 발행 중에는 묻지 않고 바로 발행
+            elif pending and not self.queue_running:
+                reply = QMessageBox.question(
+                    self, "발행 대기열",
+                    f"이전 실행에서 끝나지 않은 글 {len(pending)}개가 있습니다. 이어서 발행할까요?",
+                    QMessageBox.Yes | QMessageBox.No, QMessageBox.Yes)
+                if reply == QMessageBox.Yes:
+                    self.start_queue()
         else:
+            self.auto_login = False
             self.login_status_label.setText(message)
             self.statusBar().showMessage(message)
             QMessageBox.warning(self, "로그인 오류", message)
@@ -495,6 +745,22 @@ class NaverBlogApp(QMainWindow):
             QMessageBox.warning(self, "입력 오류", "내용을 입력해주세요.")
             return
         
+        if not self.confirm_keywords(title, content):
+            return
+        if not self.confirm_not_duplicate(DEFAULT_BLOG_ID, content):
+            return
+        
+        # 바로 발행해도 대기열과 같은 발행 속도 제한에 포함 (제한에 걸리면 그래도 발행할지 확인)
+        wait = self.rate_limiter.wait_time(self.account, DEFAULT_BLOG_ID)
+        if wait > 0:
+            reply = QMessageBox.question(
+                self, "발행 속도 제한",
+                f"발행 속도 제한으로 {int(wait // 60)}분 {int(wait % 60)}초 뒤에 발행하는 것이 좋습니다.\n"
+                "너무 자주 발행하면 스팸으로 분류될 수 있습니다. 그래도 지금 발행할까요?",
+                QMessageBox.Yes | QMessageBox.No, QMessageBox.No)
+            if reply != QMessageBox.Yes:
+                return
+        
         # UI 업데이트
         self.post_button.setEnabled(False)
         self.post_progress_bar.setVisible(True)
@@ -505,12 +771,364 @@ class NaverBlogApp(QMainWindow):
             self.driver,
             title,
             content,
-            category
+            category,
+            write_router=self.write_router,
+            prefetcher=self.prefetcher if self.prefetch_checkbox.isChecked() else None,
+            blocks=parse_rich_text(self.content_editor.toHtml()) if self.format_blocks_checkbox.isChecked() else None,
+            images=self.image_batch
         )
         self.post_thread.update_signal.connect(self.update_post_status)
         self.post_thread.finished_signal.connect(self.post_finished)
         self.post_thread.start()
     
+    def queued_post(self):
+        """대기열/예약에 넣을 글 (제목, 내용, 카테고리, 서식 블록 여부), 입력이 없으면 None"""
+        title = self.title_input.text().strip()
+        format_blocks = self.format_blocks_checkbox.isChecked()
+        # 서식 블록 입력은 서식이 유지되도록 HTML로 저장
+        content = self.content_editor.toHtml() if format_blocks else self.content_editor.toPlainText().strip()
+        category = self.category_combo.currentText()
+        if category == "카테고리 없음":
+            category = None
+        
+        if not title:
+            QMessageBox.warning(self, "입력 오류", "제목을 입력해주세요.")
+            return None
+        if not self.content_editor.toPlainText().strip():
+            QMessageBox.warning(self, "입력 오류", "내용을 입력해주세요.")
+            return None
+        if not self.confirm_keywords(title, self.content_editor.toPlainText()):
+            return None
+        return title, content, category, format_blocks
+    
+    def confirm_keywords(self, title, content):
+        """발행 전 금지어 검사 (금지어/주의어가 있으면 그래도 진행할지 확인)"""
+        self.keyword_scanner.reload_if_changed()
+        matches = self.keyword_scanner.scan_post(title, content)
+        if not matches:
+            return True
+        reply = QMessageBox.question(
+            self, "금지어 검사",
+            f"{summarize_matches(matches)}\n이런 표현이 있으면 발행 후 글이 숨겨질 수 있습니다. 그래도 진행할까요?",
+            QMessageBox.Yes | QMessageBox.No, QMessageBox.No if has_blocked(matches) else QMessageBox.Yes)
+        return reply == QMessageBox.Yes
+    
+    def confirm_not_duplicate(self, blog_id, content):
+        """이 블로그에 이미 발행한 글과 같거나 거의 같으면 그래도 진행할지 확인"""
+        duplicate = self.duplicate_index.check(blog_id, content)
+        if duplicate is None:
+            return True
+        reply = QMessageBox.question(
+            self, "중복 글",
+            f"{describe_duplicate(duplicate)}\n같은 글을 다시 올리면 스팸으로 분류될 수 있습니다. 그래도 진행할까요?",
+            QMessageBox.Yes | QMessageBox.No, QMessageBox.No)
+        return reply == QMessageBox.Yes
+    
+    def add_to_queue(self):
+        """작성한 글을 발행 대기열에 추가"""
+        post = self.queued_post()
+        if not post:
+            return
+        
+        title, content, category, format_blocks = post
+        if not self.confirm_not_duplicate(DEFAULT_BLOG_ID, content):
+            return
+        self.journal.enqueue(DEFAULT_BLOG_ID, title, content, category, format_blocks)
+        self.title_input.clear()
+        self.content_editor.clear()
+        self.refresh_job_list()
+        self.post_status_label.setText(f"대기열에 추가했습니다: {title}")
+    
+    def open_draft_library(self):
+        """초안 찾기 (입력하는 대로 제목/본문 검색, 선택한 초안을 불러오거나 바로 대기열에 추가)"""
+        threading.Thread(target=self.draft_library.sync, daemon=True).start()  # 밖에서 바꾼 초안 반영
+        
+        dialog = QDialog(self)
+        dialog.setWindowTitle("초안 찾기")
+        dialog.resize(600, 450)
+        layout = QVBoxLayout(dialog)
+        
+        search_input = QLineEdit()
+        search_input.setPlaceholderText("제목이나 본문으로 검색 (여러 단어는 모두 포함된 초안)")
+        layout.addWidget(search_input)
+        
+        result_list = QListWidget()
+        result_list.itemDoubleClicked.connect(lambda: dialog.done(1))
+        layout.addWidget(result_list, 1)
+        
+        button_layout = QHBoxLayout()
+        load_button = QPushButton("불러오기")
+        load_button.clicked.connect(lambda: dialog.done(1))
+        button_layout.addWidget(load_button)
+        queue_button = QPushButton("대기열에 추가")
+        queue_button.clicked.connect(lambda: dialog.done(2))
+        button_layout.addWidget(queue_button)
+        cancel_button = QPushButton("취소")
+        cancel_button.clicked.connect(dialog.reject)
+        button_layout.addWidget(cancel_button)
+        layout.addLayout(button_layout)
+        
+        def search():
+            result_list.clear()
+            for draft in self.draft_library.search(search_input.text()):
+                when = time.strftime("%Y-%m-%d %H:%M", time.localtime(draft.mtime))
+                item = QListWidgetItem(f"{draft.title}  ({when})" + (f"\n{draft.snippet}" if draft.snippet else ""))
+                item.setData(Qt.UserRole, draft.path)
+                result_list.addItem(item)
+            if result_list.count():
+                result_list.setCurrentRow(0)
+        
+        # 입력이 잠시 멈추면 검색
+        search_timer = QTimer(dialog)
+        search_timer.setSingleShot(True)
+        search_timer.timeout.connect(search)
+        search_input.textChanged.connect(lambda: search_timer.start(150))
+        search()
+        
+        result = dialog.exec_()
+        if result not in (1, 2) or not result_list.currentItem():
+            return
+        path = result_list.currentItem().data(Qt.UserRole)
+        try:
+            title, content = split_draft(read_draft(path))
+        except OSError as e:
+            QMessageBox.warning(self, "파일 오류", f"초안을 열 수 없습니다.\n{e}")
+            return
+        
+        if result == 1:
+            self.title_input.setText(title)
+            self.content_editor.setPlainText(content)
+            return
+        if not title or not content:
+            QMessageBox.warning(self, "입력 오류", "초안의 첫 줄(제목)과 본문이 모두 있어야 합니다.")
+            return
+        if not self.confirm_keywords(title, content) or not self.confirm_not_duplicate(DEFAULT_BLOG_ID, content):
+            return
+        self.journal.enqueue(DEFAULT_BLOG_ID, title, content)
+        self.refresh_job_list()
+        self.post_status_label.setText(f"대기열에 추가했습니다: {title}")
+    
+    def add_to_schedule(self):
+        """작성한 글을 선택한 시각에 발행하도록 예약"""
+        due_at = self.schedule_input.dateTime().toSecsSinceEpoch()
+        if due_at <= time.time():
+            QMessageBox.warning(self, "입력 오류", "예약 시각은 현재 시각 이후여야 합니다.")
+            return
+        post = self.queued_post()
+        if not post:
+            return
+        
+        title, content, category, format_blocks = post
+        if not self.confirm_not_duplicate(DEFAULT_BLOG_ID, content):
+            return
+        self.scheduler.add(due_at, DEFAULT_BLOG_ID, title, content, category, format_blocks,
+                           account=self.username_input.text().strip() or None)
+        self.title_input.clear()
+        self.content_editor.clear()
+        self.refresh_job_list()
+        self.post_status_label.setText(
+            f"{self.schedule_input.dateTime().toString('yyyy-MM-dd HH:mm')}에 발행하도록 예약했습니다: {title}")
+    
+    def cancel_schedule(self):
+        """선택한 예약 작업 취소"""
+        item = self.job_list.currentItem()
+        schedule_id = item.data(Qt.UserRole) if item else None
+        if schedule_id is None:
+            QMessageBox.warning(self, "예약 취소", "취소할 예약 작업을 선택해주세요.")
+            return
+        self.scheduler.cancel(schedule_id)
+        self.refresh_job_list()
+        self.post_status_label.setText("예약을 취소했습니다.")
+    
+    def refresh_job_list(self):
+        """대기열 목록 갱신 (대기열 작업 다음에 가까운 예약 작업 표시)"""
+        self.job_list.clear()
+        for job_id, job in self.journal.pending_jobs():
+            state = JOB_STATES.get(job.get("state"), job.get("state"))
+            self.job_list.addItem(f"[{state}] {job.get('title', '')}")
+        for job in self.scheduler.store.upcoming(SCHEDULE_LIST_LIMIT):
+            due = time.strftime("%m-%d %H:%M", time.localtime(job["due_at"]))
+            item = QListWidgetItem(f"[예약 {due}] {job['title']}")
+            item.setData(Qt.UserRole, job["id"])  # 예약 취소에 사용
+            self.job_list.addItem(item)
+    
+    def start_queue(self, unattended=False):
+        """대기열의 글을 순서대로 발행
+        
+        unattended: 예약 발행처럼 사람이 없는 실행이면 묻지 않고 금지어가 있는 글은 건너뜀
+        (대기열에 남겨 두었다가 직접 발행할 때 다시 확인)
+        """
+        if not self.driver:
+            QMessageBox.warning(self, "오류", "먼저 로그인해주세요.")
+            return
+        if self.queue_running:
+            return
+        
+        # 발행 전에 대기열 전체를 금지어 검사 (금지어가 있는 글은 건너뛸지 확인)
+        self.keyword_scanner.reload_if_changed()
+        blocked = []
+        for job_id, job in self.journal.pending_jobs():
+            matches = self.keyword_scanner.scan_post(job.get("title", ""), job.get("content", ""))
+            if has_blocked(matches):
+                blocked.append((job_id, f"{job.get('title', '')} ({summarize_matches(matches)})"))
+        skipped = set()
+        if blocked and unattended:
+            skipped = {job_id for job_id, _ in blocked}
+            self.update_post_status("금지어가 있어 이번 예약 발행에서 건너뛴 글: " + ", ".join(line for _, line in blocked))
+        elif blocked:
+            reply = QMessageBox.question(
+                self, "금지어 검사",
+                "금지어가 있는 글이 있습니다.\n" + "\n".join(line for _, line in blocked) + "\n이 글은 건너뛸까요?",
+                QMessageBox.Yes | QMessageBox.No | QMessageBox.Cancel, QMessageBox.Yes)
+            if reply == QMessageBox.Cancel:
+                return
+            if reply == QMessageBox.Yes:
+                skipped = {job_id for job_id, _ in blocked}
+        
+        self.queue_running = True
+        self.queue_attempted = skipped  # 건너뛴 글은 대기열에 남겨 두고 이번 실행에서만 제외
+        self.post_button.setEnabled(False)
+        self.run_queue_button.setEnabled(False)
+        self.post_progress_bar.setVisible(True)
+        self.run_next_job()
+    
+    def run_next_job(self):
+        """대기열의 다음 작업 발행 (이번 실행에서 이미 시도한 작업은 건너뜀)"""
+        pending = [(job_id, job) for job_id, job in self.journal.pending_jobs()
+                   if job_id not in self.queue_attempted]
+        if not pending:
+            self.queue_running = False
+            self.post_button.setEnabled(True)
+            self.run_queue_button.setEnabled(True)
+            self.post_progress_bar.setVisible(False)
+            self.refresh_job_list()
+            self.update_post_status("대기열 발행이 끝났습니다.")
+            self.release_idle_browser()
+            return
+        
+        # 발행 속도 제한에 걸리지 않는 첫 작업 선택 (블로그별 제한이 있으면 다른 블로그 작업이 먼저 진행될 수 있음)
+        candidates = [(self.account, job.get("blog_id") or DEFAULT_BLOG_ID) for _, job in pending]
+        index, wait = self.rate_limiter.choose(candidates)
+        if index is None:
+            self.update_post_status(f"발행 속도 제한으로 {wait:.0f}초 뒤에 다음 글을 발행합니다.")
+            self.queue_timer.start(int(wait * 1000) + 500)
+            return
+        
+        job_id, job = pending[index]
+        self.queue_attempted.add(job_id)
+        
+        # 대기열에 넣은 뒤 같은 글이 발행됐으면 (같은 글을 두 번 넣은 경우 등) 발행하지 않음
+        blog_id = job.get("blog_id") or DEFAULT_BLOG_ID
+        duplicate = self.duplicate_index.check(blog_id, job["content"])
+        if (duplicate and duplicate.kind == "exact" and job.get("state") == STATE_QUEUED
+                and duplicate.created_at > job.get("queued_at", 0)):
+            self.journal.append(job_id, STATE_FAILED, error="이미 발행된 글과 본문이 같습니다")
+            self.update_post_status(f"'{job['title']}' 글은 {describe_duplicate(duplicate)} 건너뜁니다.")
+            QTimer.singleShot(0, self.run_next_job)
+            return
+        
+        self.rate_limiter.acquire(*candidates[index])
+        self.refresh_rate_label()
+        blocks = parse_rich_text(job["content"]) if job.get("format_blocks") else None
+        self.post_thread = BlogPostThread(
+            self.driver,
+            job["title"],
+            job["content"],
+            job.get("category"),
+            blog_id=job.get("blog_id") or DEFAULT_BLOG_ID,
+            write_router=self.write_router,
+            prefetcher=self.prefetcher if self.prefetch_checkbox.isChecked() else None,
+            blocks=blocks,
+            journal=self.journal,
+            job_id=job_id
+        )
+        self.post_thread.update_signal.connect(self.update_post_status)
+        self.post_thread.finished_signal.connect(self.on_job_finished)
+        self.post_thread.start()
+    
+    def start_auto_login(self):
+        """예약 발행을 위해 저장된 로그인 정보로 로그인"""
+        if self.login_thread and self.login_thread.isRunning():
+            return
+        if not self.username_input.text().strip() or not self.password_input.text().strip():
+            self.update_post_status("예약 발행을 하려면 로그인 정보를 입력하거나 저장해주세요.")
+            return
+        self.auto_login = True
+        self.start_login()
+    
+    def on_schedule_prewarm(self, job):
+        """발행 시각 직전에 브라우저 준비 (로그인, 글쓰기 페이지 미리 열기)"""
+        if not self.driver:
+            self.update_post_status(f"예약 발행을 준비합니다: {job['title']}")
+            self.start_auto_login()
+            return
+        if self.prefetch_checkbox.isChecked() and not self.queue_running:
+            self.prefetcher.prefetch(self.driver, job["blog_id"])
+    
+    def on_schedule_due(self, job):
+        """예약 시각이 된 작업을 발행 대기열로 넘기고 발행 시작"""
+        # 예약 ID로 작업 ID를 정해 중단 후 다시 넘겨도 대기열에 한 번만 추가
+        job_id = self.journal.enqueue(job["blog_id"], job["title"], job["content"], job["category"],
+                                      bool(job["format_blocks"]), job_id=f"schedule-{job['id']}")
+        self.scheduler.complete(job["id"], job_id)
+        self.refresh_job_list()
+        if not self.driver:
+            self.start_auto_login()  # 로그인이 끝나면 대기열 발행 시작
+        elif not self.queue_running:
+            self.start_queue(unattended=True)
+    
+    def release_idle_browser(self):
+        """예약 발행으로 띄운 브라우저는 다음 예약까지 오래 남았으면 닫음"""
+        if not self.scheduled_browser or not self.driver:
+            return
+        next_due = self.scheduler.next_due_at()
+        if next_due is not None and next_due - time.time() <= IDLE_CLOSE_AFTER:
+            return
+        try:
+            self.driver.quit()
+        except Exception:
+            pass  # 이미 닫힌 브라우저 무시
+        self.driver = None
+        self.scheduled_browser = False
+        self.post_button.setEnabled(False)
+        self.run_queue_button.setEnabled(False)
+        self.login_button.setText("로그인")
+        self.update_post_status("예약 발행을 마치고 브라우저를 닫았습니다. 다음 예약 전에 다시 준비합니다.")
+    
+    def on_rate_changed(self, posts_per_hour):
+        """시간당 발행 수 변경"""
+        self.rate_limiter.set_rates(account_rate=posts_per_hour)
+        self.refresh_rate_label()
+    
+    def refresh_rate_label(self):
+        """실제 발행 속도와 허용 발행 속도 표시"""
+        self.rate_label.setText(format_rates(self.rate_limiter.rates()))
+    
+    def record_published(self, post_thread):
+        """발행한 글을 글 작성 기록에 추가"""
+        if not post_thread or not post_thread.post_url:
+            return
+        try:
+            self.account_store.record_post(self.account, post_thread.blog_id, post_thread.title, POST_PUBLISHED,
+                                           post_thread.post_url, post_thread.category)
+        except Exception as e:
+            print(f"글 작성 기록 실패: {e}")
+        self.duplicate_index.add(post_thread.blog_id, post_thread.content, post_thread.title, post_thread.post_url)
+    
+    def on_job_finished(self, success, message):
+        """대기열 작업 완료 후 다음 작업 진행"""
+        if success:
+            self.record_published(self.post_thread)
+        self.refresh_job_list()
+        self.update_post_status(message)
+        if self.queue_running:
+            self.run_next_job()
+    
+    def on_prefetch_toggled(self, checked):
+        """미리 열기 해제 시 열어둔 탭 정리"""
+        if not checked and self.driver:
+            self.prefetcher.discard(self.driver)
+    
     def update_post_status(self, message):
         """글쓰기 상태 메시지 업데이트"""
         self.post_status_label.setText(message)
@@ -524,6 +1142,13 @@ class NaverBlogApp(QMainWindow):
         if success:
             self.post_status_label.setText(message)
             self.statusBar().showMessage(message)
+            self.record_published(self.post_thread)
+            if self.post_thread and self.post_thread.post_url:
+                # 발행이 확인된 글은 대기열 발행과 같은 토큰과 발행 간격에 반영
+                self.rate_limiter.acquire(self.account, self.post_thread.blog_id)
+                self.refresh_rate_label()
+            if self.post_thread and self.post_thread.post_url:
+                message = f"{message}\n{self.post_thread.post_url}"
             QMessageBox.information(self, "글쓰기 완료", message)
             self.clear_post()  # 내용 초기화
         else:
@@ -531,10 +1156,30 @@ class NaverBlogApp(QMainWindow):
             self.statusBar().showMessage(message)
             QMessageBox.warning(self, "글쓰기 오류", message)
     
+    def toggle_images(self):
+        """이미지 추가 / 해제"""
+        if self.image_batch:
+            self.image_batch = None
+            self.image_button.setText("이미지 추가")
+            return
+        
+        paths, _ = QFileDialog.getOpenFileNames(self, "이미지 선택", "", f"{IMAGE_FILE_FILTER};;모든 파일 (*)")
+        if not paths:
+            return
+        
+        try:
+            self.image_batch = self.image_pipeline.submit(paths)
+        except Exception as e:
+            QMessageBox.warning(self, "이미지 오류", f"이미지를 준비할 수 없습니다.\n{str(e)}")
+            return
+        self.image_button.setText(f"이미지 {len(paths)}장 해제")
+    
     def clear_post(self):
         """글쓰기 내용 초기화"""
         self.title_input.clear()
         self.content_editor.clear()
+        self.image_batch = None
+        self.image_button.setText("이미지 추가")
         self.post_status_label.setText("내용이 초기화되었습니다.")
     
     def closeEvent(self, event):
@@ -542,8 +1187,18 @@ class NaverBlogApp(QMainWindow):
         if self.login_thread and self.login_thread.isRunning():
             self.login_thread.stop()
         
+        self.queue_timer.stop()
+        self.rate_timer.stop()
+        self.scheduler.stop()
+        self.account_store.close()  # 모아 둔 글 작성 기록 저장
+        self.duplicate_index.close()
+        self.draft_library.close()
+        
         if self.driver:
             self.driver.quit()
+        stop_virtual_display()  # 가상 디스플레이를 사용했으면 종료
+        
+        self.image_pipeline.shutdown()
             
         event.accept()
 
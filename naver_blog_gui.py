@@ -4,6 +4,8 @@ import random
 import threading
 import json
 import os
+from collections import deque
+from functools import partial
 import undetected_chromedriver as uc
 from PyQt5.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout, 
                            QHBoxLayout, QLabel, QLineEdit, QPushButton, 
@@ -11,14 +13,39 @@ from PyQt5.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout,
                            QMessageBox, QCheckBox, QSpinBox, QDoubleSpinBox,
                            QComboBox, QListWidget, QListWidgetItem, QDialog,
                            QDialogButtonBox, QInputDialog, QMenu, QAction,
-                           QSystemTrayIcon, QToolButton, QSplitter)
-from PyQt5.QtCore import Qt, pyqtSignal, QObject, QSize, QSettings, QPoint, QRect
-from PyQt5.QtGui import QIcon, QPixmap, QFont, QColor, QPalette
+                           QSystemTrayIcon, QToolButton, QSplitter, QFileDialog)
+from PyQt5.QtCore import Qt, pyqtSignal, QObject, QSize, QSettings, QPoint, QRect, QTimer
+from PyQt5.QtGui import QIcon, QPixmap, QFont, QColor, QPalette, QSyntaxHighlighter, QTextCharFormat
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.common.action_chains import ActionChains
 from selenium.webdriver.common.keys import Keys
+from naver_navigation import (PAGE_LOAD_STRATEGIES, DEFAULT_PAGE_LOAD_STRATEGY,
+                              apply_page_load_strategy, navigate, WriteRouteRouter,
+                              WritePagePrefetcher, BACKGROUND_TAB_ARGUMENTS)
+from naver_multitab import MultiTabScheduler
+from naver_editor import EditorVerifier, normalize_text, utf16_length
+from naver_text_source import FileSource, as_source, source_title, PREVIEW_SIZE
+from naver_checkpoints import TypingCheckpoints, TypingProgress, checkpoint_key
+from naver_typing_tuner import TypingSpeedTuner, tuned_speed_key
+from naver_hangul import INPUT_MODES, DEFAULT_INPUT_MODE, HangulComposer, contains_hangul
+from naver_markdown import SmartEditorBlockInserter, MarkdownBlocks, parse_rich_text
+from naver_images import ImagePipeline, EditorImageUploader, IMAGE_FILE_FILTER
+from naver_watchdog import (BrowserWatchdog, profile_dir, kill_driver, driver_pids, limit_page_load,
+                            HEARTBEAT_TIMEOUT, MAX_RESTARTS)
+from naver_resources import (CHROME_PROFILES, DEFAULT_CHROME_PROFILE, RECYCLE_POST_COUNT,
+                             MEMORY_CEILING_MB, apply_chrome_profile, ProcessTreeMonitor,
+                             RecyclePolicy)
+from naver_display import (DISPLAY_MODES, DEFAULT_DISPLAY_MODE, apply_display_mode, prepare_driver,
+                           has_screen, stop_virtual_display)
+from naver_process_worker import ProcessWorkerPool, DISPATCH_INTERVAL, TYPING_METHODS
+from naver_orchestrator import Orchestrator, OrchestratorLoop
+from naver_store import AccountStore, POST_TYPED
+from naver_dedup import DuplicateIndex, describe_duplicate, fingerprint
+from naver_keywords import (KeywordScanner, KEYWORDS_FILE, LEVEL_BLOCK, LEVEL_WARN, summarize_matches,
+                            has_blocked)
+from naver_drafts import DraftLibrary, read_draft
 
 # 설정 파일 관리를 위한 상수
 APP_NAME = "NaverBlogAutoTyper"
@@ -27,61 +54,37 @@ SETTINGS_FILE = "naver_blog_settings.json"
 ACCOUNTS_FILE = "naver_accounts.json"
 
 class AccountManager:
-    """네이버 계정 관리 클래스"""
-    def __init__(self):
+    """네이버 계정 관리 클래스 (SQLite 저장소에 변경된 항목만 기록, 아이디로 바로 찾는 색인 유지)"""
+    def __init__(self, store=None):
+        self.store = store or AccountStore()
         self.accounts = []
+        self.accounts_by_name = {}  # 아이디 -> 계정 정보 (self.accounts와 같은 객체)
         self.current_account = None
         self.load_accounts()
     
     def load_accounts(self):
-        """저장된 계정 정보 로드"""
+        """저장된 계정 정보 로드 (이전 JSON 파일이 있으면 처음 한 번 가져옴)"""
         try:
-            if os.path.exists(ACCOUNTS_FILE):
-                with open(ACCOUNTS_FILE, "r", encoding="utf-8") as f:
-                    data = json.load(f)
-                    self.accounts = data.get("accounts", [])
-                    self.current_account = data.get("current_account", None)
-        except json.JSONDecodeError as e:
-            print(f"계정 정보 파일 형식 오류: {e}")
-            # 파일이 손상된 경우 백업 생성 후 초기화
-            if os.path.exists(ACCOUNTS_FILE):
-                backup_file = f"{ACCOUNTS_FILE}.backup"
-                try:
-                    os.rename(ACCOUNTS_FILE, backup_file)
-                    print(f"손상된 파일을 {backup_file}으로 백업했습니다.")
-                except Exception:
-                    pass
-            self.accounts = []
-            self.current_account = None
+            self.store.migrate_json(ACCOUNTS_FILE)
+            self.accounts = self.store.accounts()
+            self.accounts_by_name = {account["username"]: account for account in self.accounts}
+            self.current_account = self.store.get_setting("current_account")
+            if self.current_account not in self.accounts_by_name:
+                self.current_account = None
         except Exception as e:
             print(f"계정 정보 로드 실패: {e}")
             self.accounts = []
+            self.accounts_by_name = {}
             self.current_account = None
     
     def save_accounts(self):
-        """계정 정보 저장"""
+        """계정 정보 전체 저장 (각 변경은 바로 기록되므로 보통은 필요 없음)"""
         try:
-            data = {
-                "accounts": self.accounts,
-                "current_account": self.current_account
-            }
-            # 임시 파일에 먼저 저장 후 이름 변경 (안전한 파일 저장)
-            temp_file = f"{ACCOUNTS_FILE}.temp"
-            with open(temp_file, "w", encoding="utf-8") as f:
-                json.dump(data, f, ensure_ascii=False, indent=2)
-                f.flush()
-                os.fsync(f.fileno())  # 파일 시스템 동기화
-            
-            # 기존 파일이 있으면 백업
-            if os.path.exists(ACCOUNTS_FILE):
-                backup_file = f"{ACCOUNTS_FILE}.bak"
-                try:
-                    os.replace(ACCOUNTS_FILE, backup_file)
-                except Exception:
-                    pass
-            
-            # 임시 파일을 실제 파일로 이름 변경
-            os.replace(temp_file, ACCOUNTS_FILE)
+            for account in self.accounts:
+                self.store.upsert_account(account["username"], account["password"], account.get("nickname"))
+                for blog in account.get("blogs", []):
+                    self.store.add_blog(account["username"], blog["id"], blog.get("name"))
+            self.store.set_setting("current_account", self.current_account)
             return True
         except Exception as e:
             print(f"계정 정보 저장 실패: {e}")
@@ -94,14 +97,16 @@ class AccountManager:
             return False
             
         try:
-            # 이미 있는 계정인지 확인
-            for account in self.accounts:
-                if account["username"] == username:
-                    account["password"] = password
-                    if nickname:
-                        account["nickname"] = nickname
-                    self.save_accounts()
-                    return True
+            # 이미 있는 계정이면 비밀번호와 별명만 변경
+            account = self.accounts_by_name.get(username)
+            if account is not None:
+                if account["password"] == password and (not nickname or account["nickname"] == nickname):
+                    return True  # 바뀐 내용이 없으면 기록하지 않음
+                account["password"] = password
+                if nickname:
+                    account["nickname"] = nickname
+                self.store.upsert_account(username, password, account["nickname"])
+                return True
             
             # 새 계정 추가
             new_account = {
@@ -110,157 +115,157 @@ class AccountManager:
                 "nickname": nickname or username,
                 "blogs": []
             }
+            self.store.upsert_account(username, password, new_account["nickname"])
             self.accounts.append(new_account)
+            self.accounts_by_name[username] = new_account
             
             # 현재 계정이 없으면 이 계정을 현재 계정으로 설정
             if self.current_account is None:
-                self.current_account = username
+                self.set_current_account(username)
             
-            return self.save_accounts()
+            return True
         except Exception as e:
             print(f"계정 추가 실패: {e}")
             return False
     
     def remove_account(self, username):
         """계정 삭제"""
-        for i, account in enumerate(self.accounts):
-            if account["username"] == username:
-                del self.accounts[i]
-                
-                # 현재 계정이 삭제된 경우 다른 계정으로 변경
-                if self.current_account == username:
-                    self.current_account = self.accounts[0]["username"] if self.accounts else None
-                
-                self.save_accounts()
-                return True
-        return False
+        account = self.accounts_by_name.pop(username, None)
+        if account is None:
+            return False
+        
+        try:
+            self.store.delete_account(username)  # 블로그와 카테고리도 함께 삭제
+        except Exception as e:
+            print(f"계정 삭제 실패: {e}")
+        self.accounts.remove(account)
+        
+        # 현재 계정이 삭제된 경우 다른 계정으로 변경
+        if self.current_account == username:
+            self.current_account = None
+            if self.accounts:
+                self.set_current_account(self.accounts[0]["username"])
+            else:
+                self.store.set_setting("current_account", None)
+        return True
     
     def set_current_account(self, username):
         """현재 계정 설정"""
-        for account in self.accounts:
-            if account["username"] == username:
-                self.current_account = username
-                self.save_accounts()
-                return True
-        return False
+        if username not in self.accounts_by_name:
+            return False
+        if self.current_account != username:
+            self.current_account = username
+            try:
+                self.store.set_setting("current_account", username)
+            except Exception as e:
+                print(f"현재 계정 저장 실패: {e}")
+        return True
     
     def get_current_account(self):
         """현재 계정 정보 반환"""
         if not self.current_account:
             return None
-            
-        for account in self.accounts:
-            if account["username"] == self.current_account:
-                return account
-        return None
+        return self.accounts_by_name.get(self.current_account)
     
     def add_blog_to_account(self, username, blog_id):
         """계정에 블로그 추가"""
-        for account in self.accounts:
-            if account["username"] == username:
-                if "blogs" not in account:
-                    account["blogs"] = []
-                
-                # 이미 있는 블로그인지 확인
-                for blog in account["blogs"]:
-                    if blog["id"] == blog_id:
-                        return True
-                
-                # 새 블로그 추가
-                account["blogs"].append({
-                    "id": blog_id,
-                    "name": blog_id
-                })
-                self.save_accounts()
+        account = self.accounts_by_name.get(username)
+        if account is None:
+            return False
+        
+        if "blogs" not in account:
+            account["blogs"] = []
+        
+        # 이미 있는 블로그인지 확인
+        for blog in account["blogs"]:
+            if blog["id"] == blog_id:
                 return True
-        return False
+        
+        # 새 블로그 추가
+        account["blogs"].append({
+            "id": blog_id,
+            "name": blog_id
+        })
+        try:
+            self.store.add_blog(username, blog_id)
+        except Exception as e:
+            print(f"블로그 저장 실패: {e}")
+        return True
+    
+    def record_post(self, username, blog_id, title, state, post_url=None):
+        """글 작성 기록 추가"""
+        try:
+            self.store.record_post(username, blog_id, title, state, post_url)
+        except Exception as e:
+            print(f"글 작성 기록 실패: {e}")
+    
+    def close(self):
+        """기록하지 않은 변경을 저장하고 저장소 닫기"""
+        self.store.close()
 
 class WorkerSignals(QObject):
     """브라우저 스레드의 신호를 정의하는 클래스"""
     update_status = pyqtSignal(str)
     browser_ready = pyqtSignal(bool)
     typing_completed = pyqtSignal(bool, str)
+    speed_tuned = pyqtSignal(float, float, float)  # 최소 지연, 최대 지연, 누락률 (실패 시 음수)
+    resource_usage = pyqtSignal(float, float, int)  # 브라우저 메모리(MB), CPU(%), 재시작 후 작성한 글 수
+
+class PreflightSignals(QObject):
+    """입력 전 검사 스레드의 결과를 GUI 스레드로 넘기는 신호"""
+    finished = pyqtSignal(object)  # 검사 결과 (블로그 목록, 본문, 금지어 검사 결과, 제목, 본문 지문, 블로그별 중복 글)
 
 class BrowserThread(threading.Thread):
     """백그라운드에서 브라우저를 실행하는 스레드"""
-    def __init__(self, username, password, screen_size=None):
+    def __init__(self, username, password, screen_size=None,
+                 page_load_strategy=DEFAULT_PAGE_LOAD_STRATEGY,
+                 chrome_profile=DEFAULT_CHROME_PROFILE, display_mode=DEFAULT_DISPLAY_MODE,
+                 signals=None):
         super().__init__()
         self.username = username
         self.password = password
         self.driver = None
-        self.signals = WorkerSignals()
+        self.signals = signals or WorkerSignals()  # 워커 프로세스에서는 이벤트 큐로 보내는 신호
         self.daemon = True  # 메인 프로그램 종료 시 같이 종료
         self.typing_speed = (0.05, 0.15)  # 기본 타이핑 속도 (최소, 최대 초)
         self.should_stop = False
-        self.screen_size = screen_size  # 화면 크기
+        self.display_mode = display_mode  # 브라우저 표시 방식 (화면 표시/헤드리스/가상 디스플레이)
+        self.screen_size = screen_size if has_screen(display_mode) else None  # 화면 크기 (화면이 없으면 창 배치 생략)
+        self.page_load_strategy = page_load_strategy  # 페이지 로딩 전략
+        self.write_router = WriteRouteRouter()  # 블로그별 글쓰기 진입 경로 기록
+        self.prefetcher = WritePagePrefetcher(self.write_router)  # 다음 글쓰기 페이지 미리 열기
+        self.prefetch_enabled = False
+        self.current_blog_id = None  # 현재 글쓰기 중인 블로그 ID
+        self.verify_typing = True  # 입력 후 에디터 내용 검증 및 복구
+        self.input_mode = DEFAULT_INPUT_MODE  # 입력 방식 (word/syllable: 한글 조합 입력, keys: 글자 단위)
+        self.checkpoints = TypingCheckpoints()  # 문단별 입력 위치 기록 (중단 후 이어서 입력)
+        self.commands = deque()  # GUI에서 보낸 명령 (함수, 인자)
+        self.command_ready = threading.Condition()
+        self.current_command = None  # 실행 중인 명령 (재시작 후 다시 실행)
+        self.retry_command = None  # 브라우저를 재시작한 뒤 다시 실행할 명령 (중단된 실행의 실패는 알리지 않음)
+        self.restarting = False
+        self.restart_count = 0
+        self.last_url = None  # 마지막으로 확인한 페이지 주소
+        self.watchdog = None
+        self.chrome_profile = chrome_profile  # 크롬 실행 옵션 구성 (기본/저메모리)
+        self.resource_monitor = ProcessTreeMonitor()  # 브라우저 프로세스 트리 사용량
+        self.recycle_policy = RecyclePolicy()  # 글 수/메모리 상한 기준 브라우저 재시작
+        self.resource_usage = None  # 마지막으로 확인한 사용량
+        self.posts_since_launch = 0  # 브라우저를 띄운 뒤 연 글쓰기 페이지 수
         
     def run(self):
         """스레드 실행"""
         try:
             # 브라우저 시작
             self.signals.update_status.emit("브라우저를 시작합니다...")
-            options = uc.ChromeOptions()
-            options.add_argument("--start-maximized")
-            
-            # 브라우저 초기 위치 및 크기 설정 (화면 오른쪽 상단)
-            if self.screen_size:
-                screen_width, screen_height = self.screen_size
-                window_width = int(screen_width * 0.6)  # 화면 너비의 60%
-                window_height = int(screen_height * 0.9)  # 화면 높이의 90%
-                
-                # 오른쪽 상단에 위치
-                pos_x = screen_width - window_width - 10  # 오른쪽에서 10px 간격
-                pos_y = 10  # 상단에서 10px 간격
-                
-                # 위치 및 크기 설정
-                options.add_argument(f"--window-size={window_width},{window_height}")
-                options.add_argument(f"--window-position={pos_x},{pos_y}")
-            
-            # 추가 옵션 설정
-            options.add_argument("--disable-gpu")  # GPU 가속 비활성화 (안정성 향상)
-            options.add_argument("--no-sandbox")  # 샌드박스 모드 비활성화
-            options.add_argument("--disable-dev-shm-usage")  # 공유 메모리 사용 비활성화
-            
-            try:
-                # 현재 설치된 크롬 버전과 호환되도록 version_main 파라미터 설정
-                # 136은 현재 설치된 크롬 버전 (136.0.7105.114)
-                self.driver = uc.Chrome(options=options, version_main=136)
-                self.signals.update_status.emit("브라우저가 성공적으로 시작되었습니다.")
-            except Exception as browser_error:
-                self.signals.update_status.emit(f"브라우저 초기화 오류: {browser_error}")
+            if not self.launch_browser():
                 self.signals.browser_ready.emit(False)
                 return
             
             # 네이버 로그인 페이지 열기
             self.signals.update_status.emit("네이버 로그인 페이지로 이동합니다...")
-            self.driver.get("https://nid.naver.com/nidlogin.login")
-            
-            # 자동 로그인 시도
-            if self.username and self.password:
-                self.signals.update_status.emit("로그인 시도 중...")
-                
-                # 자바스크립트로 로그인 정보 입력 (봇 감지 우회)
-                self.driver.execute_script(f"document.getElementsByName('id')[0].value='{self.username}'")
-                time.sleep(0.5)
-                self.driver.execute_script(f"document.getElementsByName('pw')[0].value='{self.password}'")
-                time.sleep(0.5)
-                
-                # 로그인 버튼 클릭
-                try:
-                    login_button = WebDriverWait(self.driver, 10).until(
-                        EC.element_to_be_clickable((By.ID, "log.login"))
-                    )
-                    login_button.click()
-                    self.signals.update_status.emit("로그인 버튼을 클릭했습니다.")
-                    
-                    # 자동입력 방지 확인
-                    time.sleep(2)
-                    if "자동입력 방지" in self.driver.page_source or "보안 문자" in self.driver.page_source:
-                        self.signals.update_status.emit("보안 문자가 감지되었습니다. 직접 입력해주세요.")
-                except Exception as e:
-                    self.signals.update_status.emit(f"로그인 버튼 클릭 실패: {e}")
-            else:
-                self.signals.update_status.emit("아이디와 비밀번호가 비어있습니다. 직접 로그인해주세요.")
+            navigate(self.driver, "https://nid.naver.com/nidlogin.login", "login")
+            self.login()
             
             # 로그인 완료 대기
             self.wait_for_login()
@@ -268,9 +273,12 @@ class BrowserThread(threading.Thread):
             # 브라우저 준비 완료 신호 전송
             self.signals.browser_ready.emit(True)
             
-            # 스레드 종료 전까지 대기
-            while not self.should_stop:
-                time.sleep(0.5)
+            # 브라우저 감시 시작 (멈추거나 종료되면 자동 재시작)
+            self.watchdog = BrowserWatchdog(self)
+            self.watchdog.start()
+            
+            # 스레드 종료 전까지 GUI에서 보낸 명령 실행
+            self.process_commands()
                 
         except Exception as e:
             error_msg = f"브라우저 스레드 오류: {e}"
@@ -278,12 +286,263 @@ class BrowserThread(threading.Thread):
             self.signals.update_status.emit(error_msg)
             self.signals.browser_ready.emit(False)
         finally:
+            if self.watchdog:
+                self.watchdog.stop()
             if self.should_stop and self.driver:
                 try:
                     self.driver.quit()
                 except Exception:
                     pass  # 브라우저 종료 실패 무시
     
+    def launch_browser(self):
+        """크롬 실행 (계정별 프로필 사용), 성공 여부 반환"""
+        options = uc.ChromeOptions()
+        
+        # 표시 방식 적용 (화면에 표시할 때만 화면 오른쪽 상단에 창 배치)
+        try:
+            apply_display_mode(options, self.display_mode, self.screen_size)
+        except Exception as e:
+            self.signals.update_status.emit(f"브라우저 표시 방식 설정 오류: {e}")
+            return False
+        
+        # 추가 옵션 설정
+        options.add_argument("--disable-gpu")  # GPU 가속 비활성화 (안정성 향상)
+        options.add_argument("--no-sandbox")  # 샌드박스 모드 비활성화
+        options.add_argument("--disable-dev-shm-usage")  # 공유 메모리 사용 비활성화
+        for argument in BACKGROUND_TAB_ARGUMENTS:
+            options.add_argument(argument)  # 미리 연 백그라운드 탭 로딩 지연 방지
+        apply_chrome_profile(options, self.chrome_profile)  # 저메모리 구성이면 옵션 추가
+        
+        # 페이지 로딩 전략 (eager/none은 준비 조건으로 로딩 완료를 판단)
+        apply_page_load_strategy(options, self.page_load_strategy)
+        
+        try:
+            # 현재 설치된 크롬 버전과 호환되도록 version_main 파라미터 설정
+            # 136은 현재 설치된 크롬 버전 (136.0.7105.114)
+            # 계정별 프로필 폴더를 사용해 재시작해도 로그인 쿠키 유지
+            self.driver = uc.Chrome(options=options, version_main=136,
+                                    user_data_dir=profile_dir(self.username))
+            prepare_driver(self.driver, self.display_mode)
+            limit_page_load(self.driver)  # 느린 페이지 로딩을 감시 스레드가 멈춘 것으로 보지 않도록
+            self.posts_since_launch = 0
+            self.resource_usage = None
+            self.resource_monitor.reset()
+            self.signals.update_status.emit("브라우저가 성공적으로 시작되었습니다.")
+            return True
+        except Exception as browser_error:
+            self.signals.update_status.emit(f"브라우저 초기화 오류: {browser_error}")
+            return False
+    
+    def login(self):
+        """로그인 페이지에서 자동 로그인 시도 (이미 로그인된 프로필이면 생략)"""
+        if not self.driver.find_elements(By.NAME, "id"):
+            self.signals.update_status.emit("이미 로그인되어 있습니다.")
+            return
+        
+        # 자동 로그인 시도
+        if self.username and self.password:
+            self.signals.update_status.emit("로그인 시도 중...")
+            
+            # 자바스크립트로 로그인 정보 입력 (봇 감지 우회)
+            self.driver.execute_script(f"document.getElementsByName('id')[0].value='{self.username}'")
+            time.sleep(0.5)
+            self.driver.execute_script(f"document.getElementsByName('pw')[0].value='{self.password}'")
+            time.sleep(0.5)
+            
+            # 로그인 버튼 클릭
+            try:
+                login_button = WebDriverWait(self.driver, 10).until(
+                    EC.element_to_be_clickable((By.ID, "log.login"))
+                )
+                login_button.click()
+                self.signals.update_status.emit("로그인 버튼을 클릭했습니다.")
+                
+                # 자동입력 방지 확인
+                time.sleep(2)
+                if "자동입력 방지" in self.driver.page_source or "보안 문자" in self.driver.page_source:
+                    self.signals.update_status.emit("보안 문자가 감지되었습니다. 직접 입력해주세요.")
+                    self.warn_no_screen()
+            except Exception as e:
+                self.signals.update_status.emit(f"로그인 버튼 클릭 실패: {e}")
+        else:
+            self.signals.update_status.emit("아이디와 비밀번호가 비어있습니다. 직접 로그인해주세요.")
+            self.warn_no_screen()
+    
+    def warn_no_screen(self):
+        """화면이 없는 표시 방식에서 직접 로그인이 필요할 때 안내"""
+        if not has_screen(self.display_mode):
+            self.signals.update_status.emit(
+                "화면 없이 실행 중이라 직접 입력할 수 없습니다. 화면 표시 방식으로 한 번 로그인하면 계정 프로필에 로그인이 유지됩니다.")
+    
+    def submit(self, func, *args):
+        """브라우저 스레드에서 실행할 명령 추가 (순서대로 실행)"""
+        with self.command_ready:
+            self.commands.append((func, args))
+            self.command_ready.notify()
+    
+    def next_command(self):
+        """다음 명령 꺼내기 (브라우저 재시작 중에는 대기, 종료 시 None)"""
+        with self.command_ready:
+            while not self.should_stop and (self.restarting or not self.commands):
+                self.command_ready.wait(0.5)
+            if self.should_stop:
+                return None
+            self.current_command = self.commands.popleft()
+            return self.current_command
+    
+    def process_commands(self):
+        """GUI에서 보낸 명령을 순서대로 실행"""
+        while not self.should_stop:
+            command = self.next_command()
+            if command is None:
+                break
+            func, args = command
+            try:
+                func(*args)
+            except Exception as e:
+                self.signals.update_status.emit(f"명령 실행 오류: {e}")
+            finally:
+                with self.command_ready:
+                    if self.retry_command is command:
+                        self.retry_command = None  # 다시 실행할 때는 결과를 알림
+                    self.current_command = None
+                    self.command_ready.notify_all()
+    
+    def report_typing(self, success, message):
+        """입력 결과 전달 (브라우저를 재시작해 다시 실행할 명령의 중단된 실행은 실패를 알리지 않음)
+        
+        GUI는 실패를 받으면 입력 중인 글 정보를 비우므로, 다시 실행한 입력이 성공해도 기록되지 않고 완료가 두 번 전달된다.
+        """
+        with self.command_ready:
+            if not success and self.retry_command is not None and self.retry_command is self.current_command:
+                return
+        self.signals.typing_completed.emit(success, message)
+    
+    def recover(self, reason):
+        """멈추거나 종료된 브라우저를 정리하고 같은 프로필로 다시 띄운 뒤 중단된 명령 재실행, 성공 여부 반환"""
+        with self.command_ready:
+            if self.should_stop:
+                return False
+            self.restarting = True
+            interrupted = self.current_command
+        
+        try:
+            self.restart_count += 1
+            if self.restart_count > MAX_RESTARTS:
+                self.signals.update_status.emit(f"브라우저가 {reason}. 재시작 횟수를 초과했습니다.")
+                self.signals.browser_ready.emit(False)
+                return False
+            with self.command_ready:
+                self.retry_command = interrupted  # 드라이버를 종료하면 실패하는 실행은 알리지 않고 다시 실행
+            self.signals.update_status.emit(f"브라우저가 {reason}. 다시 시작합니다... ({self.restart_count}/{MAX_RESTARTS})")
+            
+            # 멈춘 드라이버와 크롬 프로세스를 모두 종료 (실행 중이던 명령은 오류로 빠져나옴)
+            if self.driver:
+                kill_driver(self.driver)
+            self.driver = None
+            self.prefetcher.tabs.clear()
+            
+            # 중단된 명령이 끝날 때까지 대기
+            with self.command_ready:
+                deadline = time.monotonic() + HEARTBEAT_TIMEOUT
+                while self.current_command is not None and time.monotonic() < deadline:
+                    self.command_ready.wait(0.5)
+            
+            if not self.restore_session():
+                self.fail_interrupted(interrupted)
+                self.signals.browser_ready.emit(False)
+                return False
+            
+            # 중단된 명령을 맨 앞에 다시 넣음 (타이핑은 체크포인트부터 이어서 입력)
+            with self.command_ready:
+                if interrupted:
+                    self.commands.appendleft(interrupted)
+            self.signals.update_status.emit("브라우저를 다시 시작했습니다. 대기 중인 작업을 이어서 진행합니다.")
+            return True
+        except Exception as e:
+            self.signals.update_status.emit(f"브라우저 재시작 실패: {e}")
+            self.fail_interrupted(interrupted)
+            self.signals.browser_ready.emit(False)
+            return False
+        finally:
+            with self.command_ready:
+                self.restarting = False
+                self.command_ready.notify_all()
+    
+    def fail_interrupted(self, command):
+        """다시 실행하려던 입력 명령을 실행하지 못하게 되면 알리지 않았던 실패를 전달
+        
+        중단된 실행이 아직 끝나지 않았으면 그 실행이 직접 실패를 알린다.
+        """
+        with self.command_ready:
+            self.retry_command = None
+            finished = self.current_command is not command
+        if command and finished and getattr(command[0], "__name__", None) in TYPING_METHODS:
+            self.signals.typing_completed.emit(False, "브라우저를 다시 시작하지 못해 입력이 중단되었습니다.")
+    
+    def restore_session(self):
+        """같은 프로필로 브라우저를 띄우고 마지막으로 보던 페이지 다시 열기 (로그인이 풀렸으면 로그인부터)"""
+        if not self.launch_browser():
+            return False
+        navigate(self.driver, self.last_url or "https://nid.naver.com/nidlogin.login")
+        if "nidlogin" in self.driver.current_url:
+            self.login()
+            if self.last_url and "nidlogin" not in self.last_url:
+                navigate(self.driver, self.last_url)
+        return True
+    
+    def sample_resources(self):
+        """브라우저 프로세스 트리의 메모리/CPU 사용량 확인 (감시 스레드에서 주기적으로 호출)"""
+        driver = self.driver
+        if driver is None:
+            return None
+        usage = self.resource_monitor.sample(driver_pids(driver))
+        if usage:
+            self.resource_usage = usage
+            self.signals.resource_usage.emit(usage.rss_mb, usage.cpu_percent, self.posts_since_launch)
+        return usage
+    
+    def set_recycle_policy(self, max_posts, memory_ceiling_mb):
+        """브라우저 재시작 기준 설정 (0이면 해당 기준 사용 안 함)"""
+        self.recycle_policy = RecyclePolicy(max_posts, memory_ceiling_mb)
+    
+    def recycle_if_needed(self):
+        """새 글을 시작하기 전(글 사이)에 재시작 기준을 넘었으면 브라우저를 다시 띄움"""
+        reason = self.recycle_policy.reason(self.posts_since_launch, self.resource_usage)
+        if reason:
+            self.recycle(reason)
+    
+    def recycle(self, reason):
+        """브라우저를 정상 종료하고 같은 프로필로 다시 띄워 세션 복원, 성공 여부 반환"""
+        with self.command_ready:
+            if self.should_stop:
+                return False
+            self.restarting = True  # 감시 스레드가 재시작 중인 브라우저를 멈춘 것으로 보지 않도록 함
+        
+        try:
+            self.signals.update_status.emit(f"{reason}. 메모리 정리를 위해 브라우저를 다시 시작합니다...")
+            if self.driver:
+                try:
+                    self.driver.quit()
+                except Exception:
+                    kill_driver(self.driver)  # 정상 종료 실패 시 강제 종료
+            self.driver = None
+            self.prefetcher.tabs.clear()
+            
+            if not self.restore_session():
+                self.signals.browser_ready.emit(False)
+                return False
+            self.signals.update_status.emit("브라우저를 다시 시작했습니다.")
+            return True
+        except Exception as e:
+            self.signals.update_status.emit(f"브라우저 재시작 실패: {e}")
+            self.signals.browser_ready.emit(False)
+            return False
+        finally:
+            with self.command_ready:
+                self.restarting = False
+                self.command_ready.notify_all()
+    
     def wait_for_login(self):
         """로그인 완료 대기"""
         self.signals.update_status.emit("로그인 대기 중... 로그인 완료 후 '블로그 이동' 버튼을 클릭하세요.")
@@ -299,8 +558,7 @@ class BrowserThread(threading.Thread):
                 return False
                 
             self.signals.update_status.emit(f"블로그 {blog_id}로 이동합니다...")
-            self.driver.get(f"https://blog.naver.com/{blog_id}")
-            time.sleep(2)
+            navigate(self.driver, f"https://blog.naver.com/{blog_id}", "blog_home")
             return True
         except Exception as e:
             self.signals.update_status.emit(f"블로그 이동 실패: {e}")
@@ -313,58 +571,39 @@ class BrowserThread(threading.Thread):
                 self.signals.update_status.emit("브라우저가 실행되지 않았습니다.")
                 return False
                 
-            # 방법 1: 글쓰기 버튼 클릭
-            try:
-                self.signals.update_status.emit("글쓰기 버튼을 찾는 중...")
-                # 사용자가 제공한 정확한 선택자 추가
-                write_button_selectors = [
-                    "a.col._checkBlock._rosRestrict[href*='postwrite']",
-                    "a[href*='postwrite']",
-                    "a[onclick*='prf.write']",
-                    ".btn_write, .link_write",
-                    "a[href*='PostWrite.naver']"
-                ]
-                
-                for selector in write_button_selectors:
-                    try:
-                        write_button = WebDriverWait(self.driver, 3).until(
-                            EC.element_to_be_clickable((By.CSS_SELECTOR, selector))
-                        )
-                        self.signals.update_status.emit(f"글쓰기 버튼을 찾았습니다: {selector}")
-                        write_button.click()
-                        self.signals.update_status.emit("글쓰기 버튼을 클릭했습니다.")
-                        break
-                    except Exception:
-                        continue
-                else:
-                    raise Exception("모든 선택자로 글쓰기 버튼을 찾을 수 없습니다")
-                    
-            except Exception as e:
-                # 방법 2: 직접 URL로 이동
-                self.signals.update_status.emit(f"글쓰기 버튼을 찾을 수 없어 직접 URL로 이동합니다: {e}")
-                # 사용자가 제공한 정확한 URL 형식 사용
-                try:
-                    # 새 URL 형식 시도
-                    self.driver.get(f"https://blog.naver.com/{blog_id}/postwrite")
-                    self.signals.update_status.emit("새 URL 형식으로 이동했습니다.")
-                except Exception:
-                    # 기존 URL 형식 시도
-                    self.driver.get(f"https://blog.naver.com/PostWrite.naver?blogId={blog_id}")
-                    self.signals.update_status.emit("기존 URL 형식으로 이동했습니다.")
+            self.current_blog_id = blog_id
+            
+            # 이전 글과 다음 글 사이에서만 브라우저 재시작 (작성 중인 글은 건드리지 않음)
+            self.recycle_if_needed()
+            if not self.driver:
+                return False
             
-            # 페이지 로딩 대기
-            time.sleep(3)
+            # 미리 열어둔 글쓰기 탭이 있으면 바로 전환
+            if self.prefetcher.activate(self.driver, blog_id):
+                self.posts_since_launch += 1
+                self.signals.update_status.emit("미리 열어둔 글쓰기 페이지로 전환했습니다.")
+                return True
+            
+            # 기록된 경로 우선 시도 (성공했던 postwrite URL로 바로 이동, 실패 시 버튼 클릭)
+            route = self.write_router.open_write_page(
+                self.driver, blog_id, self.signals.update_status.emit)
+            if not route:
+                self.signals.update_status.emit("글쓰기 페이지로 이동하지 못했습니다.")
+                return False
+            self.posts_since_launch += 1
             return True
         except Exception as e:
             self.signals.update_status.emit(f"글쓰기 페이지 이동 실패: {e}")
             return False
     
-    def type_text(self, text):
-        """에디터에 텍스트 입력"""
+    def type_text(self, text, images=None):
+        """에디터에 텍스트 입력 (문자열 또는 문단 단위로 읽는 본문 소스, 이미지는 본문 뒤에 한 번에 업로드)"""
         if not self.driver:
             self.signals.update_status.emit("브라우저가 실행되지 않았습니다.")
-            self.signals.typing_completed.emit(False, "브라우저가 실행되지 않았습니다.")
+            self.report_typing(False, "브라우저가 실행되지 않았습니다.")
             return
+        
+        source = as_source(text)
             
         try:
             self.signals.update_status.emit("에디터를 찾는 중...")
@@ -378,93 +617,70 @@ class BrowserThread(threading.Thread):
             if editor_element:
                 self.signals.update_status.emit("에디터를 찾았습니다. 텍스트 입력을 시작합니다...")
                 
-                # 방법 1: 직접 입력 방식
-                try:
-                    # 요소 클릭
-                    editor_element.click()
-                    time.sleep(0.5)
-                    
-                    # 타이핑하듯이 텍스트 입력
-                    self.type_like_human(editor_element, text)
-                    
-                    self.signals.update_status.emit("텍스트 입력이 완료되었습니다.")
-                    self.signals.typing_completed.emit(True, "텍스트 입력이 완료되었습니다.")
-                    return
-                except Exception as e:
-                    self.signals.update_status.emit(f"직접 입력 방식 실패: {e}. 다른 방식을 시도합니다.")
+                # 이전에 중단된 입력이 있으면 에디터 내용을 확인해 이어서 입력할 위치 결정
+                key = checkpoint_key(self.current_blog_id, source)
+                typing_progress = self.begin_checkpoints(key, source)
+                start = typing_progress.offset if typing_progress else 0
                 
-                # 방법 2: 자바스크립트 실행
-                try:
-                    self.signals.update_status.emit("JavaScript로 텍스트 입력을 시도합니다...")
-                    # 글자별로 입력 (타이핑 효과)
-                    for i, char in enumerate(text):
-                        script = f"""
-                            var el = arguments[0];
-                            if (el.isContentEditable) {{
-                                el.textContent = el.textContent + '{char}';
-                            }} else if (el.tagName === 'TEXTAREA' || el.tagName === 'INPUT') {{
-                                el.value = el.value + '{char}';
-                            }}
-                        """
-                        self.driver.execute_script(script, editor_element)
-                        time.sleep(random.uniform(*self.typing_speed))
-                        
-                        # 진행 상황 업데이트 (10% 단위)
-                        if i % max(1, len(text) // 10) == 0:
-                            progress = (i / len(text)) * 100
-                            self.signals.update_status.emit(f"텍스트 입력 중... {progress:.0f}%")
-                    
-                    self.signals.update_status.emit("JavaScript로 텍스트 입력이 완료되었습니다.")
-                    self.signals.typing_completed.emit(True, "텍스트 입력이 완료되었습니다.")
-                    return
-                except Exception as e:
-                    self.signals.update_status.emit(f"JavaScript 입력 실패: {e}. 다른 방식을 시도합니다.")
+                # 입력 전 본문 길이 (검증 기준 위치)
+                base = self.measure_editor_base()
+                
+                # 입력하는 동안 다음 글쓰기 페이지를 백그라운드 탭에 미리 열기
+                self.prefetch_next_write_page()
+                
+                # 입력 방식 (앞의 방식이 실패하면 실패한 문단부터 다음 방식으로 이어서 입력)
+                input_methods = [
+                    ("직접 입력", self.input_chunk_direct),
+                    ("JavaScript", self.input_chunk_script),
+                    ("ActionChains", self.input_chunk_actions),
+                    ("클립보드", self.input_chunk_clipboard),
+                ]
+                method_index = 0
+                repaired = 0
                 
-                # 방법 3: ActionChains 사용
+                # 요소 클릭
                 try:
-                    self.signals.update_status.emit("ActionChains로 입력을 시도합니다...")
-                    actions = ActionChains(self.driver)
-                    actions.move_to_element(editor_element).click().perform()
+                    editor_element.click()
                     time.sleep(0.5)
-                    
-                    # 텍스트를 한 글자씩 입력
-                    for char in text:
-                        actions.send_keys(char).perform()
-                        time.sleep(random.uniform(*self.typing_speed))
-                    
-                    self.signals.update_status.emit("ActionChains로 텍스트 입력 완료")
-                    self.signals.typing_completed.emit(True, "텍스트 입력이 완료되었습니다.")
-                    return
                 except Exception as e:
-                    self.signals.update_status.emit(f"ActionChains 실패: {e}. 다른 방식을 시도합니다.")
+                    self.signals.update_status.emit(f"에디터 클릭 실패: {e}")
                 
-                # 방법 4: 클립보드 방식 (최후의 수단)
-                try:
-                    self.signals.update_status.emit("클립보드를 사용한 입력을 시도합니다...")
-                    # 클립보드에 텍스트 복사 (JavaScript)
-                    self.driver.execute_script(f"""
-                        var textarea = document.createElement('textarea');
-                        textarea.value = `{text.replace('`', '\\`')}`;
-                        document.body.appendChild(textarea);
-                        textarea.select();
-                        document.execCommand('copy');
-                        document.body.removeChild(textarea);
-                    """)
-                    time.sleep(0.5)
+                # 본문을 문단 단위로 읽으면서 입력
+                for chunk in source.chunks(start):
+                    while True:
+                        name, input_chunk = input_methods[method_index]
+                        try:
+                            input_chunk(editor_element, chunk.text)
+                            break
+                        except Exception as e:
+                            method_index += 1
+                            if method_index >= len(input_methods):
+                                raise Exception(f"모든 입력 방법이 실패했습니다: {e}")
+                            self.signals.update_status.emit(
+                                f"{name} 방식 실패: {e}. {input_methods[method_index][0]} 방식으로 이어서 입력합니다.")
                     
-                    # 요소 클릭
-                    editor_element.click()
-                    time.sleep(0.5)
+                    # 문단마다 검증 후 누락 구간 복구
+                    base, chunk_repaired = self.verify_chunk(chunk.text, base)
+                    repaired += chunk_repaired
                     
-                    # 붙여넣기 단축키 사용
-                    actions = ActionChains(self.driver)
-                    actions.key_down(Keys.CONTROL).send_keys('v').key_up(Keys.CONTROL).perform()
+                    # 문단 경계마다 입력 위치 기록 (중단 요청으로 문단 중간에 멈췄으면 기록하지 않음,
+                    # 다시 시작하면 마지막 체크포인트 이후 입력된 부분을 지우고 이어서 입력)
+                    if typing_progress and not self.should_stop:
+                        self.checkpoints.record(key, typing_progress.advance(chunk))
                     
-                    self.signals.update_status.emit("클립보드를 사용한 텍스트 입력 완료")
-                    self.signals.typing_completed.emit(True, "텍스트 입력이 완료되었습니다.")
-                    return
-                except Exception as e:
-                    self.signals.update_status.emit(f"클립보드 입력 실패: {e}")
+                    if self.should_stop:
+                        self.checkpoints.flush()
+                        self.report_typing(False, "텍스트 입력이 중단되었습니다. 다시 시작하면 이어서 입력합니다.")
+                        return
+                    
+                    # 진행 상황 업데이트
+                    progress = chunk.end / max(1, source.size) * 100
+                    self.signals.update_status.emit(f"텍스트 입력 중... {progress:.0f}%")
+                
+                self.checkpoints.clear(key)
+                self.upload_images(images)
+                self.complete_typing(repaired)
+                return
             else:
                 # 다른 방법 시도
                 self.signals.update_status.emit("에디터를 찾지 못했습니다. 다른 방법을 시도합니다...")
@@ -489,9 +705,10 @@ class BrowserThread(threading.Thread):
                                 
                                 element.click()
                                 time.sleep(0.5)
-                                self.type_like_human(element, text)
+                                for chunk in source.chunks():
+                                    self.input_chunk_direct(element, chunk.text)
                                 self.signals.update_status.emit("텍스트 입력이 완료되었습니다.")
-                                self.signals.typing_completed.emit(True, "텍스트 입력이 완료되었습니다.")
+                                self.report_typing(True, "텍스트 입력이 완료되었습니다.")
                                 return
                             except Exception:
                                 # iframe으로 전환했다면 다시 기본 프레임으로 복귀
@@ -504,17 +721,197 @@ class BrowserThread(threading.Thread):
                 # ActionChains 사용 시도 (전체 페이지에 대해)
                 try:
                     self.signals.update_status.emit("전체 페이지에 ActionChains로 입력을 시도합니다...")
-                    actions = ActionChains(self.driver)
-                    actions.send_keys(text).perform()
+                    for chunk in source.chunks():
+                        ActionChains(self.driver).send_keys(chunk.text).perform()
                     self.signals.update_status.emit("ActionChains로 텍스트 입력이 완료되었습니다.")
-                    self.signals.typing_completed.emit(True, "텍스트 입력이 완료되었습니다.")
+                    self.report_typing(True, "텍스트 입력이 완료되었습니다.")
                     return
                 except Exception as e:
                     self.signals.update_status.emit(f"모든 입력 방법이 실패했습니다: {e}")
-                    self.signals.typing_completed.emit(False, f"텍스트 입력 실패: {e}")
+                    self.report_typing(False, f"텍스트 입력 실패: {e}")
         except Exception as e:
+            self.checkpoints.flush()
             self.signals.update_status.emit(f"텍스트 입력 중 오류 발생: {e}")
-            self.signals.typing_completed.emit(False, f"텍스트 입력 실패: {e}")
+            self.report_typing(False, f"텍스트 입력 실패: {e}")
+    
+    def type_blocks(self, blocks, images=None):
+        """서식 블록(제목, 문단, 인용, 목록, 구분선)을 블록마다 한 번의 서식 붙여넣기로 에디터에 입력"""
+        if not self.driver:
+            self.signals.update_status.emit("브라우저가 실행되지 않았습니다.")
+            self.report_typing(False, "브라우저가 실행되지 않았습니다.")
+            return
+
+        try:
+            self.signals.update_status.emit("에디터를 찾는 중...")
+            self.find_and_switch_to_editor_iframe()
+            editor_element = self.find_editor_element()
+            if not editor_element:
+                self.report_typing(False, "에디터를 찾지 못했습니다.")
+                return
+
+            editor_element.click()
+            time.sleep(0.5)
+
+            # 입력하는 동안 다음 글쓰기 페이지를 백그라운드 탭에 미리 열기
+            self.prefetch_next_write_page()
+
+            inserter = SmartEditorBlockInserter(self.driver)
+            count = 0
+            for block in blocks:
+                if self.should_stop:
+                    self.report_typing(False, "텍스트 입력이 중단되었습니다.")
+                    return
+                inserter.insert(editor_element, block)
+                count += 1
+                # 블록 사이에는 사람이 붙여넣는 정도의 간격만 둠
+                time.sleep(random.uniform(*self.typing_speed) * 5)
+                if count % 10 == 0:
+                    self.signals.update_status.emit(f"서식 블록 입력 중... {count}개")
+
+            self.upload_images(images)
+            message = f"서식 블록 {count}개 입력이 완료되었습니다."
+            self.signals.update_status.emit(message)
+            self.report_typing(True, message)
+        except Exception as e:
+            self.signals.update_status.emit(f"서식 블록 입력 중 오류 발생: {e}")
+            self.report_typing(False, f"서식 블록 입력 실패: {e}")
+
+    def upload_images(self, images):
+        """변환이 끝난 이미지를 에디터에 한 번에 업로드 (실패해도 본문 입력 결과는 유지)"""
+        if not images:
+            return
+        try:
+            if not images.done():
+                self.signals.update_status.emit("이미지 변환이 끝나기를 기다리는 중...")
+            paths = images.result()
+            added = EditorImageUploader(self.driver, self.signals.update_status.emit).upload(paths)
+            self.signals.update_status.emit(f"이미지 {added}/{len(paths)}개 업로드 완료")
+        except Exception as e:
+            self.signals.update_status.emit(f"이미지 업로드 실패: {e}")
+    
+    def input_chunk_direct(self, element, text):
+        """방법 1: 요소에 직접 타이핑"""
+        self.type_with_input_mode(element, text, report_progress=False)
+    
+    def input_chunk_script(self, element, text):
+        """방법 2: 자바스크립트로 글자별 추가 (타이핑 효과)"""
+        for char in text:
+            self.driver.execute_script("""
+                var el = arguments[0];
+                if (el.isContentEditable) {
+                    el.textContent = el.textContent + arguments[1];
+                } else if (el.tagName === 'TEXTAREA' || el.tagName === 'INPUT') {
+                    el.value = el.value + arguments[1];
+                }
+            """, element, char)
+            time.sleep(random.uniform(*self.typing_speed))
+    
+    def input_chunk_actions(self, element, text):
+        """방법 3: ActionChains로 한 글자씩 입력"""
+        for char in text:
+            ActionChains(self.driver).send_keys(char).perform()
+            time.sleep(random.uniform(*self.typing_speed))
+    
+    def input_chunk_clipboard(self, element, text):
+        """방법 4: 클립보드로 문단 붙여넣기 (최후의 수단)"""
+        # 클립보드에 텍스트 복사 (본문은 스크립트 인자로 전달)
+        self.driver.execute_script("""
+            var textarea = document.createElement('textarea');
+            textarea.value = arguments[0];
+            document.body.appendChild(textarea);
+            textarea.select();
+            document.execCommand('copy');
+            document.body.removeChild(textarea);
+        """, text)
+        time.sleep(0.5)
+        
+        # 요소 클릭 후 붙여넣기 단축키 사용
+        element.click()
+        actions = ActionChains(self.driver)
+        actions.key_down(Keys.CONTROL).send_keys('v').key_up(Keys.CONTROL).perform()
+    
+    def begin_checkpoints(self, key, source):
+        """저장된 체크포인트를 에디터 내용과 대조해 입력 진행 상태 반환 (확인할 수 없으면 None)"""
+        log = self.signals.update_status.emit
+        try:
+            verifier = EditorVerifier(self.driver, log)
+            checkpoint = self.checkpoints.resume(key, verifier, source, log)
+            if checkpoint:
+                progress = checkpoint.offset / max(1, source.size) * 100
+                log(f"이전 입력 위치({progress:.0f}%)부터 이어서 입력합니다.")
+                return TypingProgress(checkpoint.base, checkpoint)
+            return TypingProgress(verifier.text_length())
+        except Exception as e:
+            log(f"입력 체크포인트 확인 실패: {e}")
+            return None
+    
+    def measure_editor_base(self):
+        """입력 시작 전 에디터 본문 길이 측정 (검증하지 않으면 None)"""
+        if not self.verify_typing:
+            return None
+        try:
+            return EditorVerifier(self.driver).text_length()
+        except Exception:
+            return None
+    
+    def verify_chunk(self, text, base):
+        """문단 입력 결과를 원본과 비교해 누락 구간을 복구하고 (다음 기준 위치, 복구 수) 반환"""
+        if base is None:
+            return None, 0
+        try:
+            # 에디터가 마지막 입력을 반영할 시간을 둠
+            time.sleep(0.2)
+            verifier = EditorVerifier(self.driver, self.signals.update_status.emit)
+            matched, repaired = verifier.verify_and_repair(text, base)
+        except Exception as e:
+            self.signals.update_status.emit(f"입력 내용 검증 실패: {e}")
+            return None, 0
+        if not matched:
+            raise Exception("입력 내용 검증 실패: 원본과 다른 부분이 남아 있습니다.")
+        return base + utf16_length(normalize_text(text)), repaired
+    
+    def complete_typing(self, repaired=0):
+        """입력 완료 신호 전송"""
+        message = "텍스트 입력이 완료되었습니다."
+        if repaired:
+            message = f"텍스트 입력이 완료되었습니다. (누락/오류 {repaired}곳 복구)"
+        self.signals.update_status.emit(message)
+        self.report_typing(True, message)
+    
+    def type_text_to_blogs(self, blog_ids, text):
+        """로그인된 브라우저 하나에서 블로그마다 에디터 탭을 열고 병렬로 텍스트 입력"""
+        if not self.driver:
+            self.signals.update_status.emit("브라우저가 실행되지 않았습니다.")
+            self.report_typing(False, "브라우저가 실행되지 않았습니다.")
+            return
+            
+        try:
+            self.recycle_if_needed()
+            if not self.driver:
+                self.report_typing(False, "브라우저를 다시 시작하지 못했습니다.")
+                return
+            self.posts_since_launch += len(blog_ids)
+            scheduler = MultiTabScheduler(
+                self.driver,
+                self.find_editor_element,
+                write_router=self.write_router,
+                typing_speed=self.typing_speed,
+                log=self.signals.update_status.emit,
+                should_stop=lambda: self.should_stop,
+                verify=self.verify_typing,
+                input_mode=self.input_mode
+            )
+            results = scheduler.run([(blog_id, text) for blog_id in blog_ids])
+            
+            failed = [f"{blog_id} ({message})" for blog_id, (success, message) in results.items() if not success]
+            if failed:
+                message = f"{len(results) - len(failed)}개 블로그 입력 완료, 실패: {', '.join(failed)}"
+                self.report_typing(False, message)
+            else:
+                self.report_typing(True, f"{len(results)}개 블로그에 텍스트 입력이 완료되었습니다.")
+        except Exception as e:
+            self.signals.update_status.emit(f"여러 블로그 입력 중 오류 발생: {e}")
+            self.report_typing(False, f"여러 블로그 입력 실패: {e}")
     
     def find_and_switch_to_editor_iframe(self):
         """에디터 iframe 찾고 전환"""
@@ -604,7 +1001,26 @@ class BrowserThread(threading.Thread):
         
         return None
     
-    def type_like_human(self, element, text):
+    def type_with_input_mode(self, element, text, report_progress=True):
+        """입력 방식에 따라 텍스트 입력 (한글이 있으면 음절/단어 단위로 조합 입력)"""
+        if self.input_mode in ("word", "syllable") and contains_hangul(text):
+            progress = None
+            if report_progress:
+                progress = lambda percent: self.signals.update_status.emit(f"텍스트 입력 중... {percent}%")
+            composer = HangulComposer(
+                self.driver,
+                self.typing_speed,
+                self.input_mode,
+                progress=progress,
+                should_stop=lambda: self.should_stop
+            )
+            composer.type(element, text)
+            if report_progress:
+                self.signals.update_status.emit("타이핑 완료")
+        else:
+            self.type_like_human(element, text, report_progress)
+    
+    def type_like_human(self, element, text, report_progress=True):
         """사람처럼 타이핑하는 함수"""
         min_delay, max_delay = self.typing_speed
         
@@ -620,7 +1036,7 @@ class BrowserThread(threading.Thread):
                 time.sleep(delay)
                 
                 # 진행 상황 업데이트 (10% 단위)
-                if i % max(1, total_chars // 10) == 0:
+                if report_progress and i % max(1, total_chars // 10) == 0:
                     progress = (i / total_chars) * 100
                     self.signals.update_status.emit(f"텍스트 입력 중... {progress:.0f}%")
                     
@@ -640,38 +1056,140 @@ class BrowserThread(threading.Thread):
                     except Exception:
                         # 마지막 시도: JavaScript로 텍스트 추가
                         try:
-                            self.driver.execute_script(f"""
+                            self.driver.execute_script("""
                                 var el = arguments[0];
-                                if (el.isContentEditable) {{
-                                    el.textContent = el.textContent + `{remaining_text.replace('`', '\\`')}`;
-                                }} else if (el.tagName === 'TEXTAREA' || el.tagName === 'INPUT') {{
-                                    el.value = el.value + `{remaining_text.replace('`', '\\`')}`;
-                                }}
-                            """, element)
+                                if (el.isContentEditable) {
+                                    el.textContent = el.textContent + arguments[1];
+                                } else if (el.tagName === 'TEXTAREA' || el.tagName === 'INPUT') {
+                                    el.value = el.value + arguments[1];
+                                }
+                            """, element, remaining_text)
                         except Exception:
                             pass
                     break
         
         # 입력 완료
-        self.signals.update_status.emit("타이핑 완료")
+        if report_progress:
+            self.signals.update_status.emit("타이핑 완료")
     
     def set_typing_speed(self, min_delay, max_delay):
         """타이핑 속도 설정"""
         self.typing_speed = (min_delay, max_delay)
     
+    def tune_typing_speed(self):
+        """보정 문장으로 글자 누락률을 측정해 가장 빠른 안전 속도를 찾아 적용"""
+        if not self.driver:
+            self.signals.update_status.emit("브라우저가 실행되지 않았습니다.")
+            self.signals.speed_tuned.emit(0.0, 0.0, -1.0)
+            return
+            
+        try:
+            self.signals.update_status.emit("속도 측정을 위해 에디터를 찾는 중...")
+            self.find_and_switch_to_editor_iframe()
+            editor_element = self.find_editor_element()
+            if not editor_element:
+                self.signals.update_status.emit("에디터를 찾지 못했습니다. 글쓰기 페이지에서 다시 시도해주세요.")
+                self.signals.speed_tuned.emit(0.0, 0.0, -1.0)
+                return
+            
+            editor_element.click()
+            time.sleep(0.5)
+            
+            tuner = TypingSpeedTuner(
+                self.driver,
+                editor_element,
+                log=self.signals.update_status.emit,
+                should_stop=lambda: self.should_stop,
+                input_mode=self.input_mode
+            )
+            min_delay, max_delay, rate = tuner.tune()
+            self.set_typing_speed(min_delay, max_delay)
+            self.signals.speed_tuned.emit(min_delay, max_delay, rate)
+        except Exception as e:
+            self.signals.update_status.emit(f"속도 자동 조정 실패: {e}")
+            self.signals.speed_tuned.emit(0.0, 0.0, -1.0)
+    
+    def set_prefetch_enabled(self, enabled):
+        """다음 글쓰기 페이지 미리 열기 설정"""
+        self.prefetch_enabled = enabled
+        if not enabled and self.driver:
+            self.prefetcher.discard(self.driver)
+    
+    def prefetch_next_write_page(self):
+        """다음 글의 글쓰기 페이지를 백그라운드 탭에서 로딩"""
+        if not self.prefetch_enabled or not self.current_blog_id:
+            return
+        try:
+            if self.prefetcher.prefetch(self.driver, self.current_blog_id):
+                self.signals.update_status.emit("다음 글쓰기 페이지를 미리 여는 중...")
+        except Exception as e:
+            self.signals.update_status.emit(f"다음 글쓰기 페이지 미리 열기 실패: {e}")
+    
     def stop(self):
         """스레드 종료"""
         self.should_stop = True
+        if self.watchdog:
+            self.watchdog.stop()
+        with self.command_ready:
+            self.commands.clear()
+            self.command_ready.notify_all()
         if self.driver:
             self.driver.quit()
 
+class KeywordHighlighter(QSyntaxHighlighter):
+    """입력창에서 금지어(빨간색)와 주의어(노란색)를 바로 표시 (바뀐 문단만 다시 검사)"""
+    def __init__(self, document, scanner):
+        super().__init__(document)
+        self.scanner = scanner
+        self.formats = {}
+        for level, color in ((LEVEL_WARN, "#FFF1A8"), (LEVEL_BLOCK, "#FFB3B3")):
+            text_format = QTextCharFormat()
+            text_format.setBackground(QColor(color))
+            self.formats[level] = text_format
+    
+    def highlightBlock(self, text):
+        matches = self.scanner.scan(text)
+        if not matches:
+            return
+        
+        # 겹치면 금지어 색이 보이도록 금지어를 나중에 표시
+        matches.sort(key=lambda match: match.level == LEVEL_BLOCK)
+        astral = utf16_length(text) != len(text)  # 이모지 등이 있으면 Qt 위치(UTF-16)로 변환
+        for match in matches:
+            start, length = match.start, match.end - match.start
+            if astral:
+                start = utf16_length(text[:match.start])
+                length = utf16_length(text[match.start:match.end])
+            self.setFormat(start, length, self.formats[match.level])
+
 class NaverBlogTypingApp(QMainWindow):
     """네이버 블로그 타이핑 앱"""
     def __init__(self):
         super().__init__()
-        self.browser_thread = None
+        self.browser_thread = None  # 선택한 계정의 브라우저 (스레드 또는 워커 프로세스)
+        self.browser_workers = {}  # 계정 -> 실행 중인 브라우저
+        self.worker_status = {}  # 계정 -> 마지막 상태 메시지
+        self.worker_pool = ProcessWorkerPool()  # 계정별 워커 프로세스 이벤트 수집
+        self.dispatch_timer = QTimer(self)
+        self.dispatch_timer.timeout.connect(self.dispatch_worker_events)
+        self.orchestrator = None  # 여러 계정 동시 입력 (하나의 이벤트 루프에서 진행)
+        self.orchestrator_loop = None
+        self.orchestrator_signals = WorkerSignals()
+        self.orchestrator_signals.update_status.connect(self.update_status)
+        self.orchestrator_signals.typing_completed.connect(self.on_accounts_typing_completed)
+        self.text_source = None  # 파일에서 읽는 원고 (없으면 입력창 내용 사용)
+        self.image_pipeline = ImagePipeline()  # 이미지 변환 (별도 프로세스)
+        self.image_batch = None  # 글에 넣을 이미지 변환 작업
         self.account_manager = AccountManager()
+        self.duplicate_index = DuplicateIndex()  # 블로그별로 입력한 글 (같은 글 다시 입력 방지)
+        self.typing_post = []  # 입력 중인 글 [(블로그 ID, 제목, 본문 지문)], 완료되면 기록하고 중복 확인 색인에 추가
+        self.preflight_signals = PreflightSignals()  # 입력 전 검사 (큰 원고는 오래 걸리므로 별도 스레드)
+        self.preflight_signals.finished.connect(self.on_preflight_finished)
+        self.draft_library = DraftLibrary()  # 초안 폴더 전문 검색
+        self.draft_path = None  # 입력창에 불러온 초안 파일
+        threading.Thread(target=self.draft_library.sync, daemon=True).start()  # 바뀐 초안만 다시 색인
         self.settings = QSettings(ORGANIZATION, APP_NAME)
+        self.keyword_scanner = KeywordScanner(self.settings.value("keywords_file", KEYWORDS_FILE))  # 금지어 검사
         self.initUI()
         self.apply_style()
     
@@ -845,7 +1363,8 @@ class NaverBlogTypingApp(QMainWindow):
         
         # 최소 지연 시간
         self.min_delay_input = QDoubleSpinBox()
-        self.min_delay_input.setRange(0.01, 1.0)
+        self.min_delay_input.setDecimals(3)
+        self.min_delay_input.setRange(0.001, 1.0)
         self.min_delay_input.setSingleStep(0.01)
         self.min_delay_input.setValue(0.05)
         speed_layout.addWidget(QLabel("최소:"))
@@ -853,21 +1372,121 @@ class NaverBlogTypingApp(QMainWindow):
         
         # 최대 지연 시간
         self.max_delay_input = QDoubleSpinBox()
-        self.max_delay_input.setRange(0.01, 1.0)
+        self.max_delay_input.setDecimals(3)
+        self.max_delay_input.setRange(0.001, 1.0)
         self.max_delay_input.setSingleStep(0.01)
         self.max_delay_input.setValue(0.15)
         speed_layout.addWidget(QLabel("최대:"))
         speed_layout.addWidget(self.max_delay_input)
         
         speed_form.addRow("타이핑 속도 (초):", speed_layout)
+        
+        # 입력 방식 선택
+        self.input_mode_combo = QComboBox()
+        for mode, description in INPUT_MODES.items():
+            self.input_mode_combo.addItem(description, mode)
+        mode_index = self.input_mode_combo.findData(self.settings.value("input_mode", DEFAULT_INPUT_MODE))
+        if mode_index >= 0:
+            self.input_mode_combo.setCurrentIndex(mode_index)
+        self.input_mode_combo.setToolTip("한글 조합 입력은 완성된 음절/단어를 한 번에 확정합니다")
+        self.input_mode_combo.currentIndexChanged.connect(self.on_input_mode_changed)
+        speed_form.addRow("입력 방식:", self.input_mode_combo)
+        
+        # 페이지 로딩 전략 선택
+        self.page_load_combo = QComboBox()
+        for strategy, description in PAGE_LOAD_STRATEGIES.items():
+            self.page_load_combo.addItem(description, strategy)
+        saved_strategy = self.settings.value("page_load_strategy", DEFAULT_PAGE_LOAD_STRATEGY)
+        strategy_index = self.page_load_combo.findData(saved_strategy)
+        if strategy_index >= 0:
+            self.page_load_combo.setCurrentIndex(strategy_index)
+        self.page_load_combo.setToolTip("브라우저 시작 시 적용됩니다")
+        speed_form.addRow("페이지 로딩:", self.page_load_combo)
+        
+        # 크롬 실행 옵션 구성 선택
+        self.chrome_profile_combo = QComboBox()
+        for profile, description in CHROME_PROFILES.items():
+            self.chrome_profile_combo.addItem(description, profile)
+        profile_index = self.chrome_profile_combo.findData(
+            self.settings.value("chrome_profile", DEFAULT_CHROME_PROFILE))
+        if profile_index >= 0:
+            self.chrome_profile_combo.setCurrentIndex(profile_index)
+        self.chrome_profile_combo.setToolTip("브라우저 시작 시 적용됩니다")
+        speed_form.addRow("크롬 구성:", self.chrome_profile_combo)
+        
+        # 브라우저 표시 방식 선택
+        self.display_mode_combo = QComboBox()
+        for mode, description in DISPLAY_MODES.items():
+            self.display_mode_combo.addItem(description, mode)
+        display_index = self.display_mode_combo.findData(
+            self.settings.value("display_mode", DEFAULT_DISPLAY_MODE))
+        if display_index >= 0:
+            self.display_mode_combo.setCurrentIndex(display_index)
+        self.display_mode_combo.setToolTip("브라우저 시작 시 적용됩니다 (화면 없이 실행하려면 먼저 화면 표시로 로그인해 두세요)")
+        speed_form.addRow("브라우저 표시:", self.display_mode_combo)
+        
+        # 브라우저 재시작 기준 (글 수, 메모리 상한)
+        recycle_layout = QHBoxLayout()
+        self.recycle_posts_input = QSpinBox()
+        self.recycle_posts_input.setRange(0, 1000)
+        self.recycle_posts_input.setSpecialValueText("사용 안 함")
+        self.recycle_posts_input.setSuffix("개")
+        self.recycle_posts_input.setValue(self.settings.value("recycle_post_count", RECYCLE_POST_COUNT, type=int))
+        self.recycle_posts_input.valueChanged.connect(self.on_recycle_policy_changed)
+        recycle_layout.addWidget(QLabel("글:"))
+        recycle_layout.addWidget(self.recycle_posts_input)
+        
+        self.memory_ceiling_input = QSpinBox()
+        self.memory_ceiling_input.setRange(0, 32000)
+        self.memory_ceiling_input.setSingleStep(100)
+        self.memory_ceiling_input.setSpecialValueText("사용 안 함")
+        self.memory_ceiling_input.setSuffix("MB")
+        self.memory_ceiling_input.setValue(self.settings.value("memory_ceiling_mb", MEMORY_CEILING_MB, type=int))
+        self.memory_ceiling_input.valueChanged.connect(self.on_recycle_policy_changed)
+        recycle_layout.addWidget(QLabel("메모리:"))
+        recycle_layout.addWidget(self.memory_ceiling_input)
+        speed_form.addRow("브라우저 재시작:", recycle_layout)
         blog_layout.addLayout(speed_form)
         
+        # 다음 글쓰기 페이지 미리 열기
+        self.prefetch_checkbox = QCheckBox("입력 중 다음 글쓰기 페이지 미리 열기")
+        self.prefetch_checkbox.setChecked(self.settings.value("prefetch_write_page", False, type=bool))
+        self.prefetch_checkbox.toggled.connect(self.on_prefetch_toggled)
+        blog_layout.addWidget(self.prefetch_checkbox)
+        
+        # 입력 후 검증 및 복구
+        self.verify_checkbox = QCheckBox("입력 후 내용 검증 및 누락 글자 복구")
+        self.verify_checkbox.setChecked(self.settings.value("verify_typing", True, type=bool))
+        self.verify_checkbox.toggled.connect(self.on_verify_toggled)
+        blog_layout.addWidget(self.verify_checkbox)
+        
+        # Markdown/서식 블록 입력
+        self.format_blocks_checkbox = QCheckBox("Markdown/서식을 에디터 블록으로 입력")
+        self.format_blocks_checkbox.setToolTip("제목, 인용, 목록, 구분선을 블록마다 한 번에 붙여넣습니다")
+        self.format_blocks_checkbox.setChecked(self.settings.value("format_blocks", False, type=bool))
+        self.format_blocks_checkbox.toggled.connect(lambda checked: self.settings.setValue("format_blocks", checked))
+        blog_layout.addWidget(self.format_blocks_checkbox)
+        
+        # 계정별 워커 프로세스 실행
+        self.process_workers_checkbox = QCheckBox("계정별 프로세스로 실행 (여러 계정 동시 실행)")
+        self.process_workers_checkbox.setToolTip("계정마다 별도 프로세스에서 브라우저를 실행합니다. 브라우저 시작 시 적용됩니다")
+        self.process_workers_checkbox.setChecked(self.settings.value("process_workers", False, type=bool))
+        self.process_workers_checkbox.toggled.connect(lambda checked: self.settings.setValue("process_workers", checked))
+        blog_layout.addWidget(self.process_workers_checkbox)
+
         # 속도 적용 버튼
         self.apply_speed_button = QPushButton("속도 적용")
         self.apply_speed_button.clicked.connect(self.apply_typing_speed)
         self.apply_speed_button.setEnabled(False)
         blog_layout.addWidget(self.apply_speed_button)
         
+        # 속도 자동 조정 버튼 (글쓰기 페이지에서 누락률을 측정)
+        self.tune_speed_button = QPushButton("속도 자동 조정")
+        self.tune_speed_button.setToolTip("글쓰기 페이지에서 보정 문장을 입력해 글자 누락 없는 가장 빠른 속도를 찾습니다 (선택한 입력 방식으로 측정)")
+        self.tune_speed_button.clicked.connect(self.start_speed_tuning)
+        self.tune_speed_button.setEnabled(False)
+        blog_layout.addWidget(self.tune_speed_button)
+        
         blog_group.setLayout(blog_layout)
         top_layout.addWidget(blog_group)
         
@@ -888,8 +1507,38 @@ class NaverBlogTypingApp(QMainWindow):
         # 텍스트 입력 영역
         self.text_input = QTextEdit()
         self.text_input.setPlaceholderText("여기에 입력할 내용을 작성하세요...")
+        self.keyword_highlighter = KeywordHighlighter(self.text_input.document(), self.keyword_scanner)
         input_group_layout.addWidget(self.text_input, 1)
         
+        # 원고 파일 (큰 원고는 입력창에 올리지 않고 파일에서 문단 단위로 읽어 입력)
+        file_layout = QHBoxLayout()
+        self.source_label = QLabel("")
+        self.source_label.setStyleSheet("color: #888888;")
+        file_layout.addWidget(self.source_label, 1)
+        
+        self.load_file_button = QPushButton("원고 파일 불러오기")
+        self.load_file_button.clicked.connect(self.toggle_text_source)
+        file_layout.addWidget(self.load_file_button)
+        
+        self.image_button = QPushButton("이미지 추가")
+        self.image_button.setToolTip("선택하는 즉시 크기 조정/메타데이터 제거를 시작하고, 본문 입력 후 한 번에 업로드합니다")
+        self.image_button.clicked.connect(self.toggle_images)
+        file_layout.addWidget(self.image_button)
+        
+        self.keywords_button = QPushButton("금지어 목록")
+        self.keywords_button.setToolTip("한 줄에 하나씩, '!'로 시작하면 금지어, 나머지는 주의어로 입력창에 표시하고 입력 전에 확인합니다")
+        self.keywords_button.clicked.connect(self.select_keywords_file)
+        file_layout.addWidget(self.keywords_button)
+        
+        self.find_draft_button = QPushButton("초안 찾기")
+        self.find_draft_button.clicked.connect(self.open_draft_library)
+        file_layout.addWidget(self.find_draft_button)
+        
+        self.save_draft_button = QPushButton("초안 저장")
+        self.save_draft_button.clicked.connect(self.save_draft)
+        file_layout.addWidget(self.save_draft_button)
+        input_group_layout.addLayout(file_layout)
+        
         # 타이핑 버튼
         self.type_button = QPushButton("타이핑 시작")
         self.type_button.clicked.connect(self.start_typing)
@@ -915,6 +1564,18 @@ class NaverBlogTypingApp(QMainWindow):
         """)
         input_group_layout.addWidget(self.type_button)
         
+        # 여러 블로그 동시 입력 버튼 (블로그 목록의 모든 블로그에 탭을 열어 병렬 입력)
+        self.type_all_blogs_button = QPushButton("모든 블로그에 동시 입력")
+        self.type_all_blogs_button.clicked.connect(self.start_typing_all_blogs)
+        self.type_all_blogs_button.setEnabled(False)
+        input_group_layout.addWidget(self.type_all_blogs_button)
+        
+        # 여러 계정 동시 입력 버튼 (계정마다 브라우저를 띄워 각 계정의 모든 블로그에 입력)
+        self.type_all_accounts_button = QPushButton("모든 계정에 동시 입력")
+        self.type_all_accounts_button.setToolTip("저장된 모든 계정의 블로그에 입력합니다. 발행은 각 브라우저에서 직접 확인 후 진행하세요")
+        self.type_all_accounts_button.clicked.connect(self.start_typing_all_accounts)
+        input_group_layout.addWidget(self.type_all_accounts_button)
+        
         input_group.setLayout(input_group_layout)
         input_layout.addWidget(input_group)
         
@@ -929,6 +1590,15 @@ class NaverBlogTypingApp(QMainWindow):
         self.status_label.setAlignment(Qt.AlignLeft | Qt.AlignVCenter)
         status_layout.addWidget(self.status_label, 1)
         
+        # 브라우저 메모리/CPU 사용량
+        self.resource_label = QLabel("")
+        self.resource_label.setToolTip("브라우저 전체 프로세스 메모리, CPU, 브라우저 시작 후 작성한 글 수")
+        status_layout.addWidget(self.resource_label)
+        
+        # 실행 중인 계정 워커 수 (툴팁에 계정별 상태)
+        self.workers_label = QLabel("")
+        status_layout.addWidget(self.workers_label)
+        
         # 진행 표시줄
         self.progress_bar = QProgressBar()
         self.progress_bar.setRange(0, 0)  # 불확정 진행
@@ -1135,6 +1805,18 @@ class NaverBlogTypingApp(QMainWindow):
             
             # 블로그 목록 업데이트
             self.update_blog_list(account)
+            
+            # 계정별 자동 조정 속도 적용
+            self.load_tuned_speed()
+        
+        # 계정별 프로세스로 실행 중인 계정이면 해당 브라우저로 전환
+        if self.browser_workers:
+            browser = self.browser_workers.get(username)
+            if browser is not None or self.process_workers_checkbox.isChecked():
+                self.browser_thread = browser
+                alive = bool(browser and browser.is_alive())
+                self.on_browser_ready(alive)
+                self.update_status(self.worker_status.get(username, "") if alive else "이 계정의 브라우저가 실행되지 않았습니다.")
     
     def add_account_dialog(self):
         """계정 추가 다이얼로그"""
@@ -1213,15 +1895,22 @@ class NaverBlogTypingApp(QMainWindow):
     def start_browser(self):
         """브라우저 시작"""
         try:
-            # 이미 실행 중인 스레드가 있다면 종료
-            if self.browser_thread and self.browser_thread.is_alive():
-                self.browser_thread.stop()
-                # 스레드가 완전히 종료될 때까지 잠시 대기
-                time.sleep(1)
-                
             # 입력 정보 가져오기
             username = self.username_input.text().strip()
             password = self.password_input.text().strip()
+            account = self.account_combo.currentData() or username
+            use_process = self.process_workers_checkbox.isChecked()
+            
+            # 이미 실행 중인 브라우저가 있다면 종료 (계정별 프로세스 모드에서는 다른 계정 프로세스 유지)
+            for key, browser in list(self.browser_workers.items()):
+                if use_process and key != account and not isinstance(browser, BrowserThread):
+                    continue
+                self.browser_workers.pop(key, None)
+                if browser.is_alive():
+                    browser.stop()
+                    if isinstance(browser, BrowserThread):
+                        # 스레드가 완전히 종료될 때까지 잠시 대기
+                        time.sleep(1)
             
             # 자동 로그인 여부 확인
             if not self.autologin_checkbox.isChecked():
@@ -1233,12 +1922,40 @@ class NaverBlogTypingApp(QMainWindow):
             self.progress_bar.setVisible(True)
             self.update_status("브라우저를 시작하는 중...")
             
-            # 브라우저 스레드 시작
-            self.browser_thread = BrowserThread(username, password, self.screen_size)
-            self.browser_thread.signals.update_status.connect(self.update_status)
-            self.browser_thread.signals.browser_ready.connect(self.on_browser_ready)
-            self.browser_thread.signals.typing_completed.connect(self.on_typing_completed)
+            # 페이지 로딩 전략 저장
+            page_load_strategy = self.page_load_combo.currentData()
+            self.settings.setValue("page_load_strategy", page_load_strategy)
+            
+            # 크롬 실행 옵션 구성 저장
+            chrome_profile = self.chrome_profile_combo.currentData()
+            self.settings.setValue("chrome_profile", chrome_profile)
+            
+            # 브라우저 표시 방식 저장
+            display_mode = self.display_mode_combo.currentData()
+            self.settings.setValue("display_mode", display_mode)
+            
+            # 브라우저 스레드 시작 (계정별 프로세스 모드면 같은 스레드를 워커 프로세스에서 실행)
+            signals = WorkerSignals()
+            browser_args = (username, password, self.screen_size, page_load_strategy,
+                            chrome_profile, display_mode)
+            if use_process:
+                self.browser_thread = self.worker_pool.create(BrowserThread, signals, *browser_args)
+                self.dispatch_timer.start(DISPATCH_INTERVAL)
+            else:
+                self.browser_thread = BrowserThread(*browser_args, signals=signals)
+            self.browser_workers[account] = self.browser_thread
+            self.worker_status[account] = "브라우저를 시작하는 중..."
+            self.connect_browser_signals(signals, account)
+            self.browser_thread.set_recycle_policy(self.recycle_posts_input.value(),
+                                                   self.memory_ceiling_input.value())
+            
+            # 이 계정과 컴퓨터에서 자동 조정한 속도가 있으면 적용
+            self.load_tuned_speed()
+            self.browser_thread.set_typing_speed(self.min_delay_input.value(), self.max_delay_input.value())
             
+            self.browser_thread.set_prefetch_enabled(self.prefetch_checkbox.isChecked())
+            self.browser_thread.verify_typing = self.verify_checkbox.isChecked()
+            self.browser_thread.input_mode = self.input_mode_combo.currentData()
             self.browser_thread.start()
             
             # 계정 정보 저장 (입력한 정보가 있을 경우)
@@ -1261,6 +1978,45 @@ class NaverBlogTypingApp(QMainWindow):
             self.start_browser_button.setEnabled(True)
             self.progress_bar.setVisible(False)
     
+    def connect_browser_signals(self, signals, account):
+        """브라우저 신호 연결 (선택한 계정의 신호만 화면에 반영하고 다른 계정은 상태만 기록)"""
+        signals.update_status.connect(partial(self.on_worker_signal, account, self.update_status))
+        signals.browser_ready.connect(partial(self.on_worker_signal, account, self.on_browser_ready))
+        signals.typing_completed.connect(partial(self.on_worker_signal, account, self.on_typing_completed))
+        signals.speed_tuned.connect(partial(self.on_worker_signal, account, self.on_speed_tuned))
+        signals.resource_usage.connect(partial(self.on_worker_signal, account, self.on_resource_usage))
+    
+    def on_worker_signal(self, account, handler, *args):
+        """계정별 브라우저 신호 처리"""
+        if handler == self.update_status:
+            self.worker_status[account] = args[0]
+        elif handler == self.on_typing_completed:
+            self.worker_status[account] = args[1]
+        elif handler == self.on_browser_ready and not args[0]:
+            self.worker_status[account] = "브라우저가 종료되었습니다."
+        self.refresh_workers_label()
+        
+        if self.browser_workers.get(account) is self.browser_thread:
+            handler(*args)
+    
+    def dispatch_worker_events(self):
+        """워커 프로세스 이벤트를 신호로 전달 (실행 중인 워커가 없으면 확인 중지)"""
+        self.worker_pool.dispatch()
+        if not self.worker_pool.workers:
+            self.dispatch_timer.stop()
+        self.refresh_workers_label()
+    
+    def refresh_workers_label(self):
+        """실행 중인 계정 수와 계정별 마지막 상태 표시"""
+        running = [account for account, browser in self.browser_workers.items() if browser.is_alive()]
+        if len(running) < 2:
+            self.workers_label.setText("")
+            self.workers_label.setToolTip("")
+            return
+        self.workers_label.setText(f"실행 중인 계정 {len(running)}개")
+        self.workers_label.setToolTip("\n".join(
+            f"{account or '기본'}: {self.worker_status.get(account, '')}" for account in running))
+    
     def goto_blog(self):
         """블로그로 이동"""
         if not self.browser_thread or not self.browser_thread.is_alive():
@@ -1273,7 +2029,7 @@ class NaverBlogTypingApp(QMainWindow):
             return
             
         # 블로그로 이동
-        self.browser_thread.navigate_to_blog(blog_id)
+        self.browser_thread.submit(self.browser_thread.navigate_to_blog, blog_id)
         
         # 현재 계정에 블로그 추가
         current_account = self.account_manager.get_current_account()
@@ -1294,7 +2050,7 @@ class NaverBlogTypingApp(QMainWindow):
             return
             
         # 글쓰기 페이지로 이동
-        self.browser_thread.navigate_to_write_page(blog_id)
+        self.browser_thread.submit(self.browser_thread.navigate_to_write_page, blog_id)
     
     def apply_typing_speed(self):
         """타이핑 속도 적용"""
@@ -1319,23 +2075,504 @@ class NaverBlogTypingApp(QMainWindow):
         self.settings.setValue("typing_speed_min", min_delay)
         self.settings.setValue("typing_speed_max", max_delay)
     
+    def start_speed_tuning(self):
+        """타이핑 속도 자동 조정 시작"""
+        if not self.browser_thread or not self.browser_thread.is_alive():
+            self.update_status("브라우저가 실행되지 않았습니다.")
+            return
+        
+        # UI 업데이트
+        self.tune_speed_button.setEnabled(False)
+        self.type_button.setEnabled(False)
+        self.progress_bar.setVisible(True)
+        
+        # 측정 시작 (브라우저 스레드에서 순서대로 실행)
+        self.browser_thread.submit(self.browser_thread.tune_typing_speed)
+    
+    def on_speed_tuned(self, min_delay, max_delay, rate):
+        """속도 자동 조정 완료 처리"""
+        self.tune_speed_button.setEnabled(True)
+        self.type_button.setEnabled(True)
+        self.progress_bar.setVisible(False)
+        
+        if rate < 0:
+            return
+        
+        self.min_delay_input.setValue(min_delay)
+        self.max_delay_input.setValue(max_delay)
+        
+        # 계정과 컴퓨터별로 저장
+        key = tuned_speed_key(self.account_combo.currentData())
+        self.settings.setValue(f"{key}/min_delay", min_delay)
+        self.settings.setValue(f"{key}/max_delay", max_delay)
+        self.settings.setValue(f"{key}/loss_rate", rate)
+        self.update_status(f"타이핑 속도가 {min_delay}초 ~ {max_delay}초로 자동 조정되었습니다. (누락률 {rate * 100:.1f}%)")
+    
+    def load_tuned_speed(self):
+        """현재 계정과 컴퓨터에서 자동 조정한 속도를 입력란에 적용"""
+        key = tuned_speed_key(self.account_combo.currentData())
+        min_delay = self.settings.value(f"{key}/min_delay", 0.0, type=float)
+        max_delay = self.settings.value(f"{key}/max_delay", 0.0, type=float)
+        if min_delay and max_delay:
+            self.min_delay_input.setValue(min_delay)
+            self.max_delay_input.setValue(max_delay)
+            return True
+        return False
+    
+    def on_prefetch_toggled(self, checked):
+        """다음 글쓰기 페이지 미리 열기 설정 변경"""
+        self.settings.setValue("prefetch_write_page", checked)
+        if self.browser_thread and self.browser_thread.is_alive():
+            self.browser_thread.set_prefetch_enabled(checked)
+    
+    def on_recycle_policy_changed(self, value):
+        """브라우저 재시작 기준 저장 및 실행 중인 브라우저에 적용"""
+        self.settings.setValue("recycle_post_count", self.recycle_posts_input.value())
+        self.settings.setValue("memory_ceiling_mb", self.memory_ceiling_input.value())
+        if self.browser_thread and self.browser_thread.is_alive():
+            self.browser_thread.set_recycle_policy(self.recycle_posts_input.value(),
+                                                   self.memory_ceiling_input.value())
+    
+    def on_resource_usage(self, rss_mb, cpu_percent, posts):
+        """브라우저 사용량 표시"""
+        self.resource_label.setText(f"메모리 {rss_mb:.0f}MB · CPU {cpu_percent:.0f}% · 글 {posts}개")
+    
+    def on_input_mode_changed(self, index):
+        """입력 방식 변경"""
+        mode = self.input_mode_combo.itemData(index)
+        self.settings.setValue("input_mode", mode)
+        if self.browser_thread:
+            self.browser_thread.input_mode = mode
+    
+    def on_verify_toggled(self, checked):
+        """입력 후 검증 설정 변경"""
+        self.settings.setValue("verify_typing", checked)
+        if self.browser_thread:
+            self.browser_thread.verify_typing = checked
+    
     def start_typing(self):
         """타이핑 시작"""
         if not self.browser_thread or not self.browser_thread.is_alive():
             self.update_status("브라우저가 실행되지 않았습니다.")
             return
             
+        # 원고 파일이 있으면 파일에서 바로 읽어 입력 (입력창은 미리보기)
+        if self.text_source:
+            text = self.text_source
+        else:
+            text = self.text_input.toPlainText()
+            if not text:
+                QMessageBox.warning(self, "입력 오류", "입력할 텍스트를 입력해주세요.")
+                return
+            
+        blog_id = self.blog_combo.currentData() or self.blog_combo.currentText().strip()
+        self.start_preflight(text, [blog_id], self.begin_typing, (self.type_button,))
+    
+    def start_preflight(self, text, blog_ids, proceed, buttons):
+        """금지어와 블로그별 중복 글을 별도 스레드에서 확인하고 끝나면 proceed(입력할 블로그 목록, 검사 결과)로 이어서 입력
+        
+        확인하는 동안 buttons를 비활성화하고 입력을 취소하면 다시 활성화한다.
+        """
+        self.reload_keywords()
+        for button in buttons:
+            button.setEnabled(False)
+        self.update_status("금지어/중복 글 확인 중...")
+        request = {"text": text, "blog_ids": blog_ids, "proceed": proceed, "buttons": buttons}
+        threading.Thread(target=self.run_preflight, args=(request,), daemon=True).start()
+    
+    def run_preflight(self, request):
+        """입력 전 검사 (별도 스레드에서 실행, 결과는 신호로 GUI 스레드에 전달)
+        
+        본문 지문은 한 번만 계산해 블로그마다 확인하고, 입력이 끝나면 중복 확인 색인에 그대로 추가한다.
+        """
+        result = dict(request, keywords=[], title="", fingerprint=None, duplicates={})
+        text = request["text"]
+        try:
+            result["keywords"] = self.keyword_scanner.scan_source(text)
+        except Exception as e:
+            print(f"금지어 검사 실패: {e}")
+        try:
+            result["title"] = source_title(text)
+            result["fingerprint"] = fingerprint(text)
+            for blog_id in request["blog_ids"]:
+                duplicate = self.duplicate_index.check_fingerprint(blog_id, result["fingerprint"])
+                if duplicate is not None:
+                    result["duplicates"][blog_id] = duplicate
+        except Exception as e:
+            print(f"중복 글 확인 실패: {e}")
+        self.preflight_signals.finished.emit(result)
+    
+    def on_preflight_finished(self, result):
+        """입력 전 검사 결과 확인 후 입력할 블로그로 이어서 입력"""
+        if not self.confirm_matches(result["keywords"]):
+            self.cancel_preflight(result)
+            return
+        blog_ids = self.confirm_duplicates(result["blog_ids"], result["duplicates"])
+        if not blog_ids:
+            self.cancel_preflight(result)
+            return
+        result["proceed"](blog_ids, result)
+    
+    def cancel_preflight(self, result, message="입력을 취소했습니다."):
+        """입력 전 검사 후 입력하지 않을 때 버튼 복원"""
+        for button in result["buttons"]:
+            button.setEnabled(True)
+        self.update_status(message)
+    
+    def confirm_duplicates(self, blog_ids, duplicates):
+        """같거나 거의 같은 글이 있는 블로그 확인, 입력할 블로그 목록 반환 (취소하면 빈 목록)
+        
+        블로그가 하나면 그래도 입력할지, 여러 곳이면 중복 글이 있는 블로그를 건너뛸지 묻는다.
+        """
+        if not duplicates:
+            return blog_ids
+        if len(blog_ids) == 1:
+            reply = QMessageBox.question(
+                self, "중복 글",
+                f"{describe_duplicate(duplicates[blog_ids[0]])}\n같은 글을 다시 올리면 스팸으로 분류될 수 있습니다. 그래도 입력할까요?",
+                QMessageBox.Yes | QMessageBox.No, QMessageBox.No)
+            return blog_ids if reply == QMessageBox.Yes else []
+        
+        details = "\n".join(f"{blog_id}: {describe_duplicate(duplicates[blog_id])}"
+                            for blog_id in blog_ids if blog_id in duplicates)
+        reply = QMessageBox.question(
+            self, "중복 글",
+            f"{details}\n같은 글을 다시 올리면 스팸으로 분류될 수 있습니다.\n"
+            "예: 이 블로그는 건너뛰고 입력 / 아니요: 모든 블로그에 입력",
+            QMessageBox.Yes | QMessageBox.No | QMessageBox.Cancel, QMessageBox.Yes)
+        if reply == QMessageBox.Yes:
+            return [blog_id for blog_id in blog_ids if blog_id not in duplicates]
+        if reply == QMessageBox.No:
+            return blog_ids
+        return []
+    
+    def begin_typing(self, blog_ids, result):
+        """입력 전 검사를 마친 글을 선택한 블로그에 입력"""
+        text = result["text"]
+        if not self.browser_thread or not self.browser_thread.is_alive():
+            self.cancel_preflight(result, "브라우저가 실행되지 않았습니다.")
+            return
+        self.typing_post = [(blog_id, result["title"], result["fingerprint"]) for blog_id in blog_ids]
+            
+        # UI 업데이트
+        self.progress_bar.setVisible(True)
+        
+        # 서식 블록 입력 (원고 파일은 Markdown으로, 입력창은 서식 HTML로 해석)
+        if self.format_blocks_checkbox.isChecked():
+            if not isinstance(text, str):
+                blocks = MarkdownBlocks(text)
+            else:
+                blocks = parse_rich_text(self.text_input.toHtml())
+            self.browser_thread.submit(self.browser_thread.type_blocks, blocks, self.image_batch)
+            return
+
+        # 타이핑 시작 (브라우저 스레드에서 순서대로 실행)
+        self.browser_thread.submit(self.browser_thread.type_text, text, self.image_batch)
+    
+    def toggle_text_source(self):
+        """원고 파일 불러오기 / 해제"""
+        if self.text_source:
+            self.clear_text_source()
+            self.text_input.clear()
+            return
+        
+        path, _ = QFileDialog.getOpenFileName(self, "원고 파일 선택", "", "텍스트 파일 (*.txt *.md);;모든 파일 (*)")
+        if path:
+            self.open_text_source(path)
+    
+    def open_text_source(self, path):
+        """원고 파일을 열고 입력창을 미리보기로 전환, 열었으면 True"""
+        try:
+            source = FileSource(path)
+            preview = source.preview()
+        except Exception as e:
+            QMessageBox.warning(self, "파일 오류", f"원고 파일을 열 수 없습니다.\n{e}")
+            return False
+        
+        # 입력창은 읽기 전용 미리보기로 전환
+        self.text_source = source
+        self.text_input.setPlainText(preview)
+        self.text_input.setReadOnly(True)
+        self.source_label.setText(f"원고 파일: {source.name} ({source.size / 1024:.0f}KB, 미리보기)")
+        self.load_file_button.setText("원고 파일 해제")
+        self.draft_path = None
+        return True
+    
+    def toggle_images(self):
+        """이미지 추가 / 해제 (추가하면 바로 백그라운드 변환 시작)"""
+        if self.image_batch:
+            self.clear_images()
+            return
+        
+        paths, _ = QFileDialog.getOpenFileNames(self, "이미지 선택", "", f"{IMAGE_FILE_FILTER};;모든 파일 (*)")
+        if not paths:
+            return
+        
+        try:
+            self.image_batch = self.image_pipeline.submit(paths)
+        except Exception as e:
+            QMessageBox.warning(self, "이미지 오류", f"이미지를 준비할 수 없습니다.\n{e}")
+            return
+        self.image_button.setText(f"이미지 {len(paths)}장 해제")
+    
+    def clear_images(self):
+        """추가한 이미지 해제"""
+        self.image_batch = None
+        self.image_button.setText("이미지 추가")
+    
+    def clear_text_source(self):
+        """원고 파일 해제 후 입력창 편집 가능 상태로 복귀"""
+        self.text_source = None
+        self.text_input.setReadOnly(False)
+        self.source_label.setText("")
+        self.load_file_button.setText("원고 파일 불러오기")
+    
+    def open_draft_library(self):
+        """초안 찾기 (입력하는 대로 제목/본문 검색, 선택한 초안을 입력창에 불러오기)"""
+        threading.Thread(target=self.draft_library.sync, daemon=True).start()  # 밖에서 바꾼 초안 반영
+        
+        dialog = QDialog(self)
+        dialog.setWindowTitle("초안 찾기")
+        dialog.resize(600, 450)
+        layout = QVBoxLayout(dialog)
+        
+        search_input = QLineEdit()
+        search_input.setPlaceholderText("제목이나 본문으로 검색 (여러 단어는 모두 포함된 초안)")
+        layout.addWidget(search_input)
+        
+        result_list = QListWidget()
+        result_list.itemDoubleClicked.connect(dialog.accept)
+        layout.addWidget(result_list, 1)
+        
+        button_box = QDialogButtonBox(QDialogButtonBox.Cancel)
+        button_box.addButton("불러오기", QDialogButtonBox.AcceptRole)
+        button_box.accepted.connect(dialog.accept)
+        button_box.rejected.connect(dialog.reject)
+        layout.addWidget(button_box)
+        
+        def search():
+            result_list.clear()
+            for draft in self.draft_library.search(search_input.text()):
+                when = time.strftime("%Y-%m-%d %H:%M", time.localtime(draft.mtime))
+                item = QListWidgetItem(f"{draft.title}  ({when})" + (f"\n{draft.snippet}" if draft.snippet else ""))
+                item.setData(Qt.UserRole, draft.path)
+                result_list.addItem(item)
+            if result_list.count():
+                result_list.setCurrentRow(0)
+        
+        # 입력이 잠시 멈추면 검색
+        search_timer = QTimer(dialog)
+        search_timer.setSingleShot(True)
+        search_timer.timeout.connect(search)
+        search_input.textChanged.connect(lambda: search_timer.start(150))
+        search()
+        
+        if dialog.exec_() == QDialog.Accepted and result_list.currentItem():
+            self.load_draft(result_list.currentItem().data(Qt.UserRole))
+    
+    def load_draft(self, path):
+        """초안을 입력창에 불러오기 (큰 원고는 원고 파일로 열기)"""
+        try:
+            large = os.path.getsize(path) > PREVIEW_SIZE
+            content = None if large else read_draft(path)
+        except OSError as e:
+            QMessageBox.warning(self, "파일 오류", f"초안을 열 수 없습니다.\n{e}")
+            return
+        
+        if self.text_source:
+            self.clear_text_source()
+        if large:
+            self.open_text_source(path)
+            return
+        self.text_input.setPlainText(content)
+        self.draft_path = path
+        self.update_status(f"초안을 불러왔습니다: {os.path.basename(path)}")
+    
+    def save_draft(self):
+        """입력창 내용을 초안으로 저장 (불러온 초안이면 덮어쓸지 확인)"""
+        if self.text_source:
+            QMessageBox.warning(self, "초안 저장", "원고 파일은 이미 파일로 저장되어 있습니다.")
+            return
+        text = self.text_input.toPlainText()
+        if not text.strip():
+            QMessageBox.warning(self, "초안 저장", "저장할 내용이 없습니다.")
+            return
+        
+        path = None
+        if self.draft_path:
+            reply = QMessageBox.question(
+                self, "초안 저장",
+                f"불러온 초안({os.path.basename(self.draft_path)})에 덮어쓸까요?\n'아니요'를 누르면 새 초안으로 저장합니다.",
+                QMessageBox.Yes | QMessageBox.No | QMessageBox.Cancel, QMessageBox.Yes)
+            if reply == QMessageBox.Cancel:
+                return
+            if reply == QMessageBox.Yes:
+                path = self.draft_path
+        try:
+            self.draft_path = self.draft_library.save(text, path)
+        except Exception as e:
+            QMessageBox.warning(self, "초안 저장", f"초안을 저장할 수 없습니다.\n{e}")
+            return
+        self.update_status(f"초안을 저장했습니다: {os.path.basename(self.draft_path)}")
+    
+    def select_keywords_file(self):
+        """금지어 목록 파일 선택 (선택한 파일은 다음 실행에도 사용)"""
+        path, _ = QFileDialog.getOpenFileName(self, "금지어 목록 선택", self.keyword_scanner.keywords_file,
+                                              "텍스트 파일 (*.txt);;모든 파일 (*)")
+        if not path:
+            return
+        
+        self.keyword_scanner.set_keywords_file(path)
+        self.settings.setValue("keywords_file", path)
+        self.keyword_highlighter.rehighlight()
+        self.update_status(f"금지어 목록: {os.path.basename(path)} ({len(self.keyword_scanner.automaton)}개)")
+    
+    def reload_keywords(self):
+        """목록 파일이 바뀌었으면 다시 읽고 입력창 표시도 갱신"""
+        if self.keyword_scanner.reload_if_changed():
+            self.keyword_highlighter.rehighlight()
+    
+    def confirm_matches(self, matches):
+        """금지어 검사 결과가 있으면 그래도 입력할지 확인, 입력하면 True"""
+        if not matches:
+            return True
+        
+        blocked = has_blocked(matches)
+        reply = QMessageBox.question(
+            self, "금지어 검사",
+            f"{summarize_matches(matches)}\n이런 표현이 있으면 발행 후 글이 숨겨질 수 있습니다. 그래도 입력할까요?",
+            QMessageBox.Yes | QMessageBox.No, QMessageBox.No if blocked else QMessageBox.Yes)
+        return reply == QMessageBox.Yes
+    
+    def start_typing_all_blogs(self):
+        """블로그 목록의 모든 블로그에 동시에 타이핑 시작"""
+        if not self.browser_thread or not self.browser_thread.is_alive():
+            self.update_status("브라우저가 실행되지 않았습니다.")
+            return
+            
+        if self.text_source:
+            QMessageBox.warning(self, "입력 오류", "여러 블로그 동시 입력은 입력창의 내용만 지원합니다. 원고 파일을 해제해주세요.")
+            return
+        
         text = self.text_input.toPlainText()
         if not text:
             QMessageBox.warning(self, "입력 오류", "입력할 텍스트를 입력해주세요.")
             return
-            
+        
+        blog_ids = []
+        for i in range(self.blog_combo.count()):
+            blog_id = self.blog_combo.itemData(i) or self.blog_combo.itemText(i).strip()
+            if blog_id and blog_id not in blog_ids:
+                blog_ids.append(blog_id)
+        if not blog_ids:
+            QMessageBox.warning(self, "입력 오류", "블로그 목록이 비어 있습니다.")
+            return
+        
+        reply = QMessageBox.question(
+            self,
+            "여러 블로그 동시 입력",
+            f"다음 블로그에 탭을 열어 동시에 입력합니다.\n{', '.join(blog_ids)}",
+            QMessageBox.Yes | QMessageBox.No,
+            QMessageBox.No
+        )
+        if reply != QMessageBox.Yes:
+            return
+        
+        # 금지어와 블로그마다 중복 글을 확인한 뒤 입력
+        self.start_preflight(text, blog_ids, self.begin_typing_all_blogs,
+                             (self.type_button, self.type_all_blogs_button))
+    
+    def begin_typing_all_blogs(self, blog_ids, result):
+        """입력 전 검사를 마친 글을 여러 블로그에 동시에 입력"""
+        if not self.browser_thread or not self.browser_thread.is_alive():
+            self.cancel_preflight(result, "브라우저가 실행되지 않았습니다.")
+            return
+        
         # UI 업데이트
-        self.type_button.setEnabled(False)
         self.progress_bar.setVisible(True)
         
-        # 타이핑 시작 (새로운 스레드에서 실행)
-        threading.Thread(target=self.browser_thread.type_text, args=(text,), daemon=True).start()
+        # 입력 시작 (브라우저 스레드에서 순서대로 실행)
+        self.typing_post = [(blog_id, result["title"], result["fingerprint"]) for blog_id in blog_ids]
+        self.browser_thread.submit(self.browser_thread.type_text_to_blogs, blog_ids, result["text"])
+    
+    def start_typing_all_accounts(self):
+        """저장된 모든 계정의 블로그에 동시에 입력 (계정별 브라우저를 하나의 이벤트 루프에서 진행)"""
+        if self.text_source:
+            QMessageBox.warning(self, "입력 오류", "여러 계정 동시 입력은 입력창의 내용만 지원합니다. 원고 파일을 해제해주세요.")
+            return
+        
+        text = self.text_input.toPlainText()
+        if not text:
+            QMessageBox.warning(self, "입력 오류", "입력할 텍스트를 입력해주세요.")
+            return
+        
+        jobs = []
+        for account in self.account_manager.accounts:
+            for blog in account.get("blogs", []):
+                jobs.append({"account": account["username"], "password": account.get("password", ""),
+                             "blog_id": blog["id"], "content": text})
+        if not jobs:
+            QMessageBox.warning(self, "입력 오류", "블로그가 등록된 계정이 없습니다.")
+            return
+        
+        accounts = len({job["account"] for job in jobs})
+        reply = QMessageBox.question(
+            self,
+            "여러 계정 동시 입력",
+            f"계정 {accounts}개의 블로그 {len(jobs)}곳에 동시에 입력합니다.",
+            QMessageBox.Yes | QMessageBox.No,
+            QMessageBox.No
+        )
+        if reply != QMessageBox.Yes:
+            return
+        
+        # 금지어와 블로그마다 중복 글을 확인한 뒤 입력
+        self.start_preflight(text, [job["blog_id"] for job in jobs], partial(self.begin_typing_all_accounts, jobs),
+                             (self.type_all_accounts_button,))
+    
+    def begin_typing_all_accounts(self, jobs, blog_ids, result):
+        """입력 전 검사를 마친 글을 여러 계정의 블로그에 동시에 입력 (중복 글로 건너뛴 블로그 제외)"""
+        jobs = [job for job in jobs if job["blog_id"] in blog_ids]
+        
+        # 이벤트 루프와 세션은 계속 유지 (입력 후 각 브라우저에서 발행)
+        if self.orchestrator is None:
+            self.orchestrator_loop = OrchestratorLoop()
+            self.orchestrator = Orchestrator(
+                display_mode=self.display_mode_combo.currentData(),
+                chrome_profile=self.chrome_profile_combo.currentData(),
+                page_load_strategy=self.page_load_combo.currentData(),
+                log=self.orchestrator_signals.update_status.emit
+            )
+        self.orchestrator.typing_speed = (self.min_delay_input.value(), self.max_delay_input.value())
+        self.orchestrator.input_mode = self.input_mode_combo.currentData()
+        
+        self.progress_bar.setVisible(True)
+        future = self.orchestrator_loop.submit(self.orchestrator.run(jobs, publish=False))
+        future.add_done_callback(self.report_accounts_typing)
+    
+    def report_accounts_typing(self, future):
+        """여러 계정 입력 결과 전달 (이벤트 루프 스레드에서 호출되므로 신호로 전달)"""
+        try:
+            results = future.result()
+        except Exception as e:
+            self.orchestrator_signals.typing_completed.emit(False, f"여러 계정 입력 실패: {e}")
+            return
+        failed = [detail for success, detail in results if not success]
+        if failed:
+            message = f"{len(results) - len(failed)}곳 입력 완료, 실패 {len(failed)}곳: {', '.join(failed)}"
+        else:
+            message = f"{len(results)}곳에 입력이 완료되었습니다. 각 브라우저에서 확인 후 발행하세요."
+        self.orchestrator_signals.typing_completed.emit(not failed, message)
+    
+    def on_accounts_typing_completed(self, success, message):
+        """여러 계정 입력 완료 처리"""
+        self.type_all_accounts_button.setEnabled(True)
+        self.progress_bar.setVisible(False)
+        self.update_status(message)
+        if success:
+            QMessageBox.information(self, "입력 완료", message)
+        else:
+            QMessageBox.warning(self, "입력 결과", message)
     
     def on_browser_ready(self, success):
         """브라우저 준비 완료 처리"""
@@ -1343,18 +2580,43 @@ class NaverBlogTypingApp(QMainWindow):
         self.goto_blog_button.setEnabled(success)
         self.goto_write_button.setEnabled(success)
         self.apply_speed_button.setEnabled(success)
+        self.tune_speed_button.setEnabled(success)
         self.type_button.setEnabled(success)
+        self.type_all_blogs_button.setEnabled(success)
         self.progress_bar.setVisible(False)
     
     def on_typing_completed(self, success, message):
         """타이핑 완료 처리"""
         self.update_status(message)
         self.type_button.setEnabled(True)
+        self.type_all_blogs_button.setEnabled(True)
         self.progress_bar.setVisible(False)
+        typed_posts, self.typing_post = self.typing_post, []  # 실패해도 다음 입력에 남지 않도록 비움
         
         if success:
+            # 글 작성 기록 (제목은 본문 첫 줄, 입력 전 검사에서 원고에서 읽은 값)
+            account = self.account_manager.get_current_account()
+            # 입력을 시작할 때의 블로그마다 기록 (입력 중에 블로그 선택이 바뀌어도 실제로 입력한 블로그)
+            for blog_id, title, result in typed_posts:
+                if account:
+                    self.account_manager.record_post(account["username"], blog_id or account["username"],
+                                                     title, POST_TYPED)
+                # 입력 전 검사에서 계산한 지문을 그대로 사용 (원고를 GUI 스레드에서 다시 읽지 않음)
+                self.duplicate_index.add_fingerprint(blog_id, result, title)
+            
+            # 입력창을 비우기 전에 초안 보관함에 저장 (나중에 초안 찾기로 다시 불러올 수 있도록)
+            if not self.text_source:
+                try:
+                    self.draft_library.save(self.text_input.toPlainText(), self.draft_path)
+                except Exception as e:
+                    print(f"초안 저장 실패: {e}")
+            self.draft_path = None
+            
             # 타이핑 완료 메시지 표시
             QMessageBox.information(self, "타이핑 완료", "블로그 글 입력이 완료되었습니다!")
+            if self.text_source:
+                self.clear_text_source()
+            self.clear_images()
             self.text_input.clear()
     
     def update_status(self, message):
@@ -1364,11 +2626,26 @@ class NaverBlogTypingApp(QMainWindow):
     def closeEvent(self, event):
         """앱 종료 시 처리"""
         # 브라우저 종료
-        if self.browser_thread and self.browser_thread.is_alive():
-            self.browser_thread.stop()
+        for browser in self.browser_workers.values():
+            if browser.is_alive():
+                browser.stop()
+        self.dispatch_timer.stop()
+        self.worker_pool.shutdown()
+        if self.orchestrator_loop:
+            self.orchestrator_loop.stop(self.orchestrator)
+        stop_virtual_display()  # 가상 디스플레이를 사용했으면 종료
+        
+        # 이미지 변환 프로세스 종료
+        self.image_pipeline.shutdown()
         
         # 윈도우 위치 저장
         self.settings.setValue("geometry", self.saveGeometry())
+        self.settings.sync()
+        
+        # 모아 둔 계정 정보 변경 저장
+        self.account_manager.close()
+        self.duplicate_index.close()
+        self.draft_library.close()
         
         event.accept()
 
@@ -1,3 +1,4 @@
+import sys
 import time
 import random
 import undetected_chromedriver as uc
@@ -6,6 +7,9 @@ from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.common.action_chains import ActionChains
 from selenium.webdriver.common.keys import Keys
+from naver_resources import apply_chrome_profile, wait_while_idle
+from naver_display import (DEFAULT_DISPLAY_MODE, apply_display_mode, display_mode_from_args,
+                           has_screen, prepare_driver)
 
 def type_like_human(element, text, min_delay=0.05, max_delay=0.15):
     """사람처럼 타이핑하는 함수"""
@@ -14,12 +18,15 @@ def type_like_human(element, text, min_delay=0.05, max_delay=0.15):
         # 키 입력 사이에 랜덤한 지연 시간 추가
         time.sleep(random.uniform(min_delay, max_delay))
 
-def login_and_type_blog_post():
+def login_and_type_blog_post(low_memory=False, display_mode=DEFAULT_DISPLAY_MODE):
     # 크롬 드라이버 설정 및 시작
     print("브라우저를 시작합니다...")
     options = uc.ChromeOptions()
-    options.add_argument("--start-maximized")
+    apply_display_mode(options, display_mode)  # 화면 표시/헤드리스/가상 디스플레이
+    if low_memory:
+        apply_chrome_profile(options, "low_memory")  # 저메모리 크롬 옵션
     driver = uc.Chrome(options=options)
+    prepare_driver(driver, display_mode)
     
     try:
         # 네이버 로그인 페이지 열기
@@ -28,6 +35,8 @@ def login_and_type_blog_post():
         
         # 로그인 대기 (사용자가 수동으로 로그인)
         print("네이버에 수동으로 로그인해주세요. 로그인 후 30초 동안 기다립니다...")
+        if not has_screen(display_mode):
+            print("화면 없이 실행 중이라 직접 로그인할 수 없습니다. 로그인이 필요하면 화면 표시 방식으로 실행해주세요.")
         
         # 30초 동안 로그인 대기 (사용자가 직접 로그인)
         for i in range(30, 0, -1):
@@ -158,8 +167,7 @@ def login_and_type_blog_post():
         
         # 브라우저 유지 (사용자가 직접 종료할 때까지)
         print("브라우저가 열려 있습니다. 종료하려면 Ctrl+C를 누르세요.")
-        while True:
-            time.sleep(1)
+        wait_while_idle(driver)  # 메모리 사용량이 상한을 넘으면 알림
             
     except KeyboardInterrupt:
         print("프로그램을 종료합니다.")
@@ -170,4 +178,5 @@ def login_and_type_blog_post():
         driver.quit()
 
 if __name__ == "__main__":
-    login_and_type_blog_post() 
\ No newline at end of file
+    login_and_type_blog_post(low_memory="--low-memory" in sys.argv,
+                             display_mode=display_mode_from_args()) 
\ No newline at end of file
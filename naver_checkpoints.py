@@ -0,0 +1,177 @@
+"""긴 글 입력 중 문단 경계마다 입력 위치를 기록해 중단된 곳부터 이어서 입력하는 모듈"""
+import json
+import os
+import threading
+import time
+from collections import namedtuple
+from naver_editor_text import FNV_OFFSET_BASIS, fnv1a_hash, normalize_text, utf16_length
+
+# 체크포인트 기록 파일
+CHECKPOINT_FILE = "naver_typing_checkpoints.json"
+
+# 체크포인트 파일 저장 최소 간격 (초)
+CHECKPOINT_INTERVAL = 2.0
+
+# 입력 체크포인트 (offset: 원본 위치, base: 입력 시작 전 에디터 길이,
+# length/digest: 지금까지 입력한 본문의 UTF-16 길이와 FNV-1a 해시)
+Checkpoint = namedtuple("Checkpoint", ["offset", "base", "length", "digest"])
+
+
+def checkpoint_key(blog_id, source):
+    """블로그와 본문 소스별 체크포인트 키"""
+    return f"{blog_id or 'default'}|{source.identity()}"
+
+
+def is_source_prefix(source, text):
+    """text가 본문 소스의 앞부분과 같은지 (필요한 만큼만 문단 단위로 읽어 비교)"""
+    position = 0
+    for chunk in source.chunks():
+        if position >= len(text):
+            break
+        part = normalize_text(chunk.text)
+        if not text.startswith(part[:len(text) - position], position):
+            return False
+        position += len(part)
+    return position >= len(text)
+
+
+def utf16_prefix(text, length):
+    """UTF-16 코드 단위 기준으로 앞부분 자르기"""
+    return text.encode("utf-16-le")[:length * 2].decode("utf-16-le", errors="ignore")
+
+
+class TypingProgress:
+    """입력한 본문의 길이와 해시를 문단마다 이어서 계산 (에디터를 다시 읽지 않음)"""
+    def __init__(self, base, checkpoint=None):
+        self.base = base
+        self.offset = checkpoint.offset if checkpoint else 0
+        self.length = checkpoint.length if checkpoint else 0
+        self.digest = checkpoint.digest if checkpoint else FNV_OFFSET_BASIS
+
+    def advance(self, chunk):
+        """입력을 마친 문단 반영 후 체크포인트 반환"""
+        text = normalize_text(chunk.text)
+        self.offset = chunk.end
+        self.length += utf16_length(text)
+        self.digest = fnv1a_hash(text, self.digest)
+        return Checkpoint(self.offset, self.base, self.length, self.digest)
+
+
+class TypingCheckpoints:
+    """본문 소스별 마지막 확인된 입력 위치를 파일에 기록하는 클래스"""
+    def __init__(self, checkpoint_file=CHECKPOINT_FILE, interval=CHECKPOINT_INTERVAL):
+        self.checkpoint_file = checkpoint_file
+        self.interval = interval
+        self.records = {}
+        self.lock = threading.Lock()
+        self.dirty = False
+        self.changed = set()  # 마지막 저장 후 기록/삭제한 키 (다른 프로세스 기록과 합칠 때 사용)
+        self.saved_at = 0
+        self.load_records()
+
+    def load_records(self):
+        """저장된 체크포인트 로드"""
+        try:
+            if os.path.exists(self.checkpoint_file):
+                with open(self.checkpoint_file, "r", encoding="utf-8") as f:
+                    self.records = json.load(f)
+        except Exception as e:
+            print(f"입력 체크포인트 로드 실패: {e}")
+            self.records = {}
+
+    def read_file(self):
+        """파일에 저장된 체크포인트 (없거나 읽을 수 없으면 빈 목록)"""
+        try:
+            with open(self.checkpoint_file, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def save_records(self):
+        """체크포인트 저장 (다른 계정 프로세스가 저장한 기록은 유지하고 바뀐 키만 반영)"""
+        try:
+            with self.lock:
+                records = self.read_file()
+                for key in self.changed:
+                    if key in self.records:
+                        records[key] = self.records[key]
+                    else:
+                        records.pop(key, None)
+                self.records = records
+                self.changed.clear()
+                data = json.dumps(records, ensure_ascii=False, indent=2)
+                self.dirty = False
+            temp_file = f"{self.checkpoint_file}.{os.getpid()}.temp"
+            with open(temp_file, "w", encoding="utf-8") as f:
+                f.write(data)
+            os.replace(temp_file, self.checkpoint_file)
+            self.saved_at = time.monotonic()
+            return True
+        except Exception as e:
+            print(f"입력 체크포인트 저장 실패: {e}")
+            return False
+
+    def get(self, key):
+        """저장된 체크포인트 (없으면 None)"""
+        record = self.records.get(key)
+        if not record:
+            return None
+        try:
+            return Checkpoint(*record)
+        except TypeError:
+            return None
+
+    def record(self, key, checkpoint):
+        """체크포인트 기록 (파일 저장은 일정 간격마다)"""
+        with self.lock:
+            self.records[key] = list(checkpoint)
+            self.changed.add(key)
+            self.dirty = True
+        if time.monotonic() - self.saved_at >= self.interval:
+            self.save_records()
+
+    def flush(self):
+        """저장하지 않은 체크포인트 저장 (중단/실패 시 호출)"""
+        if self.dirty:
+            self.save_records()
+
+    def clear(self, key):
+        """입력이 끝난 본문의 체크포인트 삭제"""
+        with self.lock:
+            if self.records.pop(key, None) is None:
+                return
+            self.changed.add(key)
+        self.save_records()
+
+    def resume(self, key, verifier, source=None, log=print):
+        """에디터 내용이 체크포인트와 같으면 이어서 입력할 체크포인트 반환 (확인 실패 시 None)
+
+        처음부터 다시 입력할 때 기준 위치 이후 내용이 이 본문의 앞부분이면 지우고,
+        다른 글이나 임시 저장에서 복원된 내용처럼 이 본문과 다르면 지우지 않는다.
+        """
+        checkpoint = self.get(key)
+        if checkpoint is None:
+            return None
+
+        length, digest = verifier.content_hash(checkpoint.base)
+        if (length, digest) == (checkpoint.length, checkpoint.digest):
+            return checkpoint
+        if not length:
+            log("에디터 내용이 마지막 체크포인트와 달라 처음부터 입력합니다.")
+            return None
+
+        # 체크포인트 이후 일부만 입력된 문단은 지우고 체크포인트부터 다시 입력
+        text = verifier.read_text(checkpoint.base)
+        if length > checkpoint.length:
+            if fnv1a_hash(utf16_prefix(text, checkpoint.length)) == checkpoint.digest:
+                verifier.apply_edit(checkpoint.length, length, "", checkpoint.base)
+                log("체크포인트 이후 입력된 부분을 지우고 이어서 입력합니다.")
+                return checkpoint
+
+        # 이 본문을 입력하다 만 내용이면 지우지 않으면 처음부터 다시 입력할 때 같은 내용이 두 번 들어감
+        if source is not None and is_source_prefix(source, text):
+            verifier.apply_edit(0, length, "", checkpoint.base)
+            log("에디터 내용이 마지막 체크포인트와 달라 입력된 부분을 지우고 처음부터 입력합니다.")
+        else:
+            log("에디터에 이 글과 다른 내용이 있어 지우지 않고 처음부터 입력합니다.")
+        return None
@@ -0,0 +1,243 @@
+"""블로그별로 이미 작성한 글의 본문 해시와 MinHash 서명을 저장해 같은 글이나 거의 같은 글을 다시 올리지 않도록 확인하는 모듈"""
+import array
+import hashlib
+import html
+import os
+import random
+import re
+import sqlite3
+import threading
+import time
+import unicodedata
+import zlib
+from collections import namedtuple, OrderedDict
+from naver_text_source import as_source
+
+# 중복 확인 색인 파일
+DEDUP_FILE = "naver_dedup.db"
+
+# 글자 단위 조각 길이 (한국어는 띄어쓰기가 달라도 비슷한 글로 찾도록 공백을 빼고 글자로 자름)
+SHINGLE_SIZE = 5
+
+# MinHash 서명 길이와 LSH 구간 (16구간 x 4개: 유사도 0.5 전후부터 후보로 찾음)
+NUM_PERMUTATIONS = 64
+BANDS = 16
+ROWS_PER_BAND = NUM_PERMUTATIONS // BANDS
+
+# 이 유사도(추정 자카드 유사도) 이상이면 거의 같은 글로 판단
+SIMILARITY_THRESHOLD = 0.8
+
+# 이만큼 조각을 모을 때마다 서명에 반영 (큰 원고도 조각 집합이 메모리를 차지하지 않도록)
+SHINGLE_BATCH = 4096
+
+# 원고 식별 정보별 (본문 해시, 서명) 캐시 크기 (같은 글을 대기열 추가와 발행 때 다시 계산하지 않도록)
+FINGERPRINT_CACHE_SIZE = 64
+
+# 해시 계산에 쓰는 소수와 순열 계수 (저장된 서명과 맞도록 항상 같은 값을 사용)
+_PRIME = 4294967291
+_random = random.Random(20240101)
+_PERMUTATIONS = [(_random.randrange(1, _PRIME), _random.randrange(0, _PRIME)) for _ in range(NUM_PERMUTATIONS)]
+
+_fingerprints = OrderedDict()  # 원고 식별 정보 -> (본문 해시, 서명)
+_fingerprints_lock = threading.Lock()
+
+# 중복 확인 결과 (kind: "exact" 또는 "similar")
+Duplicate = namedtuple("Duplicate", ["kind", "similarity", "title", "created_at", "post_url"])
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS posts (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    blog_id TEXT NOT NULL,
+    content_hash TEXT NOT NULL,
+    signature BLOB NOT NULL,
+    title TEXT,
+    post_url TEXT,
+    created_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS posts_hash ON posts (blog_id, content_hash);
+"""
+
+
+def normalize_content(text):
+    """비교용 본문 (HTML 태그, 문장 부호, 공백 차이, 전각/반각 차이 제거)"""
+    text = re.sub(r"<[^>]+>", " ", text)
+    text = html.unescape(text)
+    text = unicodedata.normalize("NFKC", text).lower()
+    return " ".join(re.sub(r"[\W_]+", " ", text).split())
+
+
+def normalized_words(chunks):
+    """본문 조각을 차례로 정규화한 단어 (조각 경계에서 단어나 태그가 잘리지 않도록 끝부분을 다음 조각으로 넘김)"""
+    carry = ""
+    for chunk in chunks:
+        text = carry + chunk
+        match = re.search(r"\s\S*\Z", text)
+        cut = match.start() + 1 if match else 0
+        open_tag = text.rfind("<")
+        if open_tag > text.rfind(">") and len(text) - open_tag < 1024:
+            cut = min(cut, open_tag)  # 닫히지 않은 태그는 다음 조각과 함께 처리
+        yield from normalize_content(text[:cut]).split()
+        carry = text[cut:]
+    if carry:
+        yield from normalize_content(carry).split()
+
+
+def fold_shingles(signature, shingles):
+    """조각 묶음의 해시로 MinHash 서명 갱신 (순열마다 최솟값 유지)"""
+    hashes = [zlib.crc32(shingle.encode("utf-8")) for shingle in shingles]
+    for i, (a, b) in enumerate(_PERMUTATIONS):
+        signature[i] = min(signature[i], min((a * x + b) % _PRIME for x in hashes))
+
+
+def fingerprint(text_or_source):
+    """본문 해시와 MinHash 서명, 빈 글이면 None
+
+    원고 파일은 문단 조각 단위로 읽어 계산하므로 전체를 한 번에 메모리에 올리지 않는다.
+    공백을 뺀 글자로 조각을 만들기 때문에 단어 사이에서는 앞 단어의 끝 SHINGLE_SIZE - 1 글자를 이어 붙인다.
+    """
+    source = as_source(text_or_source)
+    key = source.identity()
+    if getattr(source, "path", None):
+        key += f":{os.stat(source.path).st_mtime_ns}"  # 같은 초에 같은 크기로 고친 원고도 구분
+    with _fingerprints_lock:
+        if key in _fingerprints:
+            _fingerprints.move_to_end(key)
+            return _fingerprints[key]
+
+    digest = hashlib.sha256()
+    signature = [_PRIME] * NUM_PERMUTATIONS
+    shingles = set()
+    tail = ""
+    length = 0  # 공백을 뺀 글자 수
+    for word in normalized_words(chunk.text for chunk in source.chunks()):
+        digest.update(((" " if length else "") + word).encode("utf-8"))
+        length += len(word)
+        text = tail + word
+        shingles.update(text[i:i + SHINGLE_SIZE] for i in range(len(text) - SHINGLE_SIZE + 1))
+        tail = text[-(SHINGLE_SIZE - 1):]
+        if len(shingles) >= SHINGLE_BATCH:
+            fold_shingles(signature, shingles)
+            shingles = set()
+    if not length:
+        return None
+    if length < SHINGLE_SIZE:
+        shingles = {tail}  # 조각 길이보다 짧은 글은 글 전체를 조각 하나로
+    if shingles:
+        fold_shingles(signature, shingles)
+
+    result = (digest.hexdigest(), tuple(signature))
+    with _fingerprints_lock:
+        _fingerprints[key] = result
+        if len(_fingerprints) > FINGERPRINT_CACHE_SIZE:
+            _fingerprints.popitem(last=False)
+    return result
+
+
+def similarity(signature, other):
+    """두 서명의 추정 자카드 유사도"""
+    return sum(1 for x, y in zip(signature, other) if x == y) / NUM_PERMUTATIONS
+
+
+def band_keys(signature):
+    return [(band, signature[band * ROWS_PER_BAND:(band + 1) * ROWS_PER_BAND]) for band in range(BANDS)]
+
+
+class DuplicateIndex:
+    """블로그별 작성한 글 색인 (본문 해시로 같은 글, LSH 구간으로 거의 같은 글 후보를 바로 찾음)
+
+    모든 서명을 메모리에 올려 두므로 글이 수만 개여도 확인은 사전 조회 몇 번으로 끝난다.
+    """
+    def __init__(self, index_file=DEDUP_FILE, threshold=SIMILARITY_THRESHOLD):
+        self.index_file = index_file
+        self.threshold = threshold
+        self.lock = threading.Lock()
+        self.exact = {}  # (블로그 ID, 본문 해시) -> 글 ID
+        self.buckets = {}  # (블로그 ID, 구간 번호, 구간 값) -> 글 ID 목록
+        self.posts = {}  # 글 ID -> (서명, 제목, 작성 시각, 글 주소)
+        self.connection = sqlite3.connect(index_file, check_same_thread=False)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.executescript(SCHEMA)
+        self.load()
+
+    def load(self):
+        try:
+            rows = self.connection.execute(
+                "SELECT id, blog_id, content_hash, signature, title, post_url, created_at FROM posts").fetchall()
+        except Exception as e:
+            print(f"중복 확인 색인 로드 실패: {e}")
+            return
+        for post_id, blog_id, digest, blob, title, post_url, created_at in rows:
+            signature = tuple(array.array("I", blob))
+            self.remember(post_id, blog_id, digest, signature, title, created_at, post_url)
+
+    def remember(self, post_id, blog_id, digest, signature, title, created_at, post_url):
+        self.exact[(blog_id, digest)] = post_id
+        self.posts[post_id] = (signature, title, created_at, post_url)
+        for band, values in band_keys(signature):
+            self.buckets.setdefault((blog_id, band, values), []).append(post_id)
+
+    def check(self, blog_id, text):
+        """이 블로그에 같은 글이나 거의 같은 글을 작성한 적이 있으면 Duplicate, 없으면 None
+
+        큰 원고는 계산이 오래 걸릴 수 있으므로 GUI에서는 별도 스레드에서 호출한다.
+        """
+        return self.check_fingerprint(blog_id, fingerprint(text))
+
+    def check_fingerprint(self, blog_id, result):
+        """미리 계산한 fingerprint() 결과로 중복 확인 (본문을 다시 읽지 않음)"""
+        if result is None:
+            return None
+        digest, signature = result
+        with self.lock:
+            post_id = self.exact.get((blog_id, digest))
+            if post_id is not None:
+                _, title, created_at, post_url = self.posts[post_id]
+                return Duplicate("exact", 1.0, title, created_at, post_url)
+
+            best = None
+            candidates = set()
+            for band, values in band_keys(signature):
+                candidates.update(self.buckets.get((blog_id, band, values), ()))
+            for post_id in candidates:
+                other, title, created_at, post_url = self.posts[post_id]
+                score = similarity(signature, other)
+                if score >= self.threshold and (best is None or score > best.similarity):
+                    best = Duplicate("similar", score, title, created_at, post_url)
+            return best
+
+    def add(self, blog_id, text, title="", post_url=None):
+        """작성한 글을 색인에 추가 (같은 글이 이미 있으면 추가하지 않음)"""
+        self.add_fingerprint(blog_id, fingerprint(text), title, post_url)
+
+    def add_fingerprint(self, blog_id, result, title="", post_url=None):
+        """미리 계산한 fingerprint() 결과로 색인에 추가 (입력 전 검사에서 계산한 값 재사용)"""
+        if result is None:
+            return
+        digest, signature = result
+        created_at = time.time()
+        with self.lock:
+            if (blog_id, digest) in self.exact:
+                return
+            try:
+                with self.connection:
+                    cursor = self.connection.execute(
+                        "INSERT INTO posts (blog_id, content_hash, signature, title, post_url, created_at)"
+                        " VALUES (?, ?, ?, ?, ?, ?)",
+                        (blog_id, digest, array.array("I", signature).tobytes(), title, post_url, created_at))
+            except Exception as e:
+                print(f"중복 확인 색인 저장 실패: {e}")
+                return
+            self.remember(cursor.lastrowid, blog_id, digest, signature, title, created_at, post_url)
+
+    def close(self):
+        with self.lock:
+            self.connection.close()
+
+
+def describe_duplicate(duplicate):
+    """중복 확인 결과 안내 문구"""
+    when = time.strftime("%Y-%m-%d %H:%M", time.localtime(duplicate.created_at))
+    title = f"'{duplicate.title}'" if duplicate.title else "이전 글"
+    if duplicate.kind == "exact":
+        return f"{when}에 작성한 {title}과(와) 본문이 같습니다."
+    return f"{when}에 작성한 {title}과(와) 본문이 {duplicate.similarity:.0%} 비슷합니다."
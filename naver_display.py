@@ -0,0 +1,110 @@
+"""브라우저 표시 방식(화면 표시, 헤드리스, 가상 디스플레이) 설정 모듈"""
+import atexit
+import sys
+import threading
+
+try:
+    from pyvirtualdisplay import Display
+except ImportError:
+    Display = None  # pyvirtualdisplay가 없으면 가상 디스플레이 사용 불가
+
+# 브라우저 표시 방식
+DISPLAY_MODES = {
+    "visible": "화면에 표시",
+    "headless": "헤드리스 (창 없이 실행)",
+    "virtual": "가상 디스플레이 (Xvfb, 리눅스 서버)",
+}
+DEFAULT_DISPLAY_MODE = "visible"
+
+# 화면이 없을 때 사용할 브라우저 창 크기 (에디터 레이아웃이 데스크톱 기준으로 잡히도록)
+HEADLESS_WINDOW_SIZE = (1920, 1080)
+
+# 명령줄 옵션 -> 표시 방식
+DISPLAY_ARGUMENTS = {
+    "--headless": "headless",
+    "--virtual-display": "virtual",
+}
+
+_display = None
+_display_lock = threading.Lock()
+
+
+def has_screen(mode):
+    """실제 화면에 창을 띄우는 방식인지 여부 (창 위치/크기 계산 여부)"""
+    return mode == "visible"
+
+
+def display_mode_from_args(argv=None):
+    """명령줄 옵션에서 표시 방식 선택 (없으면 화면 표시)"""
+    for argument in argv if argv is not None else sys.argv:
+        if argument in DISPLAY_ARGUMENTS:
+            return DISPLAY_ARGUMENTS[argument]
+    return DEFAULT_DISPLAY_MODE
+
+
+def start_virtual_display(size=HEADLESS_WINDOW_SIZE):
+    """가상 X 디스플레이 시작 (이미 실행 중이면 그대로 사용, 여러 브라우저가 함께 사용)"""
+    global _display
+    with _display_lock:
+        if _display is not None:
+            return _display
+        if Display is None or not sys.platform.startswith("linux"):
+            raise RuntimeError("가상 디스플레이는 리눅스에서 pyvirtualdisplay와 Xvfb를 설치해야 사용할 수 있습니다")
+        display = Display(visible=False, size=size)
+        display.start()  # DISPLAY 환경 변수가 설정되어 이후 띄우는 크롬이 가상 화면에 표시됨
+        _display = display
+        atexit.register(stop_virtual_display)
+        return _display
+
+
+def stop_virtual_display():
+    """가상 X 디스플레이 종료"""
+    global _display
+    with _display_lock:
+        if _display is None:
+            return
+        try:
+            _display.stop()
+        except Exception as e:
+            print(f"가상 디스플레이 종료 실패: {e}")
+        _display = None
+
+
+def apply_display_mode(options, mode, screen_size=None):
+    """크롬 옵션에 표시 방식 적용 (화면에 표시할 때만 창을 화면 오른쪽 상단에 배치)"""
+    if mode == "virtual":
+        start_virtual_display()
+
+    if not has_screen(mode):
+        if mode == "headless":
+            options.add_argument("--headless=new")
+        width, height = HEADLESS_WINDOW_SIZE
+        options.add_argument(f"--window-size={width},{height}")
+        options.add_argument("--window-position=0,0")
+        return
+
+    options.add_argument("--start-maximized")
+    if screen_size:
+        screen_width, screen_height = screen_size
+        window_width = int(screen_width * 0.6)  # 화면 너비의 60%
+        window_height = int(screen_height * 0.9)  # 화면 높이의 90%
+
+        # 오른쪽 상단에 위치
+        pos_x = screen_width - window_width - 10  # 오른쪽에서 10px 간격
+        pos_y = 10  # 상단에서 10px 간격
+
+        options.add_argument(f"--window-size={window_width},{window_height}")
+        options.add_argument(f"--window-position={pos_x},{pos_y}")
+
+
+def prepare_driver(driver, mode):
+    """헤드리스 브라우저의 사용자 에이전트에서 'Headless' 표시 제거"""
+    if mode != "headless":
+        return
+    try:
+        user_agent = driver.execute_script("return navigator.userAgent")
+        if "HeadlessChrome" in user_agent:
+            driver.execute_cdp_cmd("Network.setUserAgentOverride",
+                                   {"userAgent": user_agent.replace("HeadlessChrome", "Chrome")})
+    except Exception as e:
+        print(f"사용자 에이전트 설정 실패: {e}")
@@ -0,0 +1,279 @@
+"""초안 폴더의 원고를 SQLite FTS5 색인에 넣어 제목/본문으로 바로 찾는 모듈 (바뀐 파일만 다시 색인)"""
+import os
+import re
+import sqlite3
+import threading
+import time
+import unicodedata
+from collections import namedtuple
+
+# 초안 폴더와 색인 파일
+DRAFTS_DIR = "drafts"
+DRAFTS_FILE = "naver_drafts.db"
+
+# 초안으로 색인하는 파일 확장자
+DRAFT_EXTENSIONS = (".txt", ".md")
+
+# 초안 하나에서 색인하는 최대 글자 수 (대용량 원고도 앞부분으로 찾을 수 있으면 충분)
+MAX_INDEX_CHARS = 200000
+
+# 한 번에 기록하는 초안 수 (색인하는 동안 검색이 오래 기다리지 않도록 나눠서 기록)
+SYNC_BATCH = 200
+
+# 검색 결과 최대 개수
+SEARCH_LIMIT = 50
+
+# 검색 결과에 보여줄 본문 앞뒤 글자 수
+SNIPPET_CHARS = 40
+
+# 색인 방식 버전 (두 글자 조각을 만드는 방식이 바뀌면 올려서 기존 색인을 다시 만듦)
+INDEX_VERSION = 2
+
+# 제목에서 찾은 초안을 본문에서 찾은 초안보다 앞에 (bm25 열 가중치)
+TITLE_WEIGHT = 5.0
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS drafts (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    path TEXT NOT NULL UNIQUE,
+    title TEXT NOT NULL,
+    mtime REAL NOT NULL,
+    size INTEGER NOT NULL,
+    indexed_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS drafts_mtime ON drafts (mtime);
+CREATE VIRTUAL TABLE IF NOT EXISTS drafts_fts USING fts5(title, content, tokenize='unicode61');
+"""
+
+# 검색 결과 (path: 초안 파일 경로, snippet: 찾은 부분 앞뒤 본문)
+Draft = namedtuple("Draft", ["id", "path", "title", "mtime", "snippet"])
+
+
+def draft_title(content):
+    """초안 제목 (첫 줄, Markdown 제목 기호 제외)"""
+    for line in content.splitlines():
+        line = line.strip().lstrip("#").strip()
+        if line:
+            return line[:100]
+    return ""
+
+
+def read_draft(path):
+    """초안 파일 읽기 (깨진 글자는 대체 문자로)"""
+    with open(path, "r", encoding="utf-8-sig", errors="replace") as f:
+        return f.read()
+
+
+def words(text):
+    return re.findall(r"\w+", unicodedata.normalize("NFKC", text).lower())
+
+
+def bigrams(text):
+    """색인용 두 글자 조각 ('제주 여행' -> '제주 주여 여행 행')
+
+    한국어는 띄어쓰기가 달라 단어 단위로는 찾기 어려우므로 공백을 빼고 이은 글자로 두 글자 조각을 만든다.
+    ('서울 맛집'도 '서울맛집'으로 찾을 수 있음, 조사가 끼어 있는 '서울의 맛집'은 '서울맛집'으로 찾을 수 없음)
+    마지막 글자도 넣어 한 글자 검색어도 찾을 수 있도록 한다.
+    """
+    joined = "".join(words(text))
+    if not joined:
+        return ""
+    tokens = [joined[i:i + 2] for i in range(len(joined) - 1)]
+    tokens.append(joined[-1])
+    return " ".join(tokens)
+
+
+def match_query(query):
+    """검색어를 FTS5 검색식으로 (검색어마다 두 글자 조각이 이어지는 구문, 모든 검색어 포함)"""
+    phrases = []
+    for word in words(query):
+        if len(word) == 1:
+            phrases.append(f'"{word}" *')
+        else:
+            phrases.append('"' + " ".join(word[i:i + 2] for i in range(len(word) - 1)) + '"')
+    return " ".join(phrases)
+
+
+def make_snippet(content, query):
+    """본문에서 검색어가 처음 나오는 부분 (없으면 본문 앞부분)"""
+    lowered = content.lower()
+    positions = [lowered.find(word) for word in query.lower().split()]
+    positions = [position for position in positions if position != -1]
+    start = max(0, min(positions) - SNIPPET_CHARS) if positions else 0
+    snippet = " ".join(content[start:start + SNIPPET_CHARS * 3].split())
+    return ("…" if start else "") + snippet
+
+
+class DraftLibrary:
+    """초안 폴더 색인 (파일 수정 시각/크기로 바뀐 초안만 다시 색인, 검색은 전문 색인으로 바로 조회)"""
+    def __init__(self, drafts_dir=DRAFTS_DIR, library_file=DRAFTS_FILE):
+        self.drafts_dir = drafts_dir
+        self.library_file = library_file
+        self.lock = threading.Lock()  # GUI 스레드와 색인 스레드가 같은 연결을 사용
+        self.sync_lock = threading.Lock()  # 색인은 한 번에 하나만 진행
+        os.makedirs(drafts_dir, exist_ok=True)
+        self.connection = sqlite3.connect(library_file, check_same_thread=False)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.executescript(SCHEMA)
+        self.upgrade_index()
+
+    def upgrade_index(self):
+        """색인 방식이 바뀌었으면 기존 색인을 비움 (다음 sync에서 모든 초안을 다시 색인)"""
+        version = self.connection.execute("PRAGMA user_version").fetchone()[0]
+        if version == INDEX_VERSION:
+            return
+        with self.connection:
+            self.connection.execute("DELETE FROM drafts")
+            self.connection.execute("DELETE FROM drafts_fts")
+            self.connection.execute(f"PRAGMA user_version = {INDEX_VERSION}")
+
+    def relative_path(self, path):
+        return os.path.relpath(path, self.drafts_dir)
+
+    def full_path(self, relative_path):
+        return os.path.join(self.drafts_dir, relative_path)
+
+    def scan_files(self):
+        """초안 폴더의 파일 목록 {상대 경로: (수정 시각, 크기)} (하위 폴더 포함)"""
+        files = {}
+        directories = [self.drafts_dir]
+        while directories:
+            try:
+                entries = list(os.scandir(directories.pop()))
+            except OSError:
+                continue
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    directories.append(entry.path)
+                elif entry.name.lower().endswith(DRAFT_EXTENSIONS):
+                    try:
+                        stat = entry.stat()
+                    except OSError:
+                        continue
+                    files[self.relative_path(entry.path)] = (stat.st_mtime, stat.st_size)
+        return files
+
+    def sync(self):
+        """초안 폴더와 색인 맞추기 (새 초안/바뀐 초안만 읽어서 색인, 지운 초안은 색인에서 삭제)
+
+        (추가/갱신한 수, 삭제한 수) 반환, 이미 다른 스레드에서 색인 중이면 None
+        """
+        if not self.sync_lock.acquire(blocking=False):
+            return None
+        try:
+            files = self.scan_files()
+            with self.lock:
+                indexed = {path: (draft_id, mtime, size) for draft_id, path, mtime, size
+                           in self.connection.execute("SELECT id, path, mtime, size FROM drafts")}
+            changed = [path for path, stat in files.items()
+                       if path not in indexed or indexed[path][1:] != stat]
+            removed = [draft_id for path, (draft_id, _, _) in indexed.items() if path not in files]
+
+            # 파일은 잠금 밖에서 읽고 나눠서 기록
+            for start in range(0, len(changed), SYNC_BATCH):
+                batch = []
+                for path in changed[start:start + SYNC_BATCH]:
+                    try:
+                        content = read_draft(self.full_path(path))
+                    except OSError as e:
+                        print(f"초안 읽기 실패 ({path}): {e}")
+                        continue
+                    batch.append((path, files[path], content))
+                with self.lock, self.connection:
+                    for path, stat, content in batch:
+                        self.index_locked(path, stat, content)
+            if removed:
+                with self.lock, self.connection:
+                    for draft_id in removed:
+                        self.connection.execute("DELETE FROM drafts WHERE id = ?", (draft_id,))
+                        self.connection.execute("DELETE FROM drafts_fts WHERE rowid = ?", (draft_id,))
+            return len(changed), len(removed)
+        except Exception as e:
+            print(f"초안 색인 실패: {e}")
+            return None
+        finally:
+            self.sync_lock.release()
+
+    def index_locked(self, path, stat, content):
+        """초안 하나 색인 (잠금과 트랜잭션 안에서 호출)"""
+        mtime, size = stat
+        title = draft_title(content) or os.path.splitext(os.path.basename(path))[0]
+        row = self.connection.execute("SELECT id FROM drafts WHERE path = ?", (path,)).fetchone()
+        if row:
+            draft_id = row[0]
+            self.connection.execute("UPDATE drafts SET title = ?, mtime = ?, size = ?, indexed_at = ? WHERE id = ?",
+                                    (title, mtime, size, time.time(), draft_id))
+            self.connection.execute("DELETE FROM drafts_fts WHERE rowid = ?", (draft_id,))
+        else:
+            cursor = self.connection.execute(
+                "INSERT INTO drafts (path, title, mtime, size, indexed_at) VALUES (?, ?, ?, ?, ?)",
+                (path, title, mtime, size, time.time()))
+            draft_id = cursor.lastrowid
+        self.connection.execute("INSERT INTO drafts_fts (rowid, title, content) VALUES (?, ?, ?)",
+                                (draft_id, bigrams(title), bigrams(content[:MAX_INDEX_CHARS])))
+
+    def search(self, query, limit=SEARCH_LIMIT):
+        """제목/본문에 검색어가 모두 들어간 초안 목록 (관련도 순), 검색어가 없으면 최근 초안 목록"""
+        if not query.strip():
+            with self.lock:
+                rows = self.connection.execute(
+                    "SELECT id, path, title, mtime FROM drafts ORDER BY mtime DESC LIMIT ?", (limit,)).fetchall()
+            return [Draft(draft_id, self.full_path(path), title, mtime, "") for draft_id, path, title, mtime in rows]
+
+        expression = match_query(query)
+        if not expression:
+            return []
+        try:
+            with self.lock:
+                rows = self.connection.execute(
+                    "SELECT drafts.id, drafts.path, drafts.title, drafts.mtime FROM drafts_fts"
+                    " JOIN drafts ON drafts.id = drafts_fts.rowid WHERE drafts_fts MATCH ?"
+                    " ORDER BY bm25(drafts_fts, ?, 1.0) LIMIT ?", (expression, TITLE_WEIGHT, limit)).fetchall()
+        except sqlite3.OperationalError as e:
+            print(f"초안 검색 실패: {e}")
+            return []
+
+        # 색인에는 두 글자 조각만 있으므로 찾은 부분은 원고 파일에서 읽음
+        drafts = []
+        for draft_id, path, title, mtime in rows:
+            path = self.full_path(path)
+            try:
+                with open(path, "r", encoding="utf-8-sig", errors="replace") as f:
+                    snippet = make_snippet(f.read(MAX_INDEX_CHARS), query)
+            except OSError:
+                snippet = ""
+            drafts.append(Draft(draft_id, path, title, mtime, snippet))
+        return drafts
+
+    def save(self, content, path=None):
+        """초안 저장 후 바로 색인 (path가 없으면 초안 폴더에 새 파일), 저장한 파일 경로 반환"""
+        if path is None:
+            name = re.sub(r'[\\/:*?"<>|\s]+', " ", draft_title(content)).strip()[:40] or "초안"
+            path = os.path.join(self.drafts_dir, f"{time.strftime('%Y%m%d-%H%M%S')} {name}.txt")
+        temp_file = f"{path}.temp"
+        with open(temp_file, "w", encoding="utf-8") as f:
+            f.write(content)
+        os.replace(temp_file, path)
+
+        # 초안 폴더 안의 파일이면 다음 색인을 기다리지 않고 바로 반영
+        relative_path = self.relative_path(path)
+        if not relative_path.startswith(os.pardir) and relative_path.lower().endswith(DRAFT_EXTENSIONS):
+            stat = os.stat(path)
+            with self.lock, self.connection:
+                self.index_locked(relative_path, (stat.st_mtime, stat.st_size), content)
+        return path
+
+    def count(self):
+        with self.lock:
+            return self.connection.execute("SELECT COUNT(*) FROM drafts").fetchone()[0]
+
+    def close(self):
+        with self.lock:
+            self.connection.close()
+
+
+def split_draft(content):
+    """초안을 (제목, 본문)으로 나누기 (첫 줄이 제목)"""
+    lines = content.lstrip().split("\n", 1)
+    title = lines[0].strip().lstrip("#").strip()
+    return title, lines[1].strip() if len(lines) > 1 else ""
@@ -0,0 +1,169 @@
+"""스마트에디터 본문 내용 확인 및 누락 글자 복구 모듈"""
+import difflib
+from selenium.webdriver.common.action_chains import ActionChains
+from selenium.webdriver.common.keys import Keys
+from naver_editor_text import fnv1a_hash, normalize_text, utf16_length
+
+# 에디터 본문 읽기/선택 스크립트 (제목과 안내 문구는 제외)
+EDITOR_SCRIPT = """
+    var mode = arguments[0];
+    var base = arguments[1] || 0;
+    var root = document.querySelector('.se-content') || document.body;
+    var paras = Array.prototype.filter.call(
+        root.querySelectorAll('.se-text-paragraph'),
+        function (p) { return !p.closest('.se-documentTitle'); });
+    if (!paras.length) {
+        paras = [root];
+    }
+
+    function textNodes(p) {
+        var walker = document.createTreeWalker(p, NodeFilter.SHOW_TEXT, {
+            acceptNode: function (n) {
+                return n.parentElement && n.parentElement.closest('.se-placeholder')
+                    ? NodeFilter.FILTER_REJECT : NodeFilter.FILTER_ACCEPT;
+            }
+        });
+        var nodes = [];
+        while (walker.nextNode()) {
+            nodes.push(walker.currentNode);
+        }
+        return nodes;
+    }
+
+    function clean(s) {
+        return s.replace(/\\u200b/g, '').replace(/\\u00a0/g, ' ');
+    }
+
+    function paraText(p) {
+        return textNodes(p).map(function (n) { return clean(n.data); }).join('');
+    }
+
+    function fullText() {
+        return paras.map(paraText).join('\\n');
+    }
+
+    // 정리된 텍스트 기준 위치를 실제 DOM 위치로 변환
+    function locate(offset) {
+        for (var i = 0; i < paras.length; i++) {
+            var length = paraText(paras[i]).length;
+            if (offset > length && i < paras.length - 1) {
+                offset -= length + 1;
+                continue;
+            }
+            var nodes = textNodes(paras[i]);
+            var last = null;
+            for (var j = 0; j < nodes.length; j++) {
+                var data = nodes[j].data;
+                for (var k = 0; k < data.length; k++) {
+                    if (data[k] === '\\u200b') {
+                        continue;
+                    }
+                    if (offset === 0) {
+                        return {node: nodes[j], offset: k};
+                    }
+                    offset--;
+                }
+                last = {node: nodes[j], offset: data.length};
+            }
+            return last || {node: paras[i], offset: 0};
+        }
+        return {node: root, offset: 0};
+    }
+
+    // FNV-1a 32비트 해시 (UTF-16 코드 단위 기준)
+    function fnv(s) {
+        var h = 0x811c9dc5;
+        for (var i = 0; i < s.length; i++) {
+            h ^= s.charCodeAt(i);
+            h = Math.imul(h, 0x01000193) >>> 0;
+        }
+        return h;
+    }
+
+    if (mode === 'hash') {
+        var text = fullText().substring(base);
+        return [text.length, fnv(text)];
+    }
+    if (mode === 'text') {
+        return fullText().substring(base);
+    }
+    if (mode === 'length') {
+        return fullText().length;
+    }
+    if (mode === 'select') {
+        var start = locate(base + arguments[2]);
+        var end = locate(base + arguments[3]);
+        var range = document.createRange();
+        range.setStart(start.node, start.offset);
+        range.setEnd(end.node, end.offset);
+        var selection = window.getSelection();
+        selection.removeAllRanges();
+        selection.addRange(range);
+        return true;
+    }
+    return null;
+"""
+
+
+class EditorVerifier:
+    """입력이 끝난 에디터 본문을 원본과 비교하고 빠지거나 틀린 구간만 다시 입력하는 클래스"""
+    def __init__(self, driver, log=print):
+        self.driver = driver
+        self.log = log
+
+    def text_length(self):
+        """현재 에디터 본문 길이 (입력 시작 전 기준 위치로 사용)"""
+        return self.driver.execute_script(EDITOR_SCRIPT, "length", 0) or 0
+
+    def read_text(self, base=0):
+        """기준 위치 이후의 에디터 본문 텍스트 (스크립트 한 번으로 읽음)"""
+        return self.driver.execute_script(EDITOR_SCRIPT, "text", base) or ""
+
+    def content_hash(self, base=0):
+        """기준 위치 이후 에디터 본문의 (UTF-16 길이, 해시)"""
+        length, digest = self.driver.execute_script(EDITOR_SCRIPT, "hash", base)
+        return length, digest
+
+    def matches(self, source, base=0):
+        """길이와 해시만 비교해 본문이 원본과 같은지 빠르게 확인"""
+        length, digest = self.content_hash(base)
+        return length == utf16_length(source) and digest == fnv1a_hash(source)
+
+    def diff(self, source, base=0):
+        """에디터 본문과 원본의 차이 구간 목록 (뒤쪽 구간부터, 에디터 위치는 UTF-16 기준)"""
+        current = self.read_text(base)
+        matcher = difflib.SequenceMatcher(None, current, source, autojunk=False)
+        edits = []
+        for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+            if tag != "equal":
+                start = utf16_length(current[:i1])
+                end = start + utf16_length(current[i1:i2])
+                edits.append((start, end, source[j1:j2]))
+        return list(reversed(edits))
+
+    def apply_edit(self, start, end, replacement, base=0):
+        """에디터의 [start, end) 구간을 선택하고 대체 텍스트로 바꿈"""
+        self.driver.execute_script(EDITOR_SCRIPT, "select", base, start, end)
+        actions = ActionChains(self.driver)
+        if replacement:
+            # 에디터의 기본 입력 경로를 타도록 선택 영역 위에 직접 입력
+            actions.send_keys(replacement)
+        elif start != end:
+            actions.send_keys(Keys.BACK_SPACE)
+        actions.perform()
+
+    def verify_and_repair(self, text, base=0, max_passes=2):
+        """본문 검증 후 필요한 구간만 복구, (일치 여부, 복구한 구간 수) 반환"""
+        source = normalize_text(text)
+        repaired = 0
+        for _ in range(max_passes):
+            if self.matches(source, base):
+                return True, repaired
+
+            edits = self.diff(source, base)
+            self.log(f"입력 내용 불일치 {len(edits)}곳을 복구합니다...")
+            # 뒤쪽부터 고쳐야 앞쪽 위치가 바뀌지 않음
+            for start, end, replacement in edits:
+                self.apply_edit(start, end, replacement, base)
+                repaired += 1
+        return self.matches(source, base), repaired
@@ -0,0 +1,25 @@
+"""에디터 본문과 원본을 비교하는 텍스트 함수 (브라우저 없이 사용, 에디터 스크립트와 같은 길이/해시 계산)"""
+from array import array
+
+
+def normalize_text(text):
+    """에디터에 입력된 형태와 비교할 수 있도록 원본 텍스트 정리"""
+    return (text.replace("\r\n", "\n").replace("\r", "\n")
+            .replace("\u00a0", " ").replace("\u200b", ""))
+
+
+def utf16_length(text):
+    """자바스크립트 문자열 길이와 같은 UTF-16 코드 단위 길이"""
+    return len(text.encode("utf-16-le")) // 2
+
+
+FNV_OFFSET_BASIS = 0x811c9dc5
+
+
+def fnv1a_hash(text, h=FNV_OFFSET_BASIS):
+    """에디터 스크립트와 동일한 FNV-1a 32비트 해시 계산 (h에 이전 해시를 주면 이어서 계산)"""
+    units = array("H")
+    units.frombytes(text.encode("utf-16-le"))
+    for unit in units:
+        h = ((h ^ unit) * 0x01000193) & 0xFFFFFFFF
+    return h
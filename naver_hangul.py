@@ -0,0 +1,110 @@
+"""한글을 음절/단어 단위 조합 문자열로 입력하는 모듈 (자모 단위 IME 처리 회피)"""
+import random
+import re
+import time
+from selenium.webdriver.common.keys import Keys
+
+# 입력 단위
+GRANULARITY_WORD = "word"
+GRANULARITY_SYLLABLE = "syllable"
+
+# 입력 방식 (BrowserThread.input_mode 값과 설명)
+INPUT_MODES = {
+    "word": "한글 단어 단위 조합 입력",
+    "syllable": "한글 음절 단위 조합 입력",
+    "keys": "글자 단위 키 입력",
+}
+DEFAULT_INPUT_MODE = "word"
+
+# 완성형 한글 음절 범위
+HANGUL_SYLLABLE_START = 0xAC00
+HANGUL_SYLLABLE_END = 0xD7A3
+
+HANGUL_PATTERN = re.compile("[\uac00-\ud7a3\u1100-\u11ff\u3130-\u318f]")
+
+# 단어 단위: 공백이 아닌 글자 묶음 + 뒤따르는 공백, 줄바꿈은 따로 분리
+WORD_PATTERN = re.compile(r"\n|[^\s]+[^\S\n]*|[^\S\n]+")
+
+# CDP를 쓸 수 없을 때 조합 이벤트를 흉내 내는 스크립트
+COMPOSITION_SCRIPT = """
+    var el = document.activeElement || arguments[0];
+    var text = arguments[1];
+    el.dispatchEvent(new CompositionEvent('compositionstart', {bubbles: true, data: ''}));
+    el.dispatchEvent(new CompositionEvent('compositionupdate', {bubbles: true, data: text}));
+    document.execCommand('insertText', false, text);
+    el.dispatchEvent(new CompositionEvent('compositionend', {bubbles: true, data: text}));
+"""
+
+
+def contains_hangul(text):
+    """한글 포함 여부"""
+    return bool(HANGUL_PATTERN.search(text))
+
+
+def keystroke_count(char):
+    """사람이 두벌식 자판으로 입력할 때의 대략적인 키 입력 수"""
+    code = ord(char)
+    if HANGUL_SYLLABLE_START <= code <= HANGUL_SYLLABLE_END:
+        # 초성 + 중성 (+ 종성)
+        return 3 if (code - HANGUL_SYLLABLE_START) % 28 else 2
+    return 1
+
+
+def split_units(text, granularity=GRANULARITY_WORD):
+    """조합 입력 단위로 텍스트 분할"""
+    if granularity == GRANULARITY_SYLLABLE:
+        return list(text)
+    return WORD_PATTERN.findall(text)
+
+
+class HangulComposer:
+    """완성된 음절 또는 단어를 조합 문자열로 한 번에 확정하며 사람 같은 시간 간격을 유지하는 입력기"""
+    def __init__(self, driver, typing_speed=(0.05, 0.15), granularity=GRANULARITY_WORD,
+                 progress=None, should_stop=None):
+        self.driver = driver
+        self.typing_speed = typing_speed
+        self.granularity = granularity
+        self.progress = progress  # 진행률(0~100) 콜백
+        self.should_stop = should_stop or (lambda: False)
+        self.use_cdp = True
+
+    def unit_delay(self, unit):
+        """단위를 사람이 직접 쳤을 때 걸리는 시간 (글자별 지연 x 키 입력 수)"""
+        keys = sum(keystroke_count(char) for char in unit)
+        return sum(random.uniform(*self.typing_speed) for _ in range(keys))
+
+    def commit(self, element, unit):
+        """조합 문자열을 확정 입력"""
+        if unit == "\n":
+            element.send_keys(Keys.ENTER)
+            return
+        if self.use_cdp:
+            try:
+                # IME와 같은 조합 과정(compositionstart/update/end)을 거쳐 한 번에 확정
+                self.driver.execute_cdp_cmd("Input.imeSetComposition", {
+                    "text": unit, "selectionStart": len(unit), "selectionEnd": len(unit)})
+                self.driver.execute_cdp_cmd("Input.insertText", {"text": unit})
+                return
+            except Exception:
+                self.use_cdp = False
+        self.driver.execute_script(COMPOSITION_SCRIPT, element, unit)
+
+    def type(self, element, text):
+        """텍스트를 조합 단위로 입력, 입력한 글자 수 반환"""
+        units = split_units(text, self.granularity)
+        total_chars = max(1, len(text))
+        typed = 0
+        reported = -1
+        for unit in units:
+            if self.should_stop():
+                break
+            self.commit(element, unit)
+            typed += len(unit)
+            time.sleep(self.unit_delay(unit))
+
+            # 진행 상황 업데이트 (10% 단위)
+            progress = typed * 10 // total_chars
+            if self.progress and progress != reported:
+                reported = progress
+                self.progress(progress * 10)
+        return typed
@@ -0,0 +1,233 @@
+"""글에 넣을 이미지를 별도 프로세스에서 변환하고 에디터에 한 번에 업로드하는 모듈"""
+import hashlib
+import os
+import shutil
+import time
+from concurrent.futures import ProcessPoolExecutor
+from selenium.webdriver.common.by import By
+
+try:
+    from PIL import Image, ImageOps
+except ImportError:
+    Image = None  # Pillow가 없으면 원본을 그대로 업로드
+
+# 변환된 이미지 저장 폴더 (원본 내용 해시로 이름을 붙여 재사용)
+IMAGE_CACHE_DIR = "image_cache"
+
+# 스마트에디터 본문 최대 너비에 맞춘 긴 변 최대 크기 (픽셀)
+MAX_IMAGE_SIZE = 1600
+
+# JPEG 재압축 품질
+JPEG_QUALITY = 85
+
+# 이미지 변환 프로세스 수 (None이면 CPU 수)
+IMAGE_WORKERS = None
+
+# 이미지 업로드 완료를 기다리는 최대 시간 (초)
+UPLOAD_TIMEOUT = 60
+
+IMAGE_FILE_FILTER = "이미지 파일 (*.jpg *.jpeg *.png *.gif *.webp *.bmp)"
+
+# 에디터 이미지 버튼 (파일 입력 요소를 만들게 함)
+IMAGE_BUTTON_SELECTORS = [
+    "button.se-image-toolbar-button",
+    "button[data-name='image']",
+    ".se-toolbar-item-image button",
+]
+
+# 파일 선택 창 대신 에디터가 만든 파일 입력 요소를 문서에 남겨두는 스크립트
+FILE_INPUT_SCRIPT = """
+    if (!window.__naverUploadPatched) {
+        window.__naverUploadPatched = true;
+        var originalClick = HTMLInputElement.prototype.click;
+        HTMLInputElement.prototype.click = function () {
+            if (this.type === 'file') {
+                this.setAttribute('data-upload-target', '1');
+                if (!this.isConnected) {
+                    this.style.display = 'none';
+                    document.body.appendChild(this);
+                }
+                return;
+            }
+            return originalClick.apply(this, arguments);
+        };
+    }
+"""
+
+FILE_INPUT_SELECTOR = "input[type='file'][data-upload-target], input[type='file'][accept*='image']"
+
+IMAGE_COMPONENT_SELECTOR = ".se-component.se-image"
+
+
+def file_sha256(path, block_size=1024 * 1024):
+    """파일 내용 SHA-256 해시"""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(block_size), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def process_image(path, cache_dir=IMAGE_CACHE_DIR, max_size=MAX_IMAGE_SIZE, quality=JPEG_QUALITY):
+    """이미지 크기 조정, 재압축, 메타데이터(EXIF/GPS) 제거 후 캐시 경로 반환 (작업 프로세스에서 실행)"""
+    digest = file_sha256(path)
+    os.makedirs(cache_dir, exist_ok=True)
+
+    if Image is None:
+        # Pillow가 없으면 변환 없이 원본 복사본 사용
+        extension = os.path.splitext(path)[1].lower() or ".jpg"
+        output = os.path.join(cache_dir, f"{digest}{extension}")
+        if not os.path.exists(output):
+            shutil.copyfile(path, output)
+        return os.path.abspath(output)
+
+    with Image.open(path) as image:
+        animated = getattr(image, "is_animated", False)
+        has_alpha = image.mode in ("RGBA", "LA", "P") and not animated
+        extension = ".gif" if animated else (".png" if has_alpha else ".jpg")
+        output = os.path.join(cache_dir, f"{digest}_{max_size}_{quality}{extension}")
+        if os.path.exists(output):
+            return os.path.abspath(output)
+
+        # 움직이는 GIF는 프레임이 깨지지 않도록 원본 유지
+        if animated:
+            shutil.copyfile(path, output)
+            return os.path.abspath(output)
+
+        # 촬영 방향 반영 후 EXIF 정보 없이 새 이미지로 저장
+        image = ImageOps.exif_transpose(image)
+        image.thumbnail((max_size, max_size), Image.LANCZOS)
+        temp_output = f"{output}.{os.getpid()}.tmp"
+        if has_alpha:
+            image.convert("RGBA").save(temp_output, "PNG", optimize=True)
+        else:
+            image.convert("RGB").save(temp_output, "JPEG", quality=quality, optimize=True, progressive=True)
+        os.replace(temp_output, output)
+    return os.path.abspath(output)
+
+
+class ImageBatch:
+    """변환 중인 이미지 묶음 (입력 순서대로 결과 반환)"""
+    def __init__(self, futures):
+        self.futures = futures
+
+    def __len__(self):
+        return len(self.futures)
+
+    def done(self):
+        return all(future.done() for future in self.futures)
+
+    def result(self, timeout=None):
+        """모든 이미지 변환이 끝날 때까지 기다려 업로드할 경로 목록 반환"""
+        return [future.result(timeout) for future in self.futures]
+
+    def resolved(self):
+        """변환이 끝날 때까지 기다려 다른 프로세스로 넘길 수 있는 묶음 반환"""
+        return ImageBatch([_DoneFuture(path) for path in self.result()])
+
+
+class _DoneFuture:
+    """이미 변환된 이미지 결과"""
+    def __init__(self, value):
+        self.value = value
+
+    def done(self):
+        return True
+
+    def result(self, timeout=None):
+        return self.value
+
+
+class ImagePipeline:
+    """프로세스 풀에서 이미지를 변환하고 같은 파일은 다시 변환하지 않는 파이프라인"""
+    def __init__(self, cache_dir=IMAGE_CACHE_DIR, max_size=MAX_IMAGE_SIZE, quality=JPEG_QUALITY,
+                 max_workers=IMAGE_WORKERS):
+        self.cache_dir = cache_dir
+        self.max_size = max_size
+        self.quality = quality
+        self.max_workers = max_workers
+        self.executor = None
+        self.memo = {}  # (경로, 크기, 수정 시각) -> 변환된 경로
+
+    def file_key(self, path):
+        stat = os.stat(path)
+        return os.path.abspath(path), stat.st_size, stat.st_mtime_ns
+
+    def submit(self, paths):
+        """이미지 변환 작업 시작 (즉시 반환, 결과는 ImageBatch.result()로 받음)"""
+        futures = []
+        for path in paths:
+            key = self.file_key(path)
+            if key in self.memo:
+                futures.append(_DoneFuture(self.memo[key]))
+                continue
+            if self.executor is None:
+                self.executor = ProcessPoolExecutor(max_workers=self.max_workers)
+            future = self.executor.submit(process_image, key[0], self.cache_dir, self.max_size, self.quality)
+            future.add_done_callback(lambda f, key=key: self.remember(key, f))
+            futures.append(future)
+        return ImageBatch(futures)
+
+    def remember(self, key, future):
+        """변환 결과 기록 (같은 파일을 다시 발행할 때 바로 사용)"""
+        if not future.cancelled() and future.exception() is None:
+            self.memo[key] = future.result()
+
+    def shutdown(self):
+        """작업 프로세스 종료"""
+        if self.executor is not None:
+            self.executor.shutdown(wait=False, cancel_futures=True)
+            self.executor = None
+
+
+class EditorImageUploader:
+    """에디터의 파일 입력 요소에 여러 이미지를 한 번에 전달해 업로드하는 클래스 (에디터 프레임 안에서 사용)"""
+    def __init__(self, driver, log=print):
+        self.driver = driver
+        self.log = log
+
+    def find_file_input(self, timeout=5):
+        """이미지 파일 입력 요소 찾기 (없으면 이미지 버튼을 눌러 만들게 함)"""
+        inputs = self.driver.find_elements(By.CSS_SELECTOR, FILE_INPUT_SELECTOR)
+        if inputs:
+            return inputs[-1]
+
+        self.driver.execute_script(FILE_INPUT_SCRIPT)
+        for selector in IMAGE_BUTTON_SELECTORS:
+            buttons = self.driver.find_elements(By.CSS_SELECTOR, selector)
+            if buttons:
+                buttons[0].click()
+                break
+
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            inputs = self.driver.find_elements(By.CSS_SELECTOR, FILE_INPUT_SELECTOR)
+            if inputs:
+                return inputs[-1]
+            time.sleep(0.2)
+        return None
+
+    def image_count(self):
+        return len(self.driver.find_elements(By.CSS_SELECTOR, IMAGE_COMPONENT_SELECTOR))
+
+    def upload(self, paths, timeout=UPLOAD_TIMEOUT):
+        """이미지 묶음 업로드 후 에디터에 추가된 이미지 수 반환"""
+        if not paths:
+            return 0
+        file_input = self.find_file_input()
+        if file_input is None:
+            raise Exception("이미지 파일 입력 요소를 찾을 수 없습니다")
+
+        before = self.image_count()
+        # 여러 파일을 한 번에 받도록 설정 후 줄바꿈으로 구분한 경로 전달
+        self.driver.execute_script("arguments[0].multiple = true;", file_input)
+        file_input.send_keys("\n".join(paths))
+        self.log(f"이미지 {len(paths)}개 업로드 중...")
+
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            added = self.image_count() - before
+            if added >= len(paths):
+                return added
+            time.sleep(0.5)
+        return self.image_count() - before
@@ -0,0 +1,152 @@
+"""여러 글을 연속 발행할 때 작업 상태를 추가 기록 방식으로 남겨 중복/누락 발행을 막는 모듈"""
+import json
+import os
+import threading
+import time
+import uuid
+
+# 발행 작업 기록 파일 (한 줄에 상태 변경 하나씩 추가)
+JOURNAL_FILE = "naver_post_journal.jsonl"
+
+# 작업 상태 (순서대로 진행)
+STATE_QUEUED = "queued"
+STATE_EDITOR_OPEN = "editor-open"
+STATE_TYPED = "typed"
+STATE_PUBLISH_CLICKED = "publish-clicked"
+STATE_CONFIRMED = "confirmed"
+STATE_FAILED = "failed"
+
+JOB_STATES = {
+    STATE_QUEUED: "대기",
+    STATE_EDITOR_OPEN: "에디터 열림",
+    STATE_TYPED: "입력 완료",
+    STATE_PUBLISH_CLICKED: "발행 확인 필요",
+    STATE_CONFIRMED: "발행 완료",
+    STATE_FAILED: "실패",
+}
+
+# 발행 버튼을 누른 뒤 중단된 작업 (실제로 발행됐는지 블로그에서 확인해야 함)
+AMBIGUOUS_STATES = (STATE_PUBLISH_CLICKED,)
+
+# 끝난 작업
+FINISHED_STATES = (STATE_CONFIRMED, STATE_FAILED)
+
+
+class PostJournal:
+    """발행 작업 상태를 먼저 기록하고 작업을 진행하는 선행 기록(write-ahead) 저널"""
+    def __init__(self, journal_file=JOURNAL_FILE):
+        self.journal_file = journal_file
+        self.jobs = {}  # 작업 ID -> 마지막 상태가 반영된 작업 정보 (대기열 순서 유지)
+        self.lock = threading.Lock()
+        self.replay()
+
+    def replay(self):
+        """기록을 처음부터 다시 읽어 작업별 마지막 상태 복원"""
+        self.jobs = {}
+        if not os.path.exists(self.journal_file):
+            return
+        try:
+            with open(self.journal_file, "rb") as f:
+                data = f.read()
+            valid_size = 0
+            for line in data.splitlines(keepends=True):
+                if not line.endswith(b"\n"):
+                    break
+                valid_size += len(line)
+                try:
+                    entry = json.loads(line.decode("utf-8"))
+                except (UnicodeDecodeError, json.JSONDecodeError):
+                    continue
+                job = self.jobs.setdefault(entry.pop("job"), {})
+                job.update(entry)
+
+            # 기록 도중 중단된 마지막 줄은 잘라내야 다음 기록이 이어 붙지 않음
+            if valid_size < len(data):
+                with open(self.journal_file, "r+b") as f:
+                    f.truncate(valid_size)
+        except Exception as e:
+            print(f"발행 작업 기록 로드 실패: {e}")
+
+    def append(self, job_id, state, **fields):
+        """작업 상태 변경을 파일에 추가하고 디스크에 반영될 때까지 대기"""
+        entry = {"job": job_id, "state": state, "time": time.time(), **fields}
+        line = json.dumps(entry, ensure_ascii=False)
+        with self.lock:
+            with open(self.journal_file, "a", encoding="utf-8") as f:
+                f.write(line + "\n")
+                f.flush()
+                os.fsync(f.fileno())  # 파일 시스템 동기화
+            entry.pop("job")
+            self.jobs.setdefault(job_id, {}).update(entry)
+
+    def enqueue(self, blog_id, title, content, category=None, format_blocks=False, job_id=None):
+        """발행할 글을 대기열에 추가하고 작업 ID 반환 (이미 있는 작업 ID면 다시 추가하지 않음)"""
+        if job_id is not None and job_id in self.jobs:
+            return job_id
+        job_id = job_id or uuid.uuid4().hex
+        self.append(job_id, STATE_QUEUED, blog_id=blog_id, title=title, content=content,
+                    category=category, format_blocks=format_blocks, queued_at=time.time())
+        return job_id
+
+    def get(self, job_id):
+        return self.jobs.get(job_id)
+
+    def state(self, job_id):
+        job = self.jobs.get(job_id)
+        return job.get("state") if job else None
+
+    def pending_jobs(self):
+        """아직 끝나지 않은 작업 (작업 ID, 작업 정보) 목록 (대기열 순서)"""
+        with self.lock:
+            return [(job_id, dict(job)) for job_id, job in self.jobs.items()
+                    if job.get("state") not in FINISHED_STATES]
+
+    def confirmed_posts(self, since):
+        """since(time.time()) 이후 발행이 확인된 글의 (블로그 ID, 발행 시각) 목록 (발행 속도 제한 복원용)"""
+        with self.lock:
+            return [(job.get("blog_id"), job["time"]) for job in self.jobs.values()
+                    if job.get("state") == STATE_CONFIRMED and job.get("time", 0) >= since]
+
+    def compact(self):
+        """끝난 작업을 정리하고 남은 작업의 마지막 상태만 다시 기록"""
+        with self.lock:
+            lines = []
+            for job_id, job in self.jobs.items():
+                if job.get("state") in FINISHED_STATES:
+                    continue
+                lines.append(json.dumps({"job": job_id, **job}, ensure_ascii=False))
+            try:
+                temp_file = f"{self.journal_file}.temp"
+                with open(temp_file, "w", encoding="utf-8") as f:
+                    f.write("".join(line + "\n" for line in lines))
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.replace(temp_file, self.journal_file)
+                self.jobs = {job_id: job for job_id, job in self.jobs.items()
+                             if job.get("state") not in FINISHED_STATES}
+                return True
+            except Exception as e:
+                print(f"발행 작업 기록 정리 실패: {e}")
+                return False
+
+
+def resolve_ambiguous_job(journal, job_id, find_post, log=print):
+    """발행 버튼을 누른 뒤 중단된 작업이 실제로 발행됐는지 확인해 상태 정리, 발행됐으면 True"""
+    # find_post(blog_id, title, after_log_no): after_log_no보다 뒤에 발행된 글 주소 반환 (없으면 None)
+    job = journal.get(job_id)
+    if not job or job.get("state") not in AMBIGUOUS_STATES:
+        return False
+
+    last_log_no = job.get("last_log_no")
+    if last_log_no is None and not job.get("post_url"):
+        log("발행 전 글 번호가 기록되지 않아 제목만으로 발행 여부를 확인합니다.")
+    post_url = job.get("post_url") or find_post(job["blog_id"], job["title"], last_log_no)
+    if post_url:
+        journal.append(job_id, STATE_CONFIRMED, post_url=post_url, recovered=True)
+        log(f"이미 발행된 글을 확인했습니다: {post_url}")
+        return True
+
+    # 발행되지 않았으면 처음부터 다시 진행
+    journal.append(job_id, STATE_QUEUED, recovered=True)
+    log(f"'{job['title']}' 글은 발행되지 않아 다시 발행합니다.")
+    return False
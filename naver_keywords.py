@@ -0,0 +1,235 @@
+"""금지어/주의어 목록으로 글을 미리 검사하는 모듈 (Aho-Corasick 오토마톤, 목록이 바뀔 때만 다시 생성)"""
+import hashlib
+import html
+import os
+import pickle
+import re
+import unicodedata
+from collections import deque, namedtuple
+from naver_text_source import as_source
+
+# 금지어 목록 파일 (한 줄에 하나, '#'으로 시작하면 주석, '!'로 시작하면 금지어, 나머지는 주의어)
+KEYWORDS_FILE = "naver_keywords.txt"
+
+# 오토마톤 캐시 파일 확장자 (목록 파일 옆에 저장)
+CACHE_SUFFIX = ".cache"
+
+# 정규화 방식이나 오토마톤 구조가 바뀌면 올려서 이전 캐시를 쓰지 않도록 함
+CACHE_VERSION = 2
+
+# 검사 수준
+LEVEL_BLOCK = "block"  # 발행하면 안 되는 표현
+LEVEL_WARN = "warn"  # 확인이 필요한 표현
+
+LEVELS = {
+    LEVEL_BLOCK: "금지어",
+    LEVEL_WARN: "주의어",
+}
+
+# 검사 결과 (start, end: 원문 위치, keyword: 목록에 적힌 표현)
+KeywordMatch = namedtuple("KeywordMatch", ["start", "end", "keyword", "level"])
+
+# 글자별 정규화 결과 (같은 글자를 매번 다시 정규화하지 않도록)
+_normalized_chars = {}
+
+
+def normalize_char(ch):
+    """비교용 글자 (전각/반각, 대소문자 통일, 공백과 문장 부호는 빈 문자열)
+
+    '카 지 노', '카.지.노', 'ＣＡＳＩＮＯ'처럼 띄어 쓰거나 기호를 넣은 변형도 같은 표현으로 찾는다.
+    """
+    normalized = _normalized_chars.get(ch)
+    if normalized is None:
+        normalized = "".join(c for c in unicodedata.normalize("NFKC", ch).lower() if c.isalnum())
+        _normalized_chars[ch] = normalized
+    return normalized
+
+
+def normalize_keyword(keyword):
+    return "".join(normalize_char(ch) for ch in unicodedata.normalize("NFC", keyword))
+
+
+def read_keywords(keywords_file):
+    """목록 파일에서 (표현, 수준) 목록 읽기"""
+    keywords = []
+    with open(keywords_file, "r", encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+            if line.startswith("!"):
+                keywords.append((line[1:].strip(), LEVEL_BLOCK))
+            else:
+                keywords.append((line, LEVEL_WARN))
+    return keywords
+
+
+class KeywordAutomaton:
+    """여러 표현을 한 번에 찾는 Aho-Corasick 오토마톤 (목록 크기와 관계없이 글 길이에 비례해 검사)"""
+    def __init__(self, keywords):
+        patterns = {}  # 정규화한 표현 -> (원래 표현, 수준), 같은 표현은 금지어 우선
+        for keyword, level in keywords:
+            normalized = normalize_keyword(keyword)
+            if not normalized:
+                continue
+            if normalized not in patterns or level == LEVEL_BLOCK:
+                patterns[normalized] = (keyword, level)
+
+        self.keywords = []  # 표현 번호 -> (원래 표현, 수준, 정규화한 길이)
+        self.max_length = 0
+        self.goto = [{}]  # 상태 -> {글자: 다음 상태}
+        self.outputs = [[]]  # 상태 -> 이 상태에서 끝나는 표현 번호
+        for normalized, (keyword, level) in patterns.items():
+            state = 0
+            for ch in normalized:
+                next_state = self.goto[state].get(ch)
+                if next_state is None:
+                    next_state = len(self.goto)
+                    self.goto.append({})
+                    self.outputs.append([])
+                    self.goto[state][ch] = next_state
+                state = next_state
+            self.outputs[state].append(len(self.keywords))
+            self.keywords.append((keyword, level, len(normalized)))
+            self.max_length = max(self.max_length, len(normalized))
+
+        # 실패 링크와 출력 링크 (실패 링크를 따라가며 표현이 끝나는 가장 가까운 상태)
+        self.fail = [0] * len(self.goto)
+        self.output_link = [0] * len(self.goto)
+        queue = deque(self.goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for ch, next_state in self.goto[state].items():
+                queue.append(next_state)
+                fallback = self.fail[state]
+                while fallback and ch not in self.goto[fallback]:
+                    fallback = self.fail[fallback]
+                target = self.goto[fallback].get(ch, 0)
+                self.fail[next_state] = target if target != next_state else 0
+                fail_state = self.fail[next_state]
+                self.output_link[next_state] = fail_state if self.outputs[fail_state] else self.output_link[fail_state]
+
+    def __len__(self):
+        return len(self.keywords)
+
+    def scan(self, text):
+        """글에서 찾은 표현 목록 (원문 위치 기준, 겹치는 표현도 모두 포함)
+
+        text는 문자열이나 본문 조각 목록 (조각 경계에 걸친 표현도 찾고, 위치는 조각을 이어 붙인 기준)
+        """
+        if not self.keywords:
+            return []
+        if isinstance(text, str):
+            text = [text]
+        goto = self.goto
+        fail = self.fail
+        outputs = self.outputs
+        output_link = self.output_link
+        origins = deque(maxlen=self.max_length)  # 최근 정규화한 글자의 원문 위치 (가장 긴 표현 길이만큼)
+        matches = []
+        state = 0
+        offset = 0
+        for chunk in text:
+            for index, ch in enumerate(chunk, offset):
+                for normalized in normalize_char(ch):
+                    origins.append(index)
+                    while state and normalized not in goto[state]:
+                        state = fail[state]
+                    state = goto[state].get(normalized, 0)
+                    node = state if outputs[state] else output_link[state]
+                    while node:
+                        for keyword_id in outputs[node]:
+                            keyword, level, length = self.keywords[keyword_id]
+                            matches.append(KeywordMatch(origins[-length], index + 1, keyword, level))
+                        node = output_link[node]
+            offset += len(chunk)
+        return matches
+
+
+class KeywordScanner:
+    """목록 파일의 표현으로 글을 검사하는 클래스 (오토마톤은 디스크에 캐시, 목록이 바뀌면 다시 생성)"""
+    def __init__(self, keywords_file=KEYWORDS_FILE):
+        self.keywords_file = keywords_file
+        self.automaton = KeywordAutomaton([])
+        self.mtime = None
+        self.load()
+
+    @property
+    def cache_file(self):
+        return self.keywords_file + CACHE_SUFFIX
+
+    def load(self):
+        """목록 파일 읽기 (캐시가 목록과 같으면 캐시 사용), 목록이 없으면 검사하지 않음"""
+        try:
+            self.mtime = os.path.getmtime(self.keywords_file)
+            with open(self.keywords_file, "rb") as f:
+                digest = hashlib.sha256(f.read()).hexdigest()
+        except OSError:
+            self.mtime = None
+            self.automaton = KeywordAutomaton([])
+            return
+
+        try:
+            with open(self.cache_file, "rb") as f:
+                cached = pickle.load(f)
+            if cached.get("version") == CACHE_VERSION and cached.get("digest") == digest:
+                self.automaton = cached["automaton"]
+                return
+        except Exception:
+            pass  # 캐시가 없거나 깨졌으면 다시 생성
+
+        try:
+            self.automaton = KeywordAutomaton(read_keywords(self.keywords_file))
+        except Exception as e:
+            print(f"금지어 목록 로드 실패: {e}")
+            return
+        try:
+            temp_file = f"{self.cache_file}.temp"
+            with open(temp_file, "wb") as f:
+                pickle.dump({"version": CACHE_VERSION, "digest": digest, "automaton": self.automaton}, f,
+                            protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(temp_file, self.cache_file)
+        except Exception as e:
+            print(f"금지어 캐시 저장 실패: {e}")
+
+    def set_keywords_file(self, keywords_file):
+        self.keywords_file = keywords_file
+        self.load()
+
+    def reload_if_changed(self):
+        """목록 파일이 바뀌었으면 다시 읽기, 다시 읽었으면 True"""
+        try:
+            mtime = os.path.getmtime(self.keywords_file)
+        except OSError:
+            mtime = None
+        if mtime == self.mtime:
+            return False
+        self.load()
+        return True
+
+    def scan(self, text):
+        return self.automaton.scan(text)
+
+    def scan_source(self, text_or_source):
+        """문자열이나 원고 파일 검사 (원고 파일은 전체를 메모리에 올리지 않고 문단 조각 단위로 읽음)"""
+        return self.scan(chunk.text for chunk in as_source(text_or_source).chunks())
+
+    def scan_post(self, title, content):
+        """제목과 본문 검사 (서식 블록 글의 HTML은 태그를 빼고 검사)"""
+        if "<" in content:
+            content = html.unescape(re.sub(r"<[^>]+>", " ", content))
+        return self.scan(f"{title}\n{content}")
+
+
+def summarize_matches(matches):
+    """검사 결과 안내 문구 (예: '금지어: 카지노 / 주의어: 대출, 수익 보장')"""
+    found = {}
+    for match in matches:
+        found.setdefault(match.level, [])
+        if match.keyword not in found[match.level]:
+            found[match.level].append(match.keyword)
+    return " / ".join(f"{LEVELS[level]}: {', '.join(found[level])}" for level in LEVELS if level in found)
+
+
+def has_blocked(matches):
+    return any(match.level == LEVEL_BLOCK for match in matches)
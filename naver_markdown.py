@@ -0,0 +1,293 @@
+"""Markdown/서식 텍스트를 블록 목록으로 바꿔 스마트에디터에 블록 단위로 넣는 모듈"""
+import html
+import re
+from html.parser import HTMLParser
+
+HEADING_PATTERN = re.compile(r"^(#{1,6})\s+(.*?)\s*#*\s*$")
+QUOTE_PATTERN = re.compile(r"^\s{0,3}>\s?(.*)$")
+UNORDERED_PATTERN = re.compile(r"^\s{0,3}[-*+]\s+(.*)$")
+ORDERED_PATTERN = re.compile(r"^\s{0,3}\d+[.)]\s+(.*)$")
+DIVIDER_PATTERN = re.compile(r"^\s{0,3}([-*_])(\s*\1){2,}\s*$")
+
+# 인라인 서식 (코드를 먼저 나누고 코드 밖에서만 링크 -> 굵게 -> 기울임 순서로 변환)
+INLINE_CODE = re.compile(r"`([^`]+)`")
+INLINE_LINK = re.compile(r"\[([^\]]+)\]\(([^)\s]+)\)")
+INLINE_BOLD = re.compile(r"\*\*(.+?)\*\*|__(.+?)__")
+INLINE_ITALIC = re.compile(r"(?<![*\w])\*(?!\s)(.+?)(?<!\s)\*(?!\*)|(?<![_\w])_(?!\s)(.+?)(?<!\s)_(?!\w)")
+
+
+def _link_html(match):
+    """링크 HTML (주소는 이미 이스케이프되어 있으므로 속성값에 필요한 따옴표만 바꿈)"""
+    href = match.group(2).replace('"', "&quot;")
+    return f'<a href="{href}">{match.group(1)}</a>'
+
+
+def _format_inline(text):
+    """코드가 아닌 부분의 링크/굵게/기울임을 HTML로 변환 (text는 이미 HTML 이스케이프된 상태)"""
+    result = INLINE_LINK.sub(_link_html, text)
+    result = INLINE_BOLD.sub(lambda m: f"<b>{m.group(1) or m.group(2)}</b>", result)
+    return INLINE_ITALIC.sub(lambda m: f"<i>{m.group(1) or m.group(2)}</i>", result)
+
+
+def _strip_inline(text):
+    """코드가 아닌 부분의 링크/굵게/기울임 기호 제거"""
+    result = INLINE_LINK.sub(r"\1", text)
+    result = INLINE_BOLD.sub(lambda m: m.group(1) or m.group(2), result)
+    return INLINE_ITALIC.sub(lambda m: m.group(1) or m.group(2), result)
+
+
+def inline_to_html(text):
+    """Markdown 인라인 서식을 HTML로 변환 (코드 안의 서식 기호는 그대로 유지)"""
+    # split 결과의 홀수 번째는 코드 내용
+    parts = INLINE_CODE.split(html.escape(text, quote=False))
+    return "".join(f"<code>{part}</code>" if index % 2 else _format_inline(part)
+                   for index, part in enumerate(parts))
+
+
+def inline_to_text(text):
+    """Markdown 인라인 서식 기호를 제거한 일반 텍스트"""
+    parts = INLINE_CODE.split(text)
+    return "".join(part if index % 2 else _strip_inline(part) for index, part in enumerate(parts))
+
+
+class Block:
+    """스마트에디터 컴포넌트 하나에 해당하는 본문 블록"""
+    def __init__(self, kind, html="", text="", level=0, items=None, ordered=False):
+        self.kind = kind  # heading, paragraph, quote, list, divider
+        self.html = html  # 인라인 서식이 적용된 HTML
+        self.text = text  # 서식 없는 텍스트
+        self.level = level  # 제목 단계
+        self.items = items or []  # 목록 항목 (html, text)
+        self.ordered = ordered
+
+    def to_html(self):
+        """블록 전체 HTML"""
+        if self.kind == "heading":
+            return f"<h{self.level}>{self.html}</h{self.level}>"
+        if self.kind == "quote":
+            return f"<blockquote><p>{self.html}</p></blockquote>"
+        if self.kind == "list":
+            tag = "ol" if self.ordered else "ul"
+            items = "".join(f"<li>{item_html}</li>" for item_html, _ in self.items)
+            return f"<{tag}>{items}</{tag}>"
+        if self.kind == "divider":
+            return "<hr>"
+        return f"<p>{self.html}</p>"
+
+    def to_text(self):
+        """블록 전체 일반 텍스트 (서식 붙여넣기를 지원하지 않을 때 사용)"""
+        if self.kind == "list":
+            lines = []
+            for index, (_, item_text) in enumerate(self.items, 1):
+                lines.append(f"{index}. {item_text}" if self.ordered else f"- {item_text}")
+            return "\n".join(lines)
+        if self.kind == "divider":
+            return "---"
+        return self.text
+
+    def __repr__(self):
+        return f"Block({self.kind!r}, {self.to_text()[:30]!r})"
+
+
+def _lines_block(kind, lines):
+    """여러 줄을 줄바꿈이 유지되는 블록 하나로 합침"""
+    return Block(kind,
+                 html="<br>".join(inline_to_html(line) for line in lines),
+                 text="\n".join(inline_to_text(line) for line in lines))
+
+
+def parse_markdown(text):
+    """Markdown 텍스트를 블록 목록으로 변환 (연속된 빈 줄은 블록 구분으로만 사용)"""
+    blocks = []
+    paragraph = []
+    quote = []
+    list_items = []
+    list_ordered = False
+
+    def flush():
+        nonlocal list_items
+        if paragraph:
+            blocks.append(_lines_block("paragraph", paragraph))
+            paragraph.clear()
+        if quote:
+            blocks.append(_lines_block("quote", quote))
+            quote.clear()
+        if list_items:
+            blocks.append(Block("list", items=list_items, ordered=list_ordered))
+            list_items = []
+
+    for line in text.replace("\r\n", "\n").replace("\r", "\n").split("\n"):
+        if not line.strip():
+            flush()
+            continue
+
+        heading = HEADING_PATTERN.match(line)
+        if heading:
+            flush()
+            content = heading.group(2)
+            blocks.append(Block("heading", html=inline_to_html(content), text=inline_to_text(content),
+                                level=len(heading.group(1))))
+            continue
+
+        if DIVIDER_PATTERN.match(line):
+            flush()
+            blocks.append(Block("divider"))
+            continue
+
+        quoted = QUOTE_PATTERN.match(line)
+        if quoted:
+            if paragraph or list_items:
+                flush()
+            quote.append(quoted.group(1))
+            continue
+
+        unordered = UNORDERED_PATTERN.match(line)
+        ordered = ORDERED_PATTERN.match(line)
+        if unordered or ordered:
+            item = (unordered or ordered).group(1)
+            if paragraph or quote or (list_items and list_ordered != bool(ordered)):
+                flush()
+            list_ordered = bool(ordered)
+            list_items.append((inline_to_html(item), inline_to_text(item)))
+            continue
+
+        if quote or list_items:
+            flush()
+        paragraph.append(line.strip())
+
+    flush()
+    return blocks
+
+
+class MarkdownBlocks:
+    """본문 소스를 문단 단위로 읽으면서 블록 생성 (큰 원고도 메모리 사용량 일정, 여러 번 순회 가능)"""
+    def __init__(self, source):
+        self.source = source
+
+    def __iter__(self):
+        for chunk in self.source.chunks():
+            yield from parse_markdown(chunk.text)
+
+
+class _RichTextParser(HTMLParser):
+    """QTextEdit.toHtml() 결과를 블록 목록으로 변환하는 파서"""
+    BLOCK_TAGS = {"p": "paragraph", "blockquote": "quote", "li": "item",
+                  "h1": "heading", "h2": "heading", "h3": "heading",
+                  "h4": "heading", "h5": "heading", "h6": "heading"}
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.blocks = []
+        self.lists = []  # 열린 목록 스택 (순서 여부, 항목 목록)
+        self.current = None  # 현재 블록 (종류, 단계)
+        self.html_parts = []
+        self.text_parts = []
+        self.inline_stack = []
+        self.in_body = False
+        self.formatted = False  # 일반 문단 외의 서식이 있었는지 여부
+        self.lines = []  # 빈 줄을 포함한 문단별 텍스트 (서식이 없을 때 Markdown으로 해석)
+
+    def handle_starttag(self, tag, attrs):
+        attrs = dict(attrs)
+        if tag == "body":
+            self.in_body = True
+        elif not self.in_body:
+            return
+        elif tag in ("ul", "ol"):
+            self.lists.append((tag == "ol", []))
+            self.formatted = True
+        elif tag in self.BLOCK_TAGS:
+            self.current = (self.BLOCK_TAGS[tag], int(tag[1]) if tag[0] == "h" and tag != "hr" else 0)
+            self.html_parts, self.text_parts = [], []
+            if tag != "p":
+                self.formatted = True
+        elif tag == "hr":
+            self.blocks.append(Block("divider"))
+            self.formatted = True
+        elif tag == "br":
+            self.html_parts.append("<br>")
+            self.text_parts.append("\n")
+        else:
+            self.open_inline(tag, attrs)
+
+    def open_inline(self, tag, attrs):
+        """인라인 서식 태그 열기 (Qt는 굵게/기울임을 span 스타일로 표현)"""
+        style = attrs.get("style") or ""
+        opened = []
+        if tag in ("b", "strong") or re.search(r"font-weight:\s*(bold|[6-9]00)", style):
+            opened.append("b")
+        if tag in ("i", "em") or "font-style:italic" in style.replace(" ", ""):
+            opened.append("i")
+        if tag == "u" or "text-decoration: underline" in style:
+            opened.append("u")
+        if tag == "a" and attrs.get("href"):
+            self.html_parts.append(f'<a href="{html.escape(attrs["href"])}">')
+            self.inline_stack.append(["a"])
+            self.formatted = True
+            return
+        for name in opened:
+            self.html_parts.append(f"<{name}>")
+            self.formatted = True
+        self.inline_stack.append(opened)
+
+    def handle_endtag(self, tag):
+        if not self.in_body:
+            return
+        if tag in ("ul", "ol") and self.lists:
+            ordered, items = self.lists.pop()
+            if items:
+                self.blocks.append(Block("list", items=items, ordered=ordered))
+        elif tag in self.BLOCK_TAGS and self.current:
+            kind, level = self.current
+            block_html = "".join(self.html_parts).strip()
+            block_text = "".join(self.text_parts).strip()
+            self.current = None
+            self.lines.append(block_text)
+            if kind == "item" and self.lists:
+                self.lists[-1][1].append((block_html, block_text))
+            elif block_text:
+                self.blocks.append(Block(kind, html=block_html, text=block_text, level=level))
+        elif tag not in ("body", "html", "br", "hr") and self.inline_stack:
+            for name in reversed(self.inline_stack.pop()):
+                self.html_parts.append(f"</{name}>")
+
+    def handle_data(self, data):
+        if self.in_body and self.current:
+            self.html_parts.append(html.escape(data, quote=False))
+            self.text_parts.append(data)
+
+
+def parse_rich_text(rich_html):
+    """QTextEdit 서식 HTML을 블록 목록으로 변환 (서식이 없으면 Markdown으로 해석)"""
+    parser = _RichTextParser()
+    parser.feed(rich_html)
+    parser.close()
+    if not parser.formatted:
+        return parse_markdown("\n".join(parser.lines))
+    return parser.blocks
+
+
+# 블록 HTML을 서식 붙여넣기 이벤트로 에디터에 전달하는 스크립트
+PASTE_BLOCK_SCRIPT = """
+    var target = document.activeElement || arguments[0];
+    var data = new DataTransfer();
+    data.setData('text/html', arguments[1]);
+    data.setData('text/plain', arguments[2]);
+    var event = new ClipboardEvent('paste', {clipboardData: data, bubbles: true, cancelable: true});
+    target.dispatchEvent(event);
+    if (!event.defaultPrevented) {
+        // 에디터가 붙여넣기를 처리하지 않으면 직접 HTML 삽입
+        document.execCommand('insertHTML', false, arguments[1]);
+    }
+    return event.defaultPrevented;
+"""
+
+
+class SmartEditorBlockInserter:
+    """블록 하나를 서식 붙여넣기 한 번으로 스마트에디터 컴포넌트로 넣는 클래스"""
+    def __init__(self, driver):
+        self.driver = driver
+
+    def insert(self, element, block):
+        """블록 삽입"""
+        self.driver.execute_script(PASTE_BLOCK_SCRIPT, element, block.to_html(), block.to_text())
@@ -0,0 +1,195 @@
+"""하나의 로그인된 브라우저에서 여러 블로그 에디터 탭을 번갈아 구동하는 모듈"""
+import heapq
+import random
+import time
+from selenium.webdriver.common.by import By
+from selenium.common.exceptions import StaleElementReferenceException, WebDriverException
+from naver_navigation import (PAGE_READY_CONDITIONS, EDITOR_IFRAME_SELECTOR,
+                              WritePagePrefetcher)
+from naver_editor import EditorVerifier
+from naver_hangul import DEFAULT_INPUT_MODE, HangulComposer, contains_hangul, split_units
+
+# 탭 하나가 글쓰기 페이지 준비를 기다리는 최대 시간 (초)
+TAB_READY_TIMEOUT = 20
+
+# 준비되지 않은 탭을 다시 확인하는 간격 (초)
+TAB_READY_POLL = 0.2
+
+
+class TabJob:
+    """탭 하나에서 진행되는 블로그 글 입력 작업"""
+    def __init__(self, blog_id, text):
+        self.blog_id = blog_id
+        self.text = text
+        self.handle = None  # 탭 핸들
+        self.frame = None  # 에디터 iframe 요소
+        self.editor = None  # 에디터 입력 요소
+        self.units = list(text)  # 한 번에 입력하는 단위 (글자 또는 한글 조합 단위)
+        self.unit_index = 0  # 다음에 입력할 단위
+        self.position = 0  # 입력한 글자 수
+        self.base = None  # 입력 시작 전 에디터 본문 길이 (검증 기준 위치)
+        self.state = "opening"  # opening -> typing -> done / failed
+        self.opened_at = 0
+        self.error = None
+
+    @property
+    def finished(self):
+        return self.state in ("done", "failed")
+
+
+class MultiTabScheduler:
+    """블로그별 탭을 열고 각 탭의 WebDriver 명령을 시간 순서대로 끼워 넣어 실행하는 스케줄러"""
+    def __init__(self, driver, locate_editor, write_router=None, typing_speed=(0.05, 0.15),
+                 log=print, should_stop=None, verify=True, input_mode=DEFAULT_INPUT_MODE):
+        self.driver = driver
+        self.locate_editor = locate_editor  # 현재 프레임에서 에디터 요소를 찾는 함수
+        self.write_router = write_router
+        self.typing_speed = typing_speed
+        self.log = log
+        self.should_stop = should_stop or (lambda: False)
+        self.verify = verify
+        self.input_mode = input_mode  # 한 탭에서 입력할 때와 같은 입력 방식 (BrowserThread.input_mode)
+        self.composer = HangulComposer(driver, typing_speed, input_mode, should_stop=self.should_stop)
+        self.prefetcher = WritePagePrefetcher(write_router)
+        self.active_job = None  # 현재 WebDriver 컨텍스트가 가리키는 작업
+
+    def run(self, blog_texts):
+        """블로그 ID -> 본문 목록을 병렬 입력하고 블로그별 결과(성공 여부, 메시지) 반환"""
+        jobs = [TabJob(blog_id, text) for blog_id, text in blog_texts]
+        for job in jobs:
+            if self.composing(job.text):
+                job.units = split_units(job.text, self.input_mode)
+        origin = self.driver.current_window_handle
+
+        # 모든 탭을 백그라운드에서 동시에 열기 (로그인 세션 공유)
+        now = time.monotonic()
+        queue = []
+        for index, job in enumerate(jobs):
+            try:
+                job.handle = self.prefetcher.prefetch(self.driver, job.blog_id)
+            except WebDriverException as e:
+                job.error = str(e)
+            if not job.handle:
+                job.state = "failed"
+                job.error = job.error or "탭을 열 수 없습니다"
+                continue
+            job.opened_at = now
+            heapq.heappush(queue, (now, index))
+        self.log(f"{len(queue)}개 블로그 탭을 열었습니다. 입력을 시작합니다...")
+
+        total_chars = sum(len(job.text) for job in jobs) or 1
+        reported = -1
+
+        # 가장 먼저 실행할 시각이 된 탭의 명령부터 하나씩 실행
+        while queue and not self.should_stop():
+            due, index = heapq.heappop(queue)
+            wait = due - time.monotonic()
+            if wait > 0:
+                time.sleep(wait)
+
+            job = jobs[index]
+            try:
+                delay = self.step(job)
+            except Exception as e:
+                job.state = "failed"
+                job.error = str(e)
+                self.log(f"[{job.blog_id}] 입력 실패: {e}")
+                delay = None
+
+            if delay is not None and not job.finished:
+                heapq.heappush(queue, (time.monotonic() + delay, index))
+
+            # 진행 상황 업데이트 (10% 단위)
+            progress = int(sum(job.position for job in jobs) * 10 / total_chars)
+            if progress != reported:
+                reported = progress
+                self.log(f"여러 블로그 입력 중... {progress * 10}%")
+
+        for job in jobs:
+            if not job.finished:
+                job.state = "failed"
+                job.error = job.error or "중단됨"
+
+        # 원래 탭으로 복귀
+        try:
+            self.driver.switch_to.window(origin)
+        except WebDriverException:
+            pass
+
+        return {
+            job.blog_id: (job.state == "done", job.error or "입력 완료")
+            for job in jobs
+        }
+
+    def step(self, job):
+        """작업의 다음 명령 한 개 실행 후 다음 실행까지의 지연 시간 반환"""
+        self.switch_to(job)
+
+        if job.state == "opening":
+            if not PAGE_READY_CONDITIONS["write_page"](self.driver):
+                if time.monotonic() - job.opened_at > TAB_READY_TIMEOUT:
+                    raise TimeoutError("글쓰기 페이지 로딩 시간 초과")
+                return TAB_READY_POLL
+            self.enter_editor(job)
+            job.editor.click()
+            if self.verify:
+                job.base = EditorVerifier(self.driver).text_length()
+            job.state = "typing"
+            self.log(f"[{job.blog_id}] 에디터 준비 완료")
+            return random.uniform(*self.typing_speed)
+
+        if job.position >= len(job.text):
+            if job.base is not None:
+                # 탭별로 누락/오류 구간만 다시 입력
+                matched, repaired = EditorVerifier(self.driver, self.log).verify_and_repair(job.text, job.base)
+                if not matched:
+                    raise RuntimeError("입력 내용 검증 실패")
+                if repaired:
+                    self.log(f"[{job.blog_id}] 누락/오류 {repaired}곳 복구")
+            job.state = "done"
+            self.log(f"[{job.blog_id}] 입력 완료")
+            return None
+
+        unit = job.units[job.unit_index]
+        try:
+            self.type_unit(job, unit)
+        except StaleElementReferenceException:
+            # 에디터가 다시 그려진 경우 요소를 새로 찾아 한 번 더 시도
+            self.enter_editor(job)
+            self.type_unit(job, unit)
+        job.unit_index += 1
+        job.position += len(unit)
+        if self.composing(job.text):
+            return self.composer.unit_delay(unit)
+        return random.uniform(*self.typing_speed)
+
+    def composing(self, text):
+        """한글 조합 입력 여부 (BrowserThread.type_with_input_mode와 같은 기준)"""
+        return self.input_mode in ("word", "syllable") and contains_hangul(text)
+
+    def type_unit(self, job, unit):
+        """입력 단위 하나 입력 (조합 입력이면 조합 문자열로 확정, 아니면 키 입력)"""
+        if self.composing(job.text):
+            self.composer.commit(job.editor, unit)
+        else:
+            job.editor.send_keys(unit)
+
+    def switch_to(self, job):
+        """작업의 탭과 에디터 프레임으로 컨텍스트 전환 (이미 가리키고 있으면 생략)"""
+        if self.active_job is job:
+            return
+        self.driver.switch_to.window(job.handle)
+        if job.frame is not None:
+            self.driver.switch_to.frame(job.frame)
+        self.active_job = job
+
+    def enter_editor(self, job):
+        """탭의 에디터 iframe으로 들어가 입력 요소 찾기"""
+        self.driver.switch_to.default_content()
+        frames = self.driver.find_elements(By.CSS_SELECTOR, EDITOR_IFRAME_SELECTOR)
+        job.frame = frames[0] if frames else None
+        if job.frame is not None:
+            self.driver.switch_to.frame(job.frame)
+        job.editor = self.locate_editor()
+        if job.editor is None:
+            raise RuntimeError("에디터를 찾을 수 없습니다")
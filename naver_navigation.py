@@ -0,0 +1,402 @@
+"""네이버 블로그 페이지 이동 및 준비 상태 판단 모듈"""
+import json
+import os
+import re
+import threading
+import time
+from urllib.parse import unquote_plus
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.common.exceptions import TimeoutException, WebDriverException
+
+# 페이지 로딩 전략 (Selenium pageLoadStrategy 값과 설명)
+PAGE_LOAD_STRATEGIES = {
+    "normal": "전체 로딩 (모든 리소스 대기)",
+    "eager": "빠른 로딩 (DOM 구성 후 진행)",
+    "none": "즉시 진행 (준비 조건만 확인)",
+}
+DEFAULT_PAGE_LOAD_STRATEGY = "eager"
+
+# 준비 조건 대기 기본 시간 (초)
+DEFAULT_READY_TIMEOUT = 15
+
+# 블로그별 글쓰기 진입 경로 기록 파일
+WRITE_ROUTES_FILE = "naver_write_routes.json"
+
+# 블로그 홈의 글쓰기 버튼 선택자 (우선순위 순)
+WRITE_BUTTON_SELECTORS = [
+    "a.col._checkBlock._rosRestrict[href*='postwrite']",
+    "a[href*='postwrite']",
+    "a[onclick*='prf.write']",
+    ".btn_write, .link_write",
+    "a[href*='PostWrite.naver']"
+]
+
+# 글쓰기 링크 선택자 (블로그 홈 준비 조건)
+WRITE_LINK_SELECTOR = (
+    "a[href*='postwrite'], a[href*='PostWrite.naver'], "
+    "a[onclick*='prf.write'], .btn_write, .link_write"
+)
+
+# 에디터 iframe 선택자 (글쓰기 페이지 준비 조건)
+EDITOR_IFRAME_SELECTOR = (
+    "iframe[id*='Editor'], iframe[id*='editor'], iframe[class*='se_'], iframe#mainFrame"
+)
+
+
+def _selector_exists_script(selector):
+    """최상위 문서와 같은 출처의 iframe 문서에서 선택자를 찾는 스크립트 생성"""
+    return """
+        var selector = arguments[0];
+        if (document.querySelector(selector)) {
+            return true;
+        }
+        var frames = document.getElementsByTagName('iframe');
+        for (var i = 0; i < frames.length; i++) {
+            try {
+                var doc = frames[i].contentDocument;
+                if (doc && doc.querySelector(selector)) {
+                    return true;
+                }
+            } catch (e) {
+                // 다른 출처의 iframe은 건너뜀
+            }
+        }
+        return false;
+    """, selector
+
+
+def _selector_ready(selector):
+    """선택자가 존재하면 준비된 것으로 판단하는 조건 함수 생성"""
+    script, arg = _selector_exists_script(selector)
+
+    def condition(driver):
+        try:
+            return bool(driver.execute_script(script, arg))
+        except WebDriverException:
+            # 페이지 전환 중에는 스크립트 실행이 실패할 수 있음
+            return False
+    return condition
+
+
+def _dom_interactive(driver):
+    """DOM 구성이 끝났으면 준비된 것으로 판단"""
+    try:
+        return driver.execute_script("return document.readyState") in ("interactive", "complete")
+    except WebDriverException:
+        return False
+
+
+# 페이지별 준비 조건 (자동화가 조작을 시작할 수 있는 시점)
+PAGE_READY_CONDITIONS = {
+    "login": _selector_ready("input[name='id'], #log\\.login"),
+    "blog_home": _selector_ready(WRITE_LINK_SELECTOR),
+    "write_page": _selector_ready(EDITOR_IFRAME_SELECTOR),
+}
+
+
+def apply_page_load_strategy(options, strategy):
+    """브라우저 옵션에 페이지 로딩 전략 적용"""
+    if strategy not in PAGE_LOAD_STRATEGIES:
+        strategy = DEFAULT_PAGE_LOAD_STRATEGY
+    options.page_load_strategy = strategy
+    return options
+
+
+def wait_until_ready(driver, page=None, timeout=DEFAULT_READY_TIMEOUT):
+    """페이지가 조작 가능한 상태가 될 때까지 대기"""
+    condition = PAGE_READY_CONDITIONS.get(page, _dom_interactive)
+    try:
+        WebDriverWait(driver, timeout, poll_frequency=0.1).until(condition)
+        return True
+    except TimeoutException:
+        return False
+
+
+def navigate(driver, url, page=None, timeout=DEFAULT_READY_TIMEOUT):
+    """URL로 이동한 뒤 페이지별 준비 조건이 충족되면 바로 반환"""
+    try:
+        driver.get(url)
+    except TimeoutException:
+        # 페이지 로딩 시간 초과여도 준비 조건을 만족하면 계속 진행
+        pass
+    return wait_until_ready(driver, page, timeout)
+
+
+def open_write_page_direct(driver, blog_id, timeout=DEFAULT_READY_TIMEOUT):
+    """postwrite URL로 바로 이동 (블로그 홈 생략)"""
+    ready = navigate(driver, f"https://blog.naver.com/{blog_id}/postwrite", "write_page", timeout)
+    # 로그인 페이지로 튕기면 실패로 판단
+    return ready and "nidlogin" not in driver.current_url
+
+
+def open_write_page_legacy(driver, blog_id, timeout=DEFAULT_READY_TIMEOUT):
+    """기존 PostWrite.naver URL로 이동"""
+    ready = navigate(driver, f"https://blog.naver.com/PostWrite.naver?blogId={blog_id}",
+                     "write_page", timeout)
+    return ready and "nidlogin" not in driver.current_url
+
+
+def open_write_page_by_click(driver, blog_id, timeout=DEFAULT_READY_TIMEOUT):
+    """블로그 홈에서 글쓰기 버튼을 눌러 이동"""
+    navigate(driver, f"https://blog.naver.com/{blog_id}", "blog_home", timeout)
+    for selector in WRITE_BUTTON_SELECTORS:
+        try:
+            write_button = WebDriverWait(driver, 3).until(
+                EC.element_to_be_clickable((By.CSS_SELECTOR, selector))
+            )
+            write_button.click()
+            break
+        except Exception:
+            continue
+    else:
+        return False
+    return wait_until_ready(driver, "write_page", timeout)
+
+
+class WriteRouteRouter:
+    """블로그별로 성공한 글쓰기 진입 경로와 소요 시간을 기록하고 경로를 선택하는 클래스"""
+    ROUTES = {
+        "direct": open_write_page_direct,
+        "legacy": open_write_page_legacy,
+        "click": open_write_page_by_click,
+    }
+    DEFAULT_ORDER = ["direct", "click", "legacy"]
+
+    def __init__(self, routes_file=WRITE_ROUTES_FILE):
+        self.routes_file = routes_file
+        self.records = {}
+        self.lock = threading.Lock()
+        self.load_records()
+
+    def load_records(self):
+        """저장된 경로 기록 로드"""
+        try:
+            if os.path.exists(self.routes_file):
+                with open(self.routes_file, "r", encoding="utf-8") as f:
+                    self.records = json.load(f)
+        except Exception as e:
+            print(f"글쓰기 경로 기록 로드 실패: {e}")
+            self.records = {}
+
+    def save_records(self):
+        """경로 기록 저장"""
+        try:
+            with self.lock:
+                data = json.dumps(self.records, ensure_ascii=False, indent=2)
+            temp_file = f"{self.routes_file}.temp"
+            with open(temp_file, "w", encoding="utf-8") as f:
+                f.write(data)
+            os.replace(temp_file, self.routes_file)
+            return True
+        except Exception as e:
+            print(f"글쓰기 경로 기록 저장 실패: {e}")
+            return False
+
+    def route_order(self, blog_id):
+        """시도할 경로 순서 반환 (마지막으로 성공한 경로 우선)"""
+        record = self.records.get(blog_id)
+        order = list(self.DEFAULT_ORDER)
+        if record and record.get("route") in order:
+            order.remove(record["route"])
+            order.insert(0, record["route"])
+        return order
+
+    def record_success(self, blog_id, route, elapsed):
+        """경로 성공 기록"""
+        with self.lock:
+            record = self.records.setdefault(blog_id, {"stats": {}})
+            stats = record["stats"].setdefault(route, {"success": 0, "failure": 0, "avg_seconds": None})
+            stats["success"] += 1
+            # 평균 소요 시간은 지수 이동 평균으로 갱신
+            if stats["avg_seconds"] is None:
+                stats["avg_seconds"] = round(elapsed, 3)
+            else:
+                stats["avg_seconds"] = round(stats["avg_seconds"] * 0.7 + elapsed * 0.3, 3)
+            record["route"] = route
+        self.save_records()
+
+    def record_failure(self, blog_id, route):
+        """경로 실패 기록"""
+        with self.lock:
+            record = self.records.setdefault(blog_id, {"stats": {}})
+            stats = record["stats"].setdefault(route, {"success": 0, "failure": 0, "avg_seconds": None})
+            stats["failure"] += 1
+            if record.get("route") == route:
+                record.pop("route")
+
+    def open_write_page(self, driver, blog_id, log=print, timeout=DEFAULT_READY_TIMEOUT):
+        """기록된 경로 순서대로 글쓰기 페이지 진입 시도, 성공한 경로 이름 반환"""
+        for route in self.route_order(blog_id):
+            started = time.monotonic()
+            try:
+                success = self.ROUTES[route](driver, blog_id, timeout)
+            except Exception as e:
+                log(f"글쓰기 경로 '{route}' 오류: {e}")
+                success = False
+            elapsed = time.monotonic() - started
+            if success:
+                self.record_success(blog_id, route, elapsed)
+                log(f"글쓰기 페이지로 이동했습니다. (경로: {route}, {elapsed:.1f}초)")
+                return route
+            self.record_failure(blog_id, route)
+            log(f"글쓰기 경로 '{route}' 실패, 다음 경로를 시도합니다.")
+        self.save_records()
+        return None
+
+
+# 백그라운드 탭에서도 페이지 로딩이 지연되지 않도록 하는 크롬 옵션
+BACKGROUND_TAB_ARGUMENTS = [
+    "--disable-background-timer-throttling",
+    "--disable-renderer-backgrounding",
+    "--disable-backgrounding-occluded-windows",
+]
+
+# URL로 바로 열 수 있는 글쓰기 경로
+WRITE_ROUTE_URLS = {
+    "direct": "https://blog.naver.com/{blog_id}/postwrite",
+    "legacy": "https://blog.naver.com/PostWrite.naver?blogId={blog_id}",
+}
+
+
+class WritePagePrefetcher:
+    """현재 글을 입력하는 동안 다음 글의 글쓰기 페이지를 백그라운드 탭에 미리 여는 클래스"""
+    def __init__(self, write_router=None):
+        self.write_router = write_router
+        self.tabs = {}  # 블로그 ID -> 미리 연 탭 핸들
+        self.lock = threading.Lock()
+
+    def prefetch_url(self, blog_id):
+        """미리 열 글쓰기 URL 결정 (URL로 열 수 있는 경로 중 기록상 우선 경로)"""
+        order = self.write_router.route_order(blog_id) if self.write_router else ["direct"]
+        for route in order:
+            if route in WRITE_ROUTE_URLS:
+                return WRITE_ROUTE_URLS[route].format(blog_id=blog_id)
+        return None
+
+    def prefetch(self, driver, blog_id):
+        """현재 탭을 유지한 채 백그라운드 탭에서 글쓰기 페이지 로딩 시작"""
+        with self.lock:
+            handle = self.tabs.get(blog_id)
+            if handle and handle in driver.window_handles:
+                return handle
+
+            url = self.prefetch_url(blog_id)
+            if not url:
+                return None
+
+            try:
+                # CDP로 백그라운드 탭 생성 (현재 탭의 포커스와 프레임은 그대로 유지)
+                result = driver.execute_cdp_cmd("Target.createTarget", {"url": url, "background": True})
+                handle = result["targetId"]
+            except Exception:
+                # CDP를 쓸 수 없으면 자바스크립트로 새 탭 열기
+                before = set(driver.window_handles)
+                driver.execute_script("window.open(arguments[0], '_blank');", url)
+                opened = set(driver.window_handles) - before
+                if not opened:
+                    return None
+                handle = opened.pop()
+
+            self.tabs[blog_id] = handle
+            return handle
+
+    def activate(self, driver, blog_id, close_current=True, timeout=DEFAULT_READY_TIMEOUT):
+        """미리 열어둔 글쓰기 탭으로 전환, 성공 여부 반환"""
+        with self.lock:
+            handle = self.tabs.pop(blog_id, None)
+        if not handle:
+            return False
+
+        try:
+            if handle not in driver.window_handles:
+                return False
+
+            # 작업이 끝난 현재 탭은 닫고 미리 연 탭으로 전환
+            current = driver.current_window_handle
+            if close_current and current != handle and len(driver.window_handles) > 1:
+                driver.switch_to.default_content()
+                driver.close()
+            driver.switch_to.window(handle)
+
+            if wait_until_ready(driver, "write_page", timeout) and "nidlogin" not in driver.current_url:
+                return True
+
+            # 준비되지 않은 탭은 닫고 일반 경로를 사용하도록 함
+            if len(driver.window_handles) > 1:
+                driver.close()
+                driver.switch_to.window(driver.window_handles[0])
+            return False
+        except Exception as e:
+            print(f"미리 연 글쓰기 탭 전환 실패: {e}")
+            return False
+
+    def discard(self, driver):
+        """사용하지 않은 미리 연 탭 모두 닫기"""
+        with self.lock:
+            handles = list(self.tabs.values())
+            self.tabs.clear()
+        try:
+            current = driver.current_window_handle
+            for handle in handles:
+                if handle != current and handle in driver.window_handles:
+                    driver.switch_to.window(handle)
+                    driver.close()
+            driver.switch_to.window(current)
+        except Exception:
+            pass
+
+
+# 블로그 최근 글 제목 목록 (로그인 세션으로 조회, 제목은 URL 인코딩됨)
+POST_TITLE_LIST_URL = (
+    "https://blog.naver.com/PostTitleListAsync.naver"
+    "?blogId={blog_id}&currentPage=1&countPerPage={count}"
+)
+
+# 블로그 글 주소
+POST_URL = "https://blog.naver.com/{blog_id}/{log_no}"
+
+# 페이지 안에서 같은 출처 요청으로 응답 본문을 받아오는 스크립트
+FETCH_TEXT_SCRIPT = """
+    var done = arguments[arguments.length - 1];
+    fetch(arguments[0], {credentials: 'include'})
+        .then(function (r) { return r.text(); })
+        .then(done)
+        .catch(function (e) { done(null); });
+"""
+
+POST_TITLE_PATTERN = re.compile(r'"logNo"\s*:\s*"(\d+)"\s*,\s*"title"\s*:\s*"([^"]*)"')
+
+
+def recent_post_titles(driver, blog_id, count=30):
+    """블로그 최근 글의 (글 번호, 제목) 목록 (목록을 받지 못하면 예외 발생)"""
+    # 같은 출처 요청이어야 로그인 세션이 적용됨
+    driver.switch_to.default_content()
+    if not driver.current_url.startswith("https://blog.naver.com/"):
+        navigate(driver, f"https://blog.naver.com/{blog_id}", "blog_home")
+    driver.set_script_timeout(DEFAULT_READY_TIMEOUT)
+    text = driver.execute_async_script(
+        FETCH_TEXT_SCRIPT, POST_TITLE_LIST_URL.format(blog_id=blog_id, count=count))
+    if text is None or "postList" not in text:
+        raise Exception("블로그 글 목록을 가져올 수 없습니다")
+    return [(log_no, unquote_plus(title).strip())
+            for log_no, title in POST_TITLE_PATTERN.findall(text)]
+
+
+def latest_log_no(driver, blog_id):
+    """최근 글 중 가장 큰 글 번호 (글이 없으면 0, 목록을 받지 못하면 예외 발생)"""
+    return max((int(log_no) for log_no, _ in recent_post_titles(driver, blog_id, count=5)), default=0)
+
+
+def find_post_by_title(driver, blog_id, title, after_log_no=None):
+    """최근 글 중 제목이 같은 글의 주소 반환 (없으면 None)
+
+    after_log_no: 발행 버튼을 누르기 전의 가장 큰 글 번호, 주어지면 그 뒤에 올라온 글만 인정
+    (같은 제목으로 자주 올리는 글이면 예전 글을 이번 글로 착각하지 않도록)
+    """
+    title = title.strip()
+    for log_no, post_title in recent_post_titles(driver, blog_id):
+        if post_title == title and (after_log_no is None or int(log_no) > after_log_no):
+            return POST_URL.format(blog_id=blog_id, log_no=log_no)
+    return None
@@ -0,0 +1,480 @@
+"""여러 계정의 브라우저 세션을 하나의 asyncio 이벤트 루프에서 진행하는 모듈 (명령줄 실행 가능)
+
+사용법: python naver_orchestrator.py jobs.json [--max-active 4] [--no-publish] [--headless | --virtual-display] [--low-memory]
+                                     [--posts-per-hour 6] [--blog-posts-per-hour 0] [--allow-duplicates]
+                                     [--keywords naver_keywords.txt] [--ignore-keywords]
+jobs.json: [{"account": "아이디", "password": "비밀번호", "blog_id": "블로그ID", "title": "제목", "content": "본문"}, ...]
+"""
+import argparse
+import asyncio
+import json
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+import undetected_chromedriver as uc
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support import expected_conditions as EC
+from naver_navigation import (DEFAULT_PAGE_LOAD_STRATEGY, EDITOR_IFRAME_SELECTOR, BACKGROUND_TAB_ARGUMENTS,
+                              apply_page_load_strategy, navigate, WriteRouteRouter, find_post_by_title,
+                              latest_log_no)
+from naver_hangul import (HangulComposer, split_units, DEFAULT_INPUT_MODE, GRANULARITY_WORD,
+                          GRANULARITY_SYLLABLE)
+from naver_publish import PublishConfirmer, PUBLISHED, PUBLISH_TIMEOUT, PUBLISH_POLL, enable_network_log
+from naver_journal import (AMBIGUOUS_STATES, STATE_EDITOR_OPEN, STATE_TYPED, STATE_PUBLISH_CLICKED,
+                           STATE_CONFIRMED, STATE_FAILED, resolve_ambiguous_job)
+from naver_display import (DEFAULT_DISPLAY_MODE, apply_display_mode, display_mode_from_args, prepare_driver,
+                           stop_virtual_display)
+from naver_resources import DEFAULT_CHROME_PROFILE, apply_chrome_profile
+from naver_watchdog import profile_dir
+from naver_rate_limit import RateLimiter, ACCOUNT_POSTS_PER_HOUR, BLOG_POSTS_PER_HOUR, format_rates
+from naver_dedup import DuplicateIndex, describe_duplicate, fingerprint
+from naver_keywords import KeywordScanner, KEYWORDS_FILE, LEVEL_BLOCK, summarize_matches
+
+LOGIN_URL = "https://nid.naver.com/nidlogin.login"
+
+# 동시에 글쓰기/발행을 진행하는 최대 세션 수 (나머지 세션은 대기만 하므로 스레드를 쓰지 않음)
+MAX_ACTIVE_SESSIONS = 4
+
+# 동시에 시작하는 최대 브라우저 수 (undetected_chromedriver는 드라이버 파일을 패치하므로 하나씩)
+MAX_LAUNCHING = 1
+
+# 로그인 완료 최대 대기 시간 (초, 보안 문자를 직접 입력할 시간 포함)
+LOGIN_TIMEOUT = 60
+
+# 제목 입력란 선택자
+TITLE_SELECTOR = "input[placeholder*='제목'], .se-title-input, .se-documentTitle .se-text-paragraph"
+
+# 본문 입력 영역 선택자
+BODY_SELECTOR = ".se-component.se-text .se-text-paragraph, .se-component-content, .se-text-paragraph"
+
+# 발행 버튼 선택자
+PUBLISH_BUTTON_SELECTOR = ".btn_publish, .publish_btn, button[class*='publish_btn']"
+CONFIRM_BUTTON_SELECTOR = ".btn_confirm, .confirm_btn, button[class*='confirm_btn']"
+
+
+def create_driver(username, display_mode=DEFAULT_DISPLAY_MODE, chrome_profile=DEFAULT_CHROME_PROFILE,
+                  page_load_strategy=DEFAULT_PAGE_LOAD_STRATEGY):
+    """계정별 프로필로 크롬 실행 (이벤트 루프 밖의 작업 스레드에서 호출)"""
+    options = uc.ChromeOptions()
+    apply_display_mode(options, display_mode)
+    options.add_argument("--disable-gpu")
+    options.add_argument("--no-sandbox")
+    options.add_argument("--disable-dev-shm-usage")
+    for argument in BACKGROUND_TAB_ARGUMENTS:
+        options.add_argument(argument)
+    apply_chrome_profile(options, chrome_profile)
+    apply_page_load_strategy(options, page_load_strategy)
+    enable_network_log(options)  # 발행 요청 응답 확인용
+    driver = uc.Chrome(options=options, version_main=136, user_data_dir=profile_dir(username))
+    prepare_driver(driver, display_mode)
+    return driver
+
+
+def find_first(driver, selector, timeout):
+    """최상위 문서에서 선택자에 맞는 요소 찾기 (없으면 None)"""
+    try:
+        return WebDriverWait(driver, timeout).until(
+            EC.presence_of_element_located((By.CSS_SELECTOR, selector)))
+    except WebDriverException:
+        return None
+
+
+def switch_to_editor(driver):
+    """에디터 iframe이 있으면 전환"""
+    driver.switch_to.default_content()
+    frames = driver.find_elements(By.CSS_SELECTOR, EDITOR_IFRAME_SELECTOR)
+    if frames:
+        driver.switch_to.frame(frames[0])
+
+
+class BrowserSession:
+    """계정 하나의 브라우저 세션 (WebDriver 호출은 작업 스레드에서, 대기는 이벤트 루프에서)"""
+    def __init__(self, orchestrator, account, password=""):
+        self.orchestrator = orchestrator
+        self.account = account
+        self.password = password
+        self.driver = None
+        self.logged_in = False
+        self.lock = asyncio.Lock()  # 세션마다 작업 하나씩
+        self.write_router = WriteRouteRouter()
+
+    def log(self, message):
+        self.orchestrator.log(f"[{self.account or '기본'}] {message}")
+
+    async def call(self, func, *args):
+        """동기 WebDriver 호출을 작업 스레드에서 실행"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.orchestrator.executor, partial(func, *args))
+
+    async def start(self):
+        """브라우저 시작 (동시에 시작하는 수 제한)"""
+        if self.driver is not None:
+            return
+        async with self.orchestrator.launching:
+            self.log("브라우저를 시작합니다...")
+            orchestrator = self.orchestrator
+            self.driver = await self.call(create_driver, self.account, orchestrator.display_mode,
+                                          orchestrator.chrome_profile, orchestrator.page_load_strategy)
+
+    async def login(self):
+        """로그인 (계정 프로필에 로그인이 남아 있으면 생략), 성공 여부 반환"""
+        if self.logged_in:
+            return True
+        await self.call(navigate, self.driver, LOGIN_URL, "login")
+        if not await self.call(self.driver.find_elements, By.NAME, "id"):
+            self.logged_in = True
+            return True
+
+        if self.account and self.password:
+            self.log("로그인 시도 중...")
+            await self.call(self.driver.execute_script,
+                            "document.getElementsByName('id')[0].value = arguments[0];"
+                            "document.getElementsByName('pw')[0].value = arguments[1];",
+                            self.account, self.password)
+            await asyncio.sleep(0.5)
+            button = await self.call(find_first, self.driver, "#log\\.login", 10)
+            if button is not None:
+                await self.call(button.click)
+        else:
+            self.log("아이디와 비밀번호가 없습니다. 브라우저에서 직접 로그인해주세요.")
+
+        # 로그인 완료(로그인 페이지를 벗어남)까지 이벤트 루프에서 대기
+        deadline = time.monotonic() + LOGIN_TIMEOUT
+        while time.monotonic() < deadline:
+            url = await self.call(lambda: self.driver.current_url)
+            if "nidlogin" not in url:
+                self.logged_in = True
+                self.log("로그인 완료")
+                return True
+            await asyncio.sleep(1)
+        self.log("로그인 시간이 초과되었습니다.")
+        return False
+
+    async def open_write_page(self, blog_id):
+        """글쓰기 페이지 열기 (성공했던 경로 우선), 성공 여부 반환"""
+        route = await self.call(self.write_router.open_write_page, self.driver, blog_id, self.log)
+        return bool(route)
+
+    def enter_title(self, title):
+        """제목 입력 (에디터 iframe 안 또는 밖)"""
+        switch_to_editor(self.driver)
+        field = find_first(self.driver, TITLE_SELECTOR, 5)
+        if field is None:
+            self.driver.switch_to.default_content()
+            field = find_first(self.driver, TITLE_SELECTOR, 5)
+        if field is None:
+            raise Exception("제목 입력란을 찾지 못했습니다")
+        field.click()
+        field.send_keys(title)
+
+    def focus_body(self):
+        """본문 입력 영역 클릭 후 요소 반환"""
+        switch_to_editor(self.driver)
+        body = find_first(self.driver, BODY_SELECTOR, 10)
+        if body is None:
+            raise Exception("본문 입력 영역을 찾지 못했습니다")
+        body.click()
+        return body
+
+    async def type_text(self, element, text):
+        """조합 단위로 입력하고 단위 사이 지연은 이벤트 루프에서 대기 (대기 중에는 스레드를 쓰지 않음)"""
+        orchestrator = self.orchestrator
+        # 글자 단위 입력 방식이면 음절 단위로 확정
+        granularity = GRANULARITY_WORD if orchestrator.input_mode == GRANULARITY_WORD else GRANULARITY_SYLLABLE
+        composer = HangulComposer(self.driver, orchestrator.typing_speed, granularity)
+        for unit in split_units(text, granularity):
+            await self.call(composer.commit, element, unit)
+            await asyncio.sleep(composer.unit_delay(unit))
+
+    def click_publish(self, confirmer, blog_id, before_click):
+        """발행 버튼 클릭 (누르기 직전 상태와 가장 최근 글 번호 기록), 확인 버튼이 있으면 클릭"""
+        self.driver.switch_to.default_content()
+        button = WebDriverWait(self.driver, 10).until(
+            EC.element_to_be_clickable((By.CSS_SELECTOR, PUBLISH_BUTTON_SELECTOR)))
+        last_log_no = None
+        if self.orchestrator.journal:  # 중단 후 발행 여부를 확인할 때 이 뒤에 올라온 글만 인정
+            try:
+                last_log_no = latest_log_no(self.driver, blog_id)
+            except Exception as e:
+                self.log(f"최근 글 번호 확인 실패: {e}")
+        confirmer.start()
+        before_click(last_log_no=last_log_no)
+        button.click()
+        try:
+            WebDriverWait(self.driver, 5).until(
+                EC.element_to_be_clickable((By.CSS_SELECTOR, CONFIRM_BUTTON_SELECTOR))).click()
+        except WebDriverException:
+            pass  # 확인 버튼이 없을 수도 있음
+
+    async def publish(self, blog_id, before_click=lambda **fields: None):
+        """발행 후 결과 확인, (결과, 글 주소 또는 오류) 반환"""
+        confirmer = PublishConfirmer(self.driver, blog_id)
+        await self.call(self.click_publish, confirmer, blog_id, before_click)
+        deadline = time.monotonic() + PUBLISH_TIMEOUT
+        while time.monotonic() < deadline:
+            try:
+                result = await self.call(confirmer.check_network) or await self.call(confirmer.check_page)
+            except WebDriverException:
+                result = None  # 페이지 이동 중에는 일시적으로 명령이 실패할 수 있음
+            if result:
+                return result
+            await asyncio.sleep(PUBLISH_POLL)
+        return None, "발행 완료를 확인하지 못했습니다"
+
+    async def close(self):
+        if self.driver is not None:
+            try:
+                await self.call(self.driver.quit)
+            except Exception:
+                pass  # 이미 종료된 브라우저 무시
+            self.driver = None
+
+
+class Orchestrator:
+    """계정별 세션을 코루틴으로 진행하며 전체 동시 실행 수를 제한하는 클래스"""
+    def __init__(self, max_active=MAX_ACTIVE_SESSIONS, max_launching=MAX_LAUNCHING,
+                 display_mode=DEFAULT_DISPLAY_MODE, chrome_profile=DEFAULT_CHROME_PROFILE,
+                 page_load_strategy=DEFAULT_PAGE_LOAD_STRATEGY, typing_speed=(0.05, 0.15),
+                 input_mode=DEFAULT_INPUT_MODE, journal=None, rate_limiter=None, duplicate_index=None,
+                 keyword_scanner=None, log=print):
+        self.max_active = max_active
+        self.max_launching = max_launching
+        self.display_mode = display_mode
+        self.chrome_profile = chrome_profile
+        self.page_load_strategy = page_load_strategy
+        self.typing_speed = typing_speed
+        self.input_mode = input_mode
+        self.journal = journal  # 설정 시 작업 ID가 있는 작업의 단계를 기록
+        self.rate_limiter = rate_limiter  # 설정 시 계정/블로그별 발행 속도 제한에 맞춰 작업 시작
+        self.duplicate_index = duplicate_index  # 설정 시 이미 발행한 글과 같은 글은 진행하지 않음
+        self.keyword_scanner = keyword_scanner  # 설정 시 금지어가 있는 글은 진행하지 않음
+        self.log = log
+        self.sessions = {}  # 계정 -> BrowserSession
+        # WebDriver 호출 전용 스레드 (진행 중인 세션과 시작 중인 브라우저 수만큼만 필요)
+        self.executor = ThreadPoolExecutor(max_workers=max_active + max_launching + 1)
+        self.active = None
+        self.launching = None
+
+    def ensure_limits(self):
+        """동시 실행 제한 (실행 중인 이벤트 루프에서 생성)"""
+        if self.active is None:
+            self.active = asyncio.Semaphore(self.max_active)
+            self.launching = asyncio.Semaphore(self.max_launching)
+
+    def session(self, account, password=""):
+        """계정 세션 (없으면 생성)"""
+        session = self.sessions.get(account)
+        if session is None:
+            session = BrowserSession(self, account, password)
+            self.sessions[account] = session
+        elif password:
+            session.password = password
+        return session
+
+    def mark(self, job, state, **fields):
+        if self.journal and job.get("job_id"):
+            self.journal.append(job["job_id"], state, **fields)
+
+    async def call(self, func, *args):
+        """금지어 검사/본문 지문 계산처럼 오래 걸릴 수 있는 동기 작업을 기본 작업 스레드에서 실행
+
+        이벤트 루프에서 직접 실행하면 큰 글을 검사하는 동안 다른 세션의 진행이 모두 멈춘다.
+        WebDriver 호출용 스레드는 세션 수에 맞춰 두었으므로 따로 사용한다.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, partial(func, *args))
+
+    async def run_job(self, job, publish=True):
+        """작업 하나 진행 (로그인, 글쓰기 페이지, 제목/본문 입력, 발행), (성공 여부, 결과) 반환"""
+        self.ensure_limits()
+        session = self.session(job.get("account", ""), job.get("password", ""))
+        blog_id = job["blog_id"]
+        # 브라우저를 띄우기 전에 금지어 검사 (주의어는 기록만 남기고 진행)
+        if self.keyword_scanner:
+            matches = await self.call(self.keyword_scanner.scan_post, job.get("title", ""), job.get("content", ""))
+            blocked = [match for match in matches if match.level == LEVEL_BLOCK]
+            if blocked:
+                message = f"금지어 검사: {summarize_matches(blocked)}"
+                self.mark(job, STATE_FAILED, error=message)
+                return False, message
+            if matches:
+                session.log(f"{blog_id} 금지어 검사: {summarize_matches(matches)}")
+        # 본문 지문은 한 번만 계산해 발행 전 확인과 발행 후 기록에 함께 사용
+        content_fingerprint = None
+        if self.duplicate_index:
+            content_fingerprint = await self.call(fingerprint, job.get("content", ""))
+        async with session.lock:
+            # 같은 계정의 앞선 작업이 끝난 뒤 확인 (같은 글이 한 번에 여러 개 들어와도 한 번만 발행)
+            if self.duplicate_index:
+                duplicate = self.duplicate_index.check_fingerprint(blog_id, content_fingerprint)
+                if duplicate is not None:
+                    message = f"중복 글: {describe_duplicate(duplicate)}"
+                    self.mark(job, STATE_FAILED, error=message)
+                    return False, message
+            try:
+                await session.start()
+                if not await session.login():
+                    return False, "로그인 실패"
+
+                async with self.active:
+                    # 발행 버튼을 누른 뒤 중단됐던 작업은 실제로 발행됐는지부터 확인 (중복 발행 방지)
+                    if self.journal and self.journal.state(job.get("job_id")) in AMBIGUOUS_STATES:
+                        find_post = partial(find_post_by_title, session.driver)
+                        if await session.call(resolve_ambiguous_job, self.journal, job["job_id"],
+                                              find_post, session.log):
+                            return True, "이미 발행된 글입니다."
+
+                    if not await session.open_write_page(blog_id):
+                        self.mark(job, STATE_FAILED, error="글쓰기 페이지 이동 실패")
+                        return False, "글쓰기 페이지 이동 실패"
+                    self.mark(job, STATE_EDITOR_OPEN)
+
+                    if job.get("title"):
+                        await session.call(session.enter_title, job["title"])
+                    body = await session.call(session.focus_body)
+                    await session.type_text(body, job.get("content", ""))
+                    self.mark(job, STATE_TYPED)
+                    session.log(f"{blog_id} 본문 입력 완료")
+                    if not publish:
+                        return True, "입력 완료"
+
+                    status, detail = await session.publish(
+                        blog_id, partial(self.mark, job, STATE_PUBLISH_CLICKED))
+                    if status == PUBLISHED:
+                        self.mark(job, STATE_CONFIRMED, post_url=detail)
+                        if self.duplicate_index:
+                            await self.call(self.duplicate_index.add_fingerprint, blog_id, content_fingerprint,
+                                            job.get("title", ""), detail)
+                        session.log(f"발행된 글 주소: {detail}")
+                        return True, detail
+                    if status is not None:
+                        self.mark(job, STATE_FAILED, error=detail)  # 발행이 거부된 것이 확실함
+                    return False, detail
+            except Exception as e:
+                session.log(f"작업 실패: {e}")
+                if not (self.journal and self.journal.state(job.get("job_id")) in AMBIGUOUS_STATES):
+                    self.mark(job, STATE_FAILED, error=str(e))
+                return False, str(e)
+
+    async def run(self, jobs, publish=True):
+        """모든 작업을 동시에 진행 (같은 계정 작업은 순서대로), 작업별 (성공 여부, 결과) 목록 반환"""
+        self.ensure_limits()
+        if self.rate_limiter is None:
+            return await asyncio.gather(*(self.run_job(job, publish) for job in jobs))
+        return await self.run_limited(jobs, publish)
+
+    async def run_limited(self, jobs, publish=True):
+        """발행 속도 제한에 여유가 있는 계정의 작업부터 골라 시작 (계정마다 한 번에 한 작업)"""
+        results = [None] * len(jobs)
+        pending = list(range(len(jobs)))
+        running = {}  # 진행 중인 작업 Task -> (작업 순번, 계정)
+        while pending or running:
+            # 동시에 글을 쓰는 세션 수보다 많이 시작하면 토큰만 쓰고 기다리게 되므로 그만큼만 시작
+            while pending and len(running) < self.max_active:
+                busy = {account for _, account in running.values()}
+                candidates = [(jobs[index].get("account", ""), jobs[index]["blog_id"]) for index in pending]
+                position, wait = self.rate_limiter.choose(candidates, busy)
+                if position is None:
+                    break
+                index = pending.pop(position)
+                self.rate_limiter.acquire(*candidates[position])
+                task = asyncio.ensure_future(self.run_job(jobs[index], publish))
+                running[task] = (index, candidates[position][0])
+            else:
+                wait = None
+
+            if wait and wait >= 1 and not running:
+                self.log(f"발행 속도 제한으로 {wait:.0f}초 기다립니다. {format_rates(self.rate_limiter.rates())}")
+            if not running:
+                await asyncio.sleep(wait)
+                continue
+            done, _ = await asyncio.wait(running, timeout=wait, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                index, _ = running.pop(task)
+                results[index] = task.result()
+        return results
+
+    async def close(self):
+        """모든 세션 브라우저 종료"""
+        await asyncio.gather(*(session.close() for session in self.sessions.values()))
+        self.sessions.clear()
+        self.executor.shutdown(wait=False)
+
+
+class OrchestratorLoop:
+    """GUI에서 사용할 수 있도록 별도 스레드에서 이벤트 루프를 실행하는 클래스"""
+    def __init__(self):
+        self.loop = asyncio.new_event_loop()
+        self.thread = threading.Thread(target=self.loop.run_forever, daemon=True)
+        self.thread.start()
+
+    def submit(self, coroutine):
+        """코루틴 실행 요청, concurrent.futures.Future 반환 (add_done_callback으로 결과 확인)"""
+        return asyncio.run_coroutine_threadsafe(coroutine, self.loop)
+
+    def stop(self, orchestrator=None, timeout=30):
+        """세션을 정리하고 이벤트 루프 종료"""
+        if orchestrator is not None:
+            try:
+                self.submit(orchestrator.close()).result(timeout)
+            except Exception as e:
+                print(f"세션 정리 실패: {e}")
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self.thread.join(timeout)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="여러 계정의 네이버 블로그 글을 동시에 작성/발행")
+    parser.add_argument("jobs", help="작업 목록 JSON 파일")
+    parser.add_argument("--max-active", type=int, default=MAX_ACTIVE_SESSIONS, help="동시에 글을 쓰는 최대 세션 수")
+    parser.add_argument("--no-publish", action="store_true", help="본문 입력까지만 진행")
+    parser.add_argument("--headless", action="store_true", help="창 없이 실행")
+    parser.add_argument("--virtual-display", action="store_true", help="가상 디스플레이에서 실행 (리눅스)")
+    parser.add_argument("--low-memory", action="store_true", help="저메모리 크롬 옵션 사용")
+    parser.add_argument("--posts-per-hour", type=int, default=ACCOUNT_POSTS_PER_HOUR,
+                        help="계정별 시간당 최대 발행 수 (0이면 제한 없음)")
+    parser.add_argument("--blog-posts-per-hour", type=int, default=BLOG_POSTS_PER_HOUR,
+                        help="블로그별 시간당 최대 발행 수 (0이면 블로그별로는 제한 없음)")
+    parser.add_argument("--allow-duplicates", action="store_true", help="이미 발행한 글과 같은 글도 발행")
+    parser.add_argument("--keywords", default=KEYWORDS_FILE, help="금지어 목록 파일 (금지어가 있는 글은 진행하지 않음)")
+    parser.add_argument("--ignore-keywords", action="store_true", help="금지어 검사 생략")
+    args = parser.parse_args(argv)
+
+    with open(args.jobs, "r", encoding="utf-8") as f:
+        jobs = json.load(f)
+
+    orchestrator = Orchestrator(
+        max_active=args.max_active,
+        display_mode=display_mode_from_args(argv if argv is not None else sys.argv),
+        chrome_profile="low_memory" if args.low_memory else DEFAULT_CHROME_PROFILE,
+        rate_limiter=RateLimiter(args.posts_per_hour, blog_rate=args.blog_posts_per_hour)
+        if args.posts_per_hour and not args.no_publish else None,
+        duplicate_index=None if args.allow_duplicates or args.no_publish else DuplicateIndex(),
+        keyword_scanner=None if args.ignore_keywords else KeywordScanner(args.keywords),
+    )
+
+    async def run():
+        try:
+            return await orchestrator.run(jobs, publish=not args.no_publish)
+        finally:
+            await orchestrator.close()
+
+    try:
+        results = asyncio.run(run())
+    finally:
+        stop_virtual_display()
+    failed = 0
+    for job, (success, detail) in zip(jobs, results):
+        print(f"{'성공' if success else '실패'} {job.get('account', '')}/{job['blog_id']}: {detail}")
+        failed += not success
+    if orchestrator.rate_limiter:
+        print(format_rates(orchestrator.rate_limiter.rates()))
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,275 @@
+"""계정마다 별도 프로세스에서 브라우저 자동화를 실행하고 명령과 진행 상황을 큐로 주고받는 모듈"""
+import multiprocessing
+import queue
+import threading
+
+# 워커 프로세스 시작 방식 (Qt 스레드가 있는 프로세스를 fork하지 않도록 spawn 사용)
+START_METHOD = "spawn"
+
+# GUI에서 이벤트 큐를 확인하는 간격 (밀리초)
+DISPATCH_INTERVAL = 50
+
+# 한 번에 처리할 최대 이벤트 수 (이벤트가 몰려도 GUI가 멈추지 않도록)
+DISPATCH_BATCH = 200
+
+# 같은 확인 주기 안에 여러 번 오면 마지막 것만 반영하는 신호
+COALESCED_SIGNALS = ("update_status", "resource_usage")
+
+# 워커 프로세스 종료 이벤트
+WORKER_EXITED = "worker_exited"
+
+# 대기열을 거치지 않고 바로 적용하는 설정 메서드
+IMMEDIATE_METHODS = ("set_typing_speed", "set_prefetch_enabled", "set_recycle_policy")
+
+# GUI에서 값을 바꾸면 워커 프로세스에 그대로 전달하는 속성
+FORWARDED_ATTRIBUTES = ("verify_typing", "input_mode")
+
+# 워커 프로세스 종료 대기 시간 (초)
+STOP_TIMEOUT = 10
+
+# 끝나면 typing_completed를 보내는 입력 명령 (도중에 워커가 종료되면 실패로 알림)
+TYPING_METHODS = ("type_text", "type_blocks", "type_text_to_blogs")
+
+# 워커 프로세스가 입력 도중 종료되었을 때 GUI에 보내는 메시지
+WORKER_EXITED_MESSAGE = "브라우저 프로세스가 종료되어 텍스트 입력이 중단되었습니다."
+
+
+class QueueSignal:
+    """워커 프로세스에서 pyqtSignal 대신 사용하는 신호 (emit 인자를 이벤트 큐로 전송)"""
+    def __init__(self, worker_id, name, events):
+        self.worker_id = worker_id
+        self.name = name
+        self.events = events
+
+    def emit(self, *args):
+        self.events.put((self.worker_id, self.name, args))
+
+
+class QueueSignals:
+    """WorkerSignals와 같은 이름으로 신호를 꺼내 쓰는 워커 프로세스용 신호 묶음"""
+    def __init__(self, worker_id, events):
+        self.worker_id = worker_id
+        self.events = events
+
+    def __getattr__(self, name):
+        if name.startswith("_"):
+            raise AttributeError(name)
+        signal = QueueSignal(self.worker_id, name, self.events)
+        setattr(self, name, signal)
+        return signal
+
+
+def run_worker(thread_class, worker_id, commands, events, args, kwargs):
+    """워커 프로세스 진입점: 브라우저 스레드를 띄우고 GUI 명령을 전달 (브라우저 스레드가 끝나면 종료)"""
+    signals = QueueSignals(worker_id, events)
+    browser = thread_class(*args, signals=signals, **kwargs)
+    browser.start()
+    try:
+        while browser.is_alive():
+            try:
+                message = commands.get(timeout=1)
+            except queue.Empty:
+                continue
+            kind, name, payload = message
+            if kind == "stop":
+                break
+            try:
+                if kind == "submit":
+                    browser.submit(getattr(browser, name), *payload)
+                elif kind == "call":
+                    getattr(browser, name)(*payload)
+                elif kind == "set":
+                    setattr(browser, name, payload)
+            except Exception as e:
+                signals.update_status.emit(f"워커 명령 실행 오류: {e}")
+    finally:
+        try:
+            browser.stop()
+        except Exception:
+            pass  # 이미 종료된 브라우저 무시
+        browser.join(STOP_TIMEOUT)
+        events.put((worker_id, WORKER_EXITED, ()))
+
+
+def portable_arguments(args, log=print):
+    """프로세스 사이로 넘길 수 없는 인자 변환 (변환 중인 이미지 묶음은 변환이 끝난 결과로)"""
+    converted = []
+    for arg in args:
+        resolved = getattr(arg, "resolved", None)
+        if not callable(resolved):
+            converted.append(arg)
+            continue
+        try:
+            converted.append(resolved())
+        except Exception as e:
+            # 이미지 변환에 실패해도 본문 입력은 진행
+            log(f"이미지 변환 실패: {e}")
+            converted.append(None)
+    return tuple(converted)
+
+
+class RemoteMethod:
+    """워커 프로세스의 브라우저 스레드 메서드 (submit에 넘기거나 직접 호출)"""
+    def __init__(self, worker, name):
+        self.worker = worker
+        self.name = name
+
+    def __call__(self, *args):
+        self.worker.send("call", self.name, args)
+
+
+class BrowserProcess:
+    """BrowserThread와 같은 방식으로 사용하는 계정별 워커 프로세스 대리 객체"""
+    def __init__(self, pool, worker_id, thread_class, signals, *args, **kwargs):
+        self.__dict__.update(
+            pool=pool,
+            worker_id=worker_id,
+            signals=signals,  # GUI 스레드의 WorkerSignals (이벤트 큐에서 받은 신호를 다시 보냄)
+            commands=pool.context.Queue(),
+            outbox=queue.Queue(),  # 이미지 변환을 기다리는 동안 GUI가 멈추지 않도록 별도 스레드에서 전송
+            exited=False,
+            typing=False,  # 입력 명령을 보내고 typing_completed를 아직 받지 못한 상태
+        )
+        self.__dict__["process"] = pool.context.Process(
+            target=run_worker,
+            args=(thread_class, worker_id, self.commands, pool.events, args, kwargs),
+            daemon=True,
+        )
+        self.__dict__["sender"] = threading.Thread(target=self.send_loop, daemon=True)
+
+    def __getattr__(self, name):
+        if name.startswith("_"):
+            raise AttributeError(name)
+        return RemoteMethod(self, name)
+
+    def __setattr__(self, name, value):
+        if name in FORWARDED_ATTRIBUTES:
+            self.send("set", name, value)
+        self.__dict__[name] = value
+
+    def start(self):
+        self.pool.register(self)
+        self.process.start()
+        self.sender.start()
+
+    def is_alive(self):
+        return not self.exited and self.process.is_alive()
+
+    def send(self, kind, name, payload):
+        self.outbox.put((kind, name, payload))
+
+    def send_loop(self):
+        """보낼 명령을 순서대로 워커 프로세스 명령 큐에 전달"""
+        while True:
+            kind, name, payload = self.outbox.get()
+            if kind in ("submit", "call"):
+                payload = portable_arguments(payload, self.signals.update_status.emit)
+            try:
+                self.commands.put((kind, name, payload))
+            except (ValueError, OSError):
+                return  # 큐가 닫힌 뒤에는 전송 중단
+            if kind == "stop":
+                return
+
+    def submit(self, method, *args):
+        """브라우저 스레드에서 순서대로 실행할 명령 추가"""
+        name = method.name if isinstance(method, RemoteMethod) else method.__name__
+        if name in TYPING_METHODS:
+            self.__dict__["typing"] = True
+        if name in IMMEDIATE_METHODS:
+            self.send("call", name, args)
+        else:
+            self.send("submit", name, args)
+
+    def stop(self):
+        """워커 프로세스 종료 요청 (브라우저를 닫고 스스로 종료)"""
+        self.send("stop", None, None)
+
+    def join(self, timeout=STOP_TIMEOUT):
+        """워커 프로세스 종료 대기, 끝나지 않으면 강제 종료"""
+        self.process.join(timeout)
+        if self.process.is_alive():
+            self.process.terminate()
+            self.process.join(1)
+
+
+class ProcessWorkerPool:
+    """워커 프로세스들이 보내는 이벤트를 하나의 큐로 모아 GUI 스레드에서 신호로 전달하는 클래스"""
+    def __init__(self, start_method=START_METHOD):
+        self.context = multiprocessing.get_context(start_method)
+        self.events = self.context.Queue()
+        self.workers = {}  # 워커 ID -> BrowserProcess
+        self.next_id = 0
+
+    def create(self, thread_class, signals, *args, **kwargs):
+        """브라우저 스레드 클래스를 워커 프로세스에서 실행하는 대리 객체 생성 (start로 시작)"""
+        self.next_id += 1
+        return BrowserProcess(self, self.next_id, thread_class, signals, *args, **kwargs)
+
+    def register(self, worker):
+        self.workers[worker.worker_id] = worker
+
+    def dispatch(self, max_events=DISPATCH_BATCH):
+        """쌓인 이벤트를 GUI 스레드에서 신호로 전달 (QTimer로 주기적으로 호출), 처리한 이벤트 수 반환
+
+        종료 이벤트 없이 죽은 워커 프로세스(강제 종료 등)도 여기서 찾아 종료로 처리한다.
+        """
+        # 이벤트를 꺼내기 전에 확인해야 종료 직전에 보낸 이벤트를 놓치지 않음
+        dead = [worker for worker in self.workers.values()
+                if worker.process.pid is not None and not worker.process.is_alive()]
+
+        batch = []
+        while len(batch) < max_events:
+            try:
+                batch.append(self.events.get_nowait())
+            except queue.Empty:
+                break
+
+        # 상태 메시지처럼 자주 오는 신호는 워커별 마지막 것만 전달
+        last = {}
+        for index, (worker_id, name, _) in enumerate(batch):
+            if name in COALESCED_SIGNALS:
+                last[(worker_id, name)] = index
+
+        for index, (worker_id, name, args) in enumerate(batch):
+            worker = self.workers.get(worker_id)
+            if worker is None:
+                continue
+            if name == WORKER_EXITED:
+                self.worker_exited(worker)
+                continue
+            if name in COALESCED_SIGNALS and last[(worker_id, name)] != index:
+                continue
+            if name == "typing_completed":
+                worker.__dict__["typing"] = False
+            signal = getattr(worker.signals, name, None)
+            if signal is not None:
+                signal.emit(*args)
+
+        # 큐를 다 비웠는데도 종료 이벤트가 오지 않은 워커는 비정상 종료
+        if len(batch) < max_events:
+            for worker in dead:
+                if worker.worker_id in self.workers:
+                    self.worker_exited(worker)
+        return len(batch)
+
+    def worker_exited(self, worker):
+        """워커 프로세스 종료 처리 (입력 중이었으면 실패로 알리고 브라우저 종료를 알려 GUI 버튼을 되돌림)"""
+        worker.__dict__["exited"] = True
+        self.workers.pop(worker.worker_id, None)
+        if worker.typing:
+            worker.__dict__["typing"] = False
+            worker.signals.typing_completed.emit(False, WORKER_EXITED_MESSAGE)
+        worker.signals.browser_ready.emit(False)
+
+    def live_workers(self):
+        return [worker for worker in self.workers.values() if worker.is_alive()]
+
+    def shutdown(self, timeout=STOP_TIMEOUT):
+        """모든 워커 프로세스 종료"""
+        workers = list(self.workers.values())
+        for worker in workers:
+            worker.stop()
+        for worker in workers:
+            worker.join(timeout)
+        self.workers.clear()
@@ -0,0 +1,158 @@
+"""발행 버튼을 누른 뒤 실제 발행 완료 여부를 네트워크 응답과 주소 변경으로 확인하는 모듈"""
+import json
+import re
+import time
+from selenium.common.exceptions import NoAlertPresentException, WebDriverException
+from naver_navigation import POST_URL
+
+# 발행 요청 주소 (스마트에디터 ONE 글 저장/발행)
+PUBLISH_REQUEST_PATTERN = "RabbitWrite.naver"
+
+# 발행 확인 최대 대기 시간 (초)
+PUBLISH_TIMEOUT = 30
+
+# 발행 확인 간격 (초)
+PUBLISH_POLL = 0.3
+
+# 발행 결과
+PUBLISHED = "published"
+REJECTED = "rejected"
+UNCONFIRMED = "unconfirmed"
+
+# 발행된 글 주소 형식 (블로그 ID, 글 번호)
+POST_URL_PATTERNS = [
+    re.compile(r"blog\.naver\.com/([A-Za-z0-9_-]+)/(\d+)"),
+    re.compile(r"PostView\.naver\?.*?blogId=([A-Za-z0-9_-]+).*?logNo=(\d+)"),
+]
+
+# 에디터가 발행을 거부할 때 띄우는 안내 창의 문구 (에디터 iframe 포함)
+EDITOR_ALERT_SCRIPT = """
+    var selector = '.se-popup-alert, .se-popup-alert-confirm, .layer_alert';
+    var docs = [document];
+    var frames = document.getElementsByTagName('iframe');
+    for (var i = 0; i < frames.length; i++) {
+        try {
+            if (frames[i].contentDocument) {
+                docs.push(frames[i].contentDocument);
+            }
+        } catch (e) {
+            // 다른 출처의 iframe은 건너뜀
+        }
+    }
+    for (var j = 0; j < docs.length; j++) {
+        var popup = docs[j].querySelector(selector);
+        if (popup && popup.offsetParent !== null) {
+            return popup.innerText.trim();
+        }
+    }
+    return null;
+"""
+
+
+def enable_network_log(options):
+    """발행 요청 응답을 읽을 수 있도록 크롬 성능 로그(네트워크 이벤트) 활성화"""
+    options.set_capability("goog:loggingPrefs", {"performance": "ALL"})
+
+
+def parse_post_url(url):
+    """글 주소에서 정규화한 발행 글 주소 추출 (글 주소가 아니면 None)"""
+    for pattern in POST_URL_PATTERNS:
+        match = pattern.search(url or "")
+        if match:
+            return POST_URL.format(blog_id=match.group(1), log_no=match.group(2))
+    return None
+
+
+class PublishConfirmer:
+    """발행 요청 응답, 글 주소로의 이동, 에디터 오류 안내를 감시해 발행 결과를 판단하는 클래스"""
+    def __init__(self, driver, blog_id):
+        self.driver = driver
+        self.blog_id = blog_id
+        self.network_available = True
+        self.request_ids = set()  # 발행 요청 ID
+        self.finished_ids = set()  # 응답 수신이 끝난 발행 요청 ID
+
+    def start(self):
+        """발행 버튼을 누르기 직전에 호출 (이전 네트워크 이벤트 비우기)"""
+        self.read_network_events()
+        self.request_ids.clear()
+        self.finished_ids.clear()
+
+    def read_network_events(self):
+        """성능 로그에서 발행 요청 관련 네트워크 이벤트 수집"""
+        if not self.network_available:
+            return
+        try:
+            entries = self.driver.get_log("performance")
+        except Exception:
+            # 성능 로그를 켜지 않은 브라우저면 주소와 화면 상태로만 판단
+            self.network_available = False
+            return
+        for entry in entries:
+            try:
+                message = json.loads(entry["message"])["message"]
+            except (KeyError, ValueError):
+                continue
+            method = message.get("method")
+            params = message.get("params", {})
+            if method == "Network.responseReceived":
+                if PUBLISH_REQUEST_PATTERN in params.get("response", {}).get("url", ""):
+                    self.request_ids.add(params.get("requestId"))
+            elif method == "Network.loadingFinished" and params.get("requestId") in self.request_ids:
+                self.finished_ids.add(params.get("requestId"))
+
+    def check_network(self):
+        """발행 요청 응답 확인, (결과, 글 주소 또는 오류) 반환 (아직 응답이 없으면 None)"""
+        self.read_network_events()
+        for request_id in list(self.finished_ids):
+            self.finished_ids.discard(request_id)
+            try:
+                body = self.driver.execute_cdp_cmd("Network.getResponseBody", {"requestId": request_id})
+                data = json.loads(body.get("body") or "{}")
+            except Exception:
+                continue
+            if not data.get("isSuccess", True):
+                message = data.get("message") or data.get("result") or "발행 요청이 거부되었습니다"
+                return REJECTED, str(message)
+
+            result = data.get("result") or {}
+            if isinstance(result, dict):
+                post_url = parse_post_url(result.get("redirectUrl", ""))
+                if not post_url and result.get("logNo"):
+                    post_url = POST_URL.format(blog_id=self.blog_id, log_no=result["logNo"])
+                if post_url:
+                    return PUBLISHED, post_url
+        return None
+
+    def check_page(self):
+        """글 주소로 이동했는지, 오류 안내가 떴는지 확인 (판단할 수 없으면 None)"""
+        try:
+            alert = self.driver.switch_to.alert
+            text = alert.text
+            alert.accept()
+            return REJECTED, text
+        except NoAlertPresentException:
+            pass
+
+        post_url = parse_post_url(self.driver.current_url)
+        if post_url:
+            return PUBLISHED, post_url
+
+        message = self.driver.execute_script(EDITOR_ALERT_SCRIPT)
+        if message:
+            return REJECTED, message
+        return None
+
+    def wait(self, timeout=PUBLISH_TIMEOUT):
+        """발행 결과 (PUBLISHED/REJECTED/UNCONFIRMED, 글 주소 또는 오류 내용) 반환"""
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            try:
+                result = self.check_network() or self.check_page()
+            except WebDriverException:
+                # 페이지 이동 중에는 일시적으로 명령이 실패할 수 있음
+                result = None
+            if result:
+                return result
+            time.sleep(PUBLISH_POLL)
+        return UNCONFIRMED, "발행 완료를 확인하지 못했습니다"
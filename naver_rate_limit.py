@@ -0,0 +1,187 @@
+"""계정(과 블로그)별 토큰 버킷으로 발행 속도를 제한하고 다음에 진행할 작업을 고르는 모듈"""
+import random
+import threading
+import time
+from collections import deque
+
+# 계정별 허용 발행 수 (시간당)
+ACCOUNT_POSTS_PER_HOUR = 6
+
+# 계정별로 연달아 발행할 수 있는 최대 글 수 (버킷 크기)
+ACCOUNT_BURST = 2
+
+# 블로그별 허용 발행 수 (시간당, 0이면 블로그별로는 제한하지 않음)
+BLOG_POSTS_PER_HOUR = 0
+
+# 블로그별로 연달아 발행할 수 있는 최대 글 수
+BLOG_BURST = 1
+
+# 같은 계정의 발행 사이 최소 간격 (초, 버킷에 여유가 있어도 이 간격은 띄움)
+MIN_SPACING = 120
+
+# 최소 간격을 흔드는 비율 (0.3이면 간격의 70%~130% 사이에서 무작위로 선택)
+SPACING_JITTER = 0.3
+
+# 실제 발행 속도를 계산하는 구간 (초)
+RATE_WINDOW = 3600
+
+
+class TokenBucket:
+    """시간이 지나면 토큰이 채워지고 글을 하나 발행할 때마다 토큰을 하나 쓰는 버킷"""
+    def __init__(self, posts_per_hour, capacity, now=None):
+        self.rate = posts_per_hour / 3600.0  # 초당 채워지는 토큰 수
+        self.capacity = max(1, capacity)
+        self.tokens = float(self.capacity)
+        self.updated = time.monotonic() if now is None else now
+
+    def refill(self, now):
+        if now > self.updated:
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+
+    def wait_time(self, now):
+        """토큰을 하나 쓸 수 있을 때까지 남은 시간 (초)"""
+        self.refill(now)
+        if self.tokens >= 1:
+            return 0.0
+        if self.rate <= 0:
+            return float("inf")
+        return (1 - self.tokens) / self.rate
+
+    def consume(self, now):
+        self.refill(now)
+        self.tokens -= 1  # 이전 기록을 복원할 때는 음수가 될 수 있음 (그만큼 더 기다림)
+
+
+class RateLimiter:
+    """계정별(선택 시 블로그별) 발행 속도를 제한하고 바로 발행할 수 있는 작업을 고르는 클래스"""
+    def __init__(self, account_rate=ACCOUNT_POSTS_PER_HOUR, account_burst=ACCOUNT_BURST,
+                 blog_rate=BLOG_POSTS_PER_HOUR, blog_burst=BLOG_BURST,
+                 min_spacing=MIN_SPACING, jitter=SPACING_JITTER):
+        self.account_rate = account_rate
+        self.account_burst = account_burst
+        self.blog_rate = blog_rate
+        self.blog_burst = blog_burst
+        self.min_spacing = min_spacing
+        self.jitter = jitter
+        self.buckets = {}  # ("account", 계정) 또는 ("blog", 블로그 ID) -> TokenBucket
+        self.not_before = {}  # 계정 -> 다음 발행 가능 시각 (흔든 최소 간격)
+        self.history = {}  # 버킷 키 -> 최근 발행 시각
+        self.lock = threading.Lock()  # 작업 진행 스레드와 GUI 스레드가 함께 사용
+
+    def keys(self, account, blog_id):
+        keys = [("account", account or "")]
+        if self.blog_rate and blog_id:
+            keys.append(("blog", blog_id))
+        return keys
+
+    def bucket(self, key, now):
+        bucket = self.buckets.get(key)
+        if bucket is None:
+            if key[0] == "account":
+                bucket = TokenBucket(self.account_rate, self.account_burst, now)
+            else:
+                bucket = TokenBucket(self.blog_rate, self.blog_burst, now)
+            self.buckets[key] = bucket
+        return bucket
+
+    def set_rates(self, account_rate=None, blog_rate=None):
+        """허용 발행 수 변경 (남은 토큰은 유지하고 채워지는 속도만 바꿈)"""
+        with self.lock:
+            if account_rate is not None:
+                self.account_rate = account_rate
+            if blog_rate is not None:
+                self.blog_rate = blog_rate
+            for (kind, _), bucket in self.buckets.items():
+                rate = self.account_rate if kind == "account" else self.blog_rate
+                bucket.refill(time.monotonic())
+                bucket.rate = rate / 3600.0
+
+    def wait_time_locked(self, account, blog_id, now):
+        wait = max(0.0, self.not_before.get(account or "", now) - now)
+        for key in self.keys(account, blog_id):
+            wait = max(wait, self.bucket(key, now).wait_time(now))
+        return wait
+
+    def wait_time(self, account, blog_id=None):
+        """이 계정/블로그에 글을 발행할 수 있을 때까지 남은 시간 (초)"""
+        with self.lock:
+            return self.wait_time_locked(account, blog_id, time.monotonic())
+
+    def choose(self, candidates, busy=()):
+        """(계정, 블로그 ID) 후보 중 바로 발행할 수 있는 첫 작업 선택, (순번, 대기 시간) 반환
+
+        바로 발행할 수 있는 작업이 없으면 (None, 가장 먼저 가능해지는 시간)을 반환한다.
+        busy에 있는 계정은 다른 작업을 진행 중이므로 건너뛴다 (모두 진행 중이면 대기 시간은 None).
+        """
+        with self.lock:
+            now = time.monotonic()
+            soonest = None
+            for index, (account, blog_id) in enumerate(candidates):
+                if account in busy:
+                    continue
+                wait = self.wait_time_locked(account, blog_id, now)
+                if wait <= 0:
+                    return index, 0.0
+                soonest = wait if soonest is None else min(soonest, wait)
+            return None, soonest
+
+    def acquire(self, account, blog_id=None):
+        """글 하나를 발행하기 시작할 때 토큰 사용과 다음 발행 간격 기록"""
+        with self.lock:
+            now = time.monotonic()
+            for key in self.keys(account, blog_id):
+                self.bucket(key, now).consume(now)
+                self.history.setdefault(key, deque()).append(now)
+            if self.min_spacing:
+                spacing = self.min_spacing * random.uniform(1 - self.jitter, 1 + self.jitter)
+                self.not_before[account or ""] = now + spacing
+
+    def restore(self, account, posts):
+        """이전 실행에서 발행한 글 기록 반영 (posts: (블로그 ID, 발행 시각 time.time()) 목록)
+
+        다시 실행하자마자 버킷이 가득 찬 상태로 한꺼번에 발행하지 않도록 한다.
+        """
+        with self.lock:
+            now = time.monotonic()
+            wall_now = time.time()
+            # 발행 시각(time.time())을 monotonic 시각으로 바꿈
+            events = sorted((now - (wall_now - posted_at), blog_id) for blog_id, posted_at in posts
+                            if 0 <= wall_now - posted_at < RATE_WINDOW)
+            for at, blog_id in events:
+                for key in self.keys(account, blog_id):
+                    # 버킷이 없으면 첫 기록 시각부터 가득 찬 버킷으로 시작
+                    self.bucket(key, at).consume(at)
+                    self.history.setdefault(key, deque()).append(at)
+            if events and self.min_spacing:
+                last = events[-1][0] + self.min_spacing
+                self.not_before[account or ""] = max(self.not_before.get(account or "", now), last)
+
+    def achieved_rate(self, key, now):
+        """최근 RATE_WINDOW 동안의 실제 발행 수 (시간당)"""
+        history = self.history.get(key)
+        if not history:
+            return 0.0
+        while history and now - history[0] > RATE_WINDOW:
+            history.popleft()
+        return len(history) * 3600.0 / RATE_WINDOW
+
+    def rates(self):
+        """버킷별 (이름, 실제 시간당 발행 수, 허용 시간당 발행 수) 목록"""
+        with self.lock:
+            now = time.monotonic()
+            result = []
+            for key in self.buckets:
+                kind, name = key
+                allowed = self.account_rate if kind == "account" else self.blog_rate
+                label = f"계정 {name}" if kind == "account" else f"블로그 {name}"
+                result.append((label, self.achieved_rate(key, now), allowed))
+            return result
+
+
+def format_rates(rates):
+    """발행 속도 목록을 한 줄로 표시 (예: '계정 abc 2.0/6')"""
+    if not rates:
+        return "발행 속도: 기록 없음"
+    return "발행 속도 (시간당 실제/허용): " + ", ".join(
+        f"{label} {achieved:.1f}/{allowed:g}" for label, achieved, allowed in rates)
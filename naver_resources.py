@@ -0,0 +1,126 @@
+"""브라우저 프로세스의 메모리/CPU 사용량을 확인하고 오래 쓴 브라우저를 다시 띄울 시점을 정하는 모듈"""
+import time
+from collections import namedtuple
+
+try:
+    import psutil
+except ImportError:
+    psutil = None  # psutil이 없으면 사용량 확인 없이 글 수 기준으로만 재시작
+
+# 크롬 실행 옵션 구성
+CHROME_PROFILES = {
+    "standard": "기본",
+    "low_memory": "저메모리 (계정을 많이 띄울 때)",
+}
+DEFAULT_CHROME_PROFILE = "standard"
+
+# 저메모리 구성에 추가하는 크롬 실행 옵션
+LOW_MEMORY_ARGUMENTS = [
+    "--renderer-process-limit=2",  # 렌더러 프로세스 수 제한 (탭끼리 프로세스 공유)
+    "--disable-extensions",
+    "--disable-sync",
+    "--disable-background-networking",
+    "--disable-component-update",
+    "--disable-features=Translate,OptimizationHints,MediaRouter,BackForwardCache",
+    "--disk-cache-size=33554432",  # 디스크 캐시 32MB
+    "--js-flags=--max-old-space-size=512",  # 탭별 자바스크립트 힙 상한 (MB)
+]
+
+# 이 수만큼 글을 쓰면 브라우저를 다시 띄움 (0이면 사용 안 함)
+RECYCLE_POST_COUNT = 20
+
+# 브라우저 전체 메모리(RSS)가 이 값을 넘으면 다음 글을 쓰기 전에 다시 띄움 (MB, 0이면 사용 안 함)
+MEMORY_CEILING_MB = 1500
+
+# 사용량 확인 간격 (감시 주기 횟수)
+SAMPLE_EVERY = 5
+
+# 브라우저 프로세스 사용량 (rss_mb: 메모리 합계, cpu_percent: CPU 사용률 합계, processes: 프로세스 수)
+ResourceUsage = namedtuple("ResourceUsage", ["rss_mb", "cpu_percent", "processes"])
+
+
+def apply_chrome_profile(options, profile):
+    """선택한 크롬 실행 옵션 구성 적용"""
+    if profile == "low_memory":
+        for argument in LOW_MEMORY_ARGUMENTS:
+            options.add_argument(argument)
+
+
+class ProcessTreeMonitor:
+    """chromedriver와 크롬의 모든 하위 프로세스(렌더러, GPU 등) 사용량을 합산하는 클래스"""
+    def __init__(self):
+        self.processes = {}  # PID -> psutil.Process (CPU 사용률은 이전 측정과의 차이로 계산)
+
+    @property
+    def available(self):
+        return psutil is not None
+
+    def tree(self, pids):
+        """루트 PID들과 모든 하위 프로세스 목록"""
+        found = {}
+        for pid in pids:
+            try:
+                root = psutil.Process(pid)
+                for process in [root] + root.children(recursive=True):
+                    found[process.pid] = process
+            except psutil.Error:
+                continue
+        return found
+
+    def sample(self, pids):
+        """프로세스 트리 사용량 (psutil이 없거나 프로세스가 없으면 None)"""
+        if psutil is None or not pids:
+            return None
+
+        current = self.tree(pids)
+        rss = 0
+        cpu = 0.0
+        for pid, process in current.items():
+            # 이전에 본 프로세스는 같은 객체를 써야 CPU 사용률 차이가 계산됨
+            process = self.processes.get(pid, process)
+            current[pid] = process
+            try:
+                rss += process.memory_info().rss
+                cpu += process.cpu_percent(None)
+            except psutil.Error:
+                continue
+        self.processes = current
+        if not current:
+            return None
+        return ResourceUsage(rss / (1024 * 1024), cpu, len(current))
+
+    def reset(self):
+        """브라우저를 다시 띄운 뒤 이전 프로세스 정보 삭제"""
+        self.processes = {}
+
+
+class RecyclePolicy:
+    """글 수와 메모리 상한으로 브라우저를 다시 띄울지 판단하는 클래스"""
+    def __init__(self, max_posts=RECYCLE_POST_COUNT, memory_ceiling_mb=MEMORY_CEILING_MB):
+        self.max_posts = max_posts
+        self.memory_ceiling_mb = memory_ceiling_mb
+
+    def reason(self, posts, usage):
+        """다시 띄워야 하면 이유, 아니면 None"""
+        if self.max_posts and posts >= self.max_posts:
+            return f"글 {posts}개를 작성했습니다"
+        if self.memory_ceiling_mb and usage and usage.rss_mb >= self.memory_ceiling_mb:
+            return f"메모리 사용량이 {usage.rss_mb:.0f}MB로 상한({self.memory_ceiling_mb}MB)을 넘었습니다"
+        return None
+
+
+def wait_while_idle(driver, interval=30, memory_ceiling_mb=MEMORY_CEILING_MB):
+    """사용자가 종료할 때까지 브라우저를 열어 두면서 메모리 사용량이 상한을 넘으면 알림 (Ctrl+C로 종료)"""
+    from naver_watchdog import driver_pids  # naver_watchdog가 이 모듈을 불러오므로 여기서 불러옴
+
+    monitor = ProcessTreeMonitor()
+    warned = False
+    while True:
+        time.sleep(interval)
+        usage = monitor.sample(driver_pids(driver))
+        if not usage or not memory_ceiling_mb:
+            continue
+        if usage.rss_mb >= memory_ceiling_mb and not warned:
+            print(f"브라우저 메모리 사용량이 {usage.rss_mb:.0f}MB입니다. "
+                  "작업이 끝났으면 브라우저를 다시 시작해주세요.")
+        warned = usage.rss_mb >= memory_ceiling_mb
@@ -0,0 +1,167 @@
+"""예약 발행 작업을 SQLite에 저장하고 발행 시각이 되면 작업을 넘겨주는 모듈 (재시작해도 예약 유지)"""
+import sqlite3
+import threading
+import time
+
+# 예약 작업 저장 파일
+SCHEDULE_FILE = "naver_schedule.db"
+
+# 발행 시각보다 이만큼 먼저 브라우저를 준비 (초)
+PREWARM_LEAD = 120
+
+# 다음 예약까지 오래 남아도 이 간격마다 다시 확인 (절전 복귀나 시스템 시각 변경 대비, 초)
+MAX_WAIT = 300
+
+# 예약 작업 상태
+SCHEDULE_PENDING = "pending"
+SCHEDULE_QUEUED = "queued"  # 발행 대기열로 넘어감
+SCHEDULE_CANCELED = "canceled"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS scheduled_posts (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    due_at REAL NOT NULL,
+    account TEXT,
+    blog_id TEXT NOT NULL,
+    title TEXT NOT NULL,
+    content TEXT NOT NULL,
+    category TEXT,
+    format_blocks INTEGER NOT NULL DEFAULT 0,
+    state TEXT NOT NULL DEFAULT 'pending',
+    job_id TEXT,
+    created_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS scheduled_posts_due ON scheduled_posts (state, due_at);
+"""
+
+
+class ScheduleStore:
+    """예약 작업 저장소 (발행 시각 순 색인으로 가장 빠른 작업을 바로 조회)"""
+    def __init__(self, schedule_file=SCHEDULE_FILE):
+        self.schedule_file = schedule_file
+        self.lock = threading.Lock()  # GUI 스레드와 예약 스레드가 같은 연결을 사용
+        self.connection = sqlite3.connect(schedule_file, check_same_thread=False)
+        self.connection.row_factory = sqlite3.Row
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.executescript(SCHEMA)
+
+    def add(self, due_at, blog_id, title, content, category=None, format_blocks=False, account=None):
+        """예약 작업 추가 (due_at: time.time() 기준 발행 시각), 예약 ID 반환"""
+        with self.lock, self.connection:
+            cursor = self.connection.execute(
+                "INSERT INTO scheduled_posts (due_at, account, blog_id, title, content, category, format_blocks,"
+                " created_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (due_at, account, blog_id, title, content, category, int(bool(format_blocks)), time.time()))
+            return cursor.lastrowid
+
+    def next_due(self, exclude=()):
+        """가장 먼저 발행할 예약 작업 (exclude: 이미 넘겨준 예약 ID), 없으면 None"""
+        with self.lock:
+            rows = self.connection.execute(
+                "SELECT * FROM scheduled_posts WHERE state = ? ORDER BY due_at LIMIT ?",
+                (SCHEDULE_PENDING, len(exclude) + 1)).fetchall()
+        for row in rows:
+            if row["id"] not in exclude:
+                return dict(row)
+        return None
+
+    def upcoming(self, limit=50):
+        """발행 시각 순 예약 작업 목록"""
+        with self.lock:
+            rows = self.connection.execute(
+                "SELECT * FROM scheduled_posts WHERE state = ? ORDER BY due_at LIMIT ?",
+                (SCHEDULE_PENDING, limit)).fetchall()
+        return [dict(row) for row in rows]
+
+    def pending_count(self):
+        with self.lock:
+            return self.connection.execute(
+                "SELECT COUNT(*) FROM scheduled_posts WHERE state = ?", (SCHEDULE_PENDING,)).fetchone()[0]
+
+    def mark(self, schedule_id, state, job_id=None):
+        with self.lock, self.connection:
+            self.connection.execute("UPDATE scheduled_posts SET state = ?, job_id = COALESCE(?, job_id) WHERE id = ?",
+                                    (state, job_id, schedule_id))
+
+    def close(self):
+        with self.lock:
+            self.connection.close()
+
+
+class PublishScheduler(threading.Thread):
+    """다음 예약 시각까지 잠들었다가 발행 직전에 브라우저 준비, 발행 시각에 작업을 넘겨주는 스레드
+
+    on_prewarm(job): 발행 시각 PREWARM_LEAD초 전에 호출 (브라우저 시작, 글쓰기 페이지 미리 열기)
+    on_due(job): 발행 시각에 호출, 대기열로 넘긴 뒤 complete(예약 ID, 작업 ID)를 호출해야 함
+    콜백은 이 스레드에서 호출되므로 GUI에서는 신호로 넘겨 처리한다.
+    """
+    def __init__(self, store, on_due, on_prewarm=None, prewarm_lead=PREWARM_LEAD):
+        super().__init__()
+        self.store = store
+        self.on_due = on_due
+        self.on_prewarm = on_prewarm
+        self.prewarm_lead = prewarm_lead
+        self.daemon = True
+        self.condition = threading.Condition()
+        self.fired = set()  # 넘겨줬지만 아직 대기열 반영이 확인되지 않은 예약 ID
+        self.prewarmed = set()
+        self.stopped = False
+
+    def run(self):
+        with self.condition:
+            while not self.stopped:
+                job = self.store.next_due(self.fired)
+                if job is None:
+                    self.condition.wait(MAX_WAIT)
+                    continue
+
+                now = time.time()
+                if job["due_at"] <= now:
+                    self.fired.add(job["id"])
+                    self.call(self.on_due, job)
+                    continue
+
+                if job["id"] not in self.prewarmed and job["due_at"] - now <= self.prewarm_lead:
+                    self.prewarmed.add(job["id"])
+                    if self.on_prewarm:
+                        self.call(self.on_prewarm, job)
+                wake_at = job["due_at"] if job["id"] in self.prewarmed else job["due_at"] - self.prewarm_lead
+                self.condition.wait(min(max(0, wake_at - now), MAX_WAIT))
+
+    def call(self, callback, job):
+        try:
+            callback(job)
+        except Exception as e:
+            print(f"예약 작업 처리 오류: {e}")
+
+    def wake(self):
+        """예약이 추가/취소되면 다음 발행 시각을 다시 계산"""
+        with self.condition:
+            self.condition.notify()
+
+    def add(self, due_at, blog_id, title, content, category=None, format_blocks=False, account=None):
+        """예약 작업을 저장하고 예약 ID 반환"""
+        schedule_id = self.store.add(due_at, blog_id, title, content, category, format_blocks, account)
+        self.wake()
+        return schedule_id
+
+    def cancel(self, schedule_id):
+        self.store.mark(schedule_id, SCHEDULE_CANCELED)
+        self.wake()
+
+    def complete(self, schedule_id, job_id):
+        """발행 대기열로 넘긴 예약 작업 정리"""
+        self.store.mark(schedule_id, SCHEDULE_QUEUED, job_id)
+        with self.condition:
+            self.fired.discard(schedule_id)
+            self.prewarmed.discard(schedule_id)
+
+    def next_due_at(self):
+        with self.condition:
+            job = self.store.next_due(self.fired)
+        return job["due_at"] if job else None
+
+    def stop(self):
+        with self.condition:
+            self.stopped = True
+            self.condition.notify()
@@ -1,12 +1,18 @@
-import time
+import sys
 import undetected_chromedriver as uc
 from selenium.webdriver.common.by import By
+from naver_resources import apply_chrome_profile, wait_while_idle
+from naver_display import apply_display_mode, display_mode_from_args, prepare_driver
 
 # 크롬 드라이버 설정 및 시작
 print("브라우저를 시작합니다...")
 options = uc.ChromeOptions()
-options.add_argument("--start-maximized")
+display_mode = display_mode_from_args()  # --headless / --virtual-display
+apply_display_mode(options, display_mode)
+if "--low-memory" in sys.argv:
+    apply_chrome_profile(options, "low_memory")  # 저메모리 크롬 옵션
 driver = uc.Chrome(options=options)
+prepare_driver(driver, display_mode)
 
 # 네이버 로그인 페이지 열기
 print("네이버 로그인 페이지로 이동합니다...")
@@ -15,8 +21,7 @@ driver.get("https://nid.naver.com/nidlogin.login")
 # 브라우저 유지 (사용자가 직접 종료할 때까지)
 print("브라우저가 열렸습니다. 종료하려면 Ctrl+C를 누르거나 이 창을 닫으세요.")
 try:
-    while True:
-        time.sleep(1)
+    wait_while_idle(driver)  # 메모리 사용량이 상한을 넘으면 알림
 except KeyboardInterrupt:
     print("프로그램을 종료합니다.")
     driver.quit() 
\ No newline at end of file
@@ -0,0 +1,324 @@
+"""계정, 블로그, 카테고리, 글 작성 기록을 SQLite(WAL)에 저장하는 모듈"""
+import json
+import os
+import sqlite3
+import threading
+import time
+
+# 저장 파일
+STORE_FILE = "naver_blog.db"
+
+# 마지막 변경 후 이 시간 동안 다른 변경이 없으면 기록 (초)
+WRITE_DELAY = 1.0
+
+# 변경이 계속 이어져도 첫 변경 후 이 시간 안에는 기록 (초)
+MAX_WRITE_DELAY = 5.0
+
+# 종료 시 남은 변경 기록을 기다리는 최대 시간 (초)
+FLUSH_TIMEOUT = 10
+
+# 글 작성 기록 상태
+POST_TYPED = "typed"  # 본문 입력까지 완료
+POST_PUBLISHED = "published"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS accounts (
+    username TEXT PRIMARY KEY,
+    password TEXT NOT NULL,
+    nickname TEXT,
+    position INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS blogs (
+    username TEXT NOT NULL REFERENCES accounts (username) ON DELETE CASCADE,
+    blog_id TEXT NOT NULL,
+    name TEXT,
+    position INTEGER NOT NULL,
+    PRIMARY KEY (username, blog_id)
+);
+CREATE TABLE IF NOT EXISTS categories (
+    username TEXT NOT NULL,
+    blog_id TEXT NOT NULL,
+    name TEXT NOT NULL,
+    PRIMARY KEY (username, blog_id, name),
+    FOREIGN KEY (username, blog_id) REFERENCES blogs (username, blog_id) ON DELETE CASCADE
+);
+CREATE TABLE IF NOT EXISTS post_history (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    username TEXT,
+    blog_id TEXT NOT NULL,
+    title TEXT,
+    category TEXT,
+    post_url TEXT,
+    state TEXT NOT NULL,
+    created_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS post_history_account ON post_history (username, created_at);
+CREATE INDEX IF NOT EXISTS post_history_blog ON post_history (blog_id, created_at);
+CREATE TABLE IF NOT EXISTS settings (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+"""
+
+
+class WriteBehind(threading.Thread):
+    """변경을 모아 두었다가 잠시 뒤 별도 스레드에서 한 트랜잭션으로 기록하는 스레드
+
+    같은 키의 변경은 마지막 것만 기록하므로 콤보박스를 여러 번 바꿔도 한 번만 기록된다.
+    """
+    def __init__(self, store, delay=WRITE_DELAY, max_delay=MAX_WRITE_DELAY):
+        super().__init__()
+        self.store = store
+        self.delay = delay
+        self.max_delay = max_delay
+        self.daemon = True
+        self.condition = threading.Condition()
+        self.pending = {}  # 키 -> 실행할 (SQL, 인자) 목록 (변경 순서 유지)
+        self.first_at = None  # 기록하지 않은 첫 변경 시각
+        self.last_at = None
+        self.sequence = 0  # 키가 없는 변경(글 작성 기록 등)에 붙이는 번호
+        self.writing = False
+        self.flush_requested = False
+        self.stopped = False
+
+    def put(self, key, statements):
+        with self.condition:
+            if key is None:
+                self.sequence += 1
+                key = ("append", self.sequence)
+            self.pending[key] = statements  # 같은 키는 처음 변경 위치에서 새 값으로 바뀜
+            now = time.monotonic()
+            self.first_at = self.first_at or now
+            self.last_at = now
+            self.condition.notify_all()
+
+    def discard(self, match):
+        """아직 기록하지 않은 변경 중 키가 조건에 맞는 것을 버림"""
+        with self.condition:
+            for key in [key for key in self.pending if match(key)]:
+                del self.pending[key]
+
+    def run(self):
+        while True:
+            batch = self.next_batch()
+            if batch is None:
+                return
+            self.write(batch)
+
+    def next_batch(self):
+        """기록할 때가 될 때까지 기다렸다가 모인 변경 반환 (종료하면 None)"""
+        with self.condition:
+            while True:
+                if not self.pending:
+                    if self.stopped:
+                        return None
+                    self.condition.wait()
+                    continue
+                now = time.monotonic()
+                due = min(self.last_at + self.delay, self.first_at + self.max_delay)
+                if self.stopped or self.flush_requested or now >= due:
+                    batch = list(self.pending.items())
+                    self.pending = {}
+                    self.first_at = None
+                    self.flush_requested = False
+                    self.writing = True
+                    return batch
+                self.condition.wait(due - now)
+
+    def write(self, batch):
+        try:
+            self.store.apply([statements for _, statements in batch])
+        except sqlite3.OperationalError as e:
+            # 다른 프로세스가 잠근 경우 등은 다음 기록 때 다시 시도 (그 사이 바뀐 키는 새 값 유지)
+            print(f"저장 실패, 잠시 후 다시 시도합니다: {e}")
+            with self.condition:
+                if self.stopped:
+                    return  # 종료 중에는 다시 시도하지 않음
+                retry = dict(batch)
+                retry.update(self.pending)
+                self.pending = retry
+                self.first_at = self.last_at = time.monotonic()
+        except Exception as e:
+            print(f"저장 실패: {e}")
+        finally:
+            with self.condition:
+                self.writing = False
+                self.condition.notify_all()
+
+    def flush(self, timeout=FLUSH_TIMEOUT):
+        """모인 변경을 바로 기록하고 끝날 때까지 대기"""
+        with self.condition:
+            if not self.pending and not self.writing:
+                return
+            if not self.is_alive():
+                batch = list(self.pending.items())
+                self.pending = {}
+            else:
+                self.flush_requested = True
+                self.condition.notify_all()
+                self.condition.wait_for(lambda: not self.pending and not self.writing, timeout)
+                return
+        self.write(batch)  # 스레드가 시작되지 않았으면 직접 기록
+
+    def stop(self, timeout=FLUSH_TIMEOUT):
+        """남은 변경을 기록하고 종료"""
+        with self.condition:
+            self.stopped = True
+            self.condition.notify_all()
+        if self.is_alive():
+            self.join(timeout)
+        self.flush(timeout)
+
+
+class AccountStore:
+    """계정/블로그/카테고리/글 작성 기록 저장소 (변경된 행만 기록)
+
+    write_delay가 있으면 변경을 바로 기록하지 않고 WriteBehind 스레드에서 모아서 기록한다.
+    조회하기 전에는 모인 변경을 먼저 기록하고, 종료할 때는 close()로 남은 변경을 기록해야 한다.
+    """
+    def __init__(self, store_file=STORE_FILE, write_delay=WRITE_DELAY):
+        self.store_file = store_file
+        self.lock = threading.Lock()
+        self.connection = sqlite3.connect(store_file, check_same_thread=False)
+        self.connection.row_factory = sqlite3.Row
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        # WAL에서는 NORMAL이어도 프로그램이 비정상 종료돼 파일이 손상되지 않음 (커밋마다 디스크 동기화 생략)
+        self.connection.execute("PRAGMA synchronous=NORMAL")
+        self.connection.execute("PRAGMA foreign_keys=ON")
+        self.connection.executescript(SCHEMA)
+        self.writer = None
+        if write_delay:
+            self.writer = WriteBehind(self, write_delay)
+            self.writer.start()
+
+    def write(self, key, *statements):
+        """변경 기록 (같은 키의 기록하지 않은 이전 변경은 버림)"""
+        if self.writer is not None:
+            self.writer.put(key, list(statements))
+        else:
+            self.apply([statements])
+
+    def apply(self, batch):
+        """여러 변경을 한 트랜잭션으로 기록 (삭제된 계정의 블로그처럼 맞지 않는 변경은 건너뜀)"""
+        with self.lock, self.connection:
+            for statements in batch:
+                for sql, params in statements:
+                    try:
+                        self.connection.execute(sql, params)
+                    except sqlite3.IntegrityError as e:
+                        print(f"저장하지 않은 변경: {e}")
+
+    def flush(self):
+        if self.writer is not None:
+            self.writer.flush()
+
+    def query(self, sql, params=()):
+        self.flush()  # 아직 기록하지 않은 변경도 조회되도록
+        with self.lock:
+            return [dict(row) for row in self.connection.execute(sql, params).fetchall()]
+
+    def accounts(self):
+        """등록 순서대로 계정 목록 (각 계정에 블로그 목록 포함)"""
+        accounts = self.query("SELECT username, password, nickname FROM accounts ORDER BY position")
+        by_name = {account["username"]: account for account in accounts}
+        for account in accounts:
+            account["blogs"] = []
+        for blog in self.query("SELECT username, blog_id, name FROM blogs ORDER BY position"):
+            account = by_name.get(blog["username"])
+            if account is not None:
+                account["blogs"].append({"id": blog["blog_id"], "name": blog["name"]})
+        return accounts
+
+    def upsert_account(self, username, password, nickname):
+        self.write(("account", username), (
+            "INSERT INTO accounts (username, password, nickname, position)"
+            " VALUES (?, ?, ?, (SELECT COALESCE(MAX(position), 0) + 1 FROM accounts))"
+            " ON CONFLICT (username) DO UPDATE SET password = excluded.password, nickname = excluded.nickname",
+            (username, password, nickname)))
+
+    def delete_account(self, username):
+        if self.writer is not None:
+            # 삭제할 계정의 기록하지 않은 변경은 필요 없음 (다시 추가하면 삭제 뒤에 기록됨)
+            self.writer.discard(lambda key: key[0] in ("account", "blog", "categories") and key[1] == username)
+        self.write(("delete", username), ("DELETE FROM accounts WHERE username = ?", (username,)))
+
+    def add_blog(self, username, blog_id, name=None):
+        self.write(("blog", username, blog_id), (
+            "INSERT OR IGNORE INTO blogs (username, blog_id, name, position)"
+            " VALUES (?, ?, ?, (SELECT COALESCE(MAX(position), 0) + 1 FROM blogs WHERE username = ?))",
+            (username, blog_id, name or blog_id, username)))
+
+    def categories(self, username, blog_id):
+        rows = self.query("SELECT name FROM categories WHERE username = ? AND blog_id = ? ORDER BY name",
+                          (username, blog_id))
+        return [row["name"] for row in rows]
+
+    def set_categories(self, username, blog_id, names):
+        """블로그 카테고리 목록 교체"""
+        self.write(("categories", username, blog_id),
+                   ("DELETE FROM categories WHERE username = ? AND blog_id = ?", (username, blog_id)),
+                   *[("INSERT OR IGNORE INTO categories (username, blog_id, name) VALUES (?, ?, ?)",
+                      (username, blog_id, name)) for name in names])
+
+    def record_post(self, username, blog_id, title, state, post_url=None, category=None):
+        """글 작성 기록 추가"""
+        self.write(None, (
+            "INSERT INTO post_history (username, blog_id, title, category, post_url, state, created_at)"
+            " VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (username, blog_id, title, category, post_url, state, time.time())))
+
+    def post_history(self, username=None, blog_id=None, limit=100):
+        """최근 글 작성 기록 (계정 또는 블로그로 좁혀서 조회)"""
+        if username is not None:
+            return self.query("SELECT * FROM post_history WHERE username = ? ORDER BY created_at DESC LIMIT ?",
+                              (username, limit))
+        if blog_id is not None:
+            return self.query("SELECT * FROM post_history WHERE blog_id = ? ORDER BY created_at DESC LIMIT ?",
+                              (blog_id, limit))
+        return self.query("SELECT * FROM post_history ORDER BY created_at DESC LIMIT ?", (limit,))
+
+    def get_setting(self, key, default=None):
+        rows = self.query("SELECT value FROM settings WHERE key = ?", (key,))
+        return rows[0]["value"] if rows else default
+
+    def set_setting(self, key, value):
+        self.write(("setting", key), ("INSERT INTO settings (key, value) VALUES (?, ?)"
+                                      " ON CONFLICT (key) DO UPDATE SET value = excluded.value", (key, value)))
+
+    def migrate_json(self, json_file):
+        """이전 계정 정보 JSON 파일을 한 번만 가져옴 (원본 파일은 그대로 둠), 가져왔으면 True"""
+        if self.get_setting("migrated_json") or not os.path.exists(json_file):
+            return False
+        try:
+            with open(json_file, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except Exception as e:
+            print(f"계정 정보 파일 읽기 실패: {e}")
+            return False
+
+        with self.lock, self.connection:
+            for position, account in enumerate(data.get("accounts", []), 1):
+                username = account.get("username")
+                if not username:
+                    continue
+                self.connection.execute(
+                    "INSERT OR IGNORE INTO accounts (username, password, nickname, position) VALUES (?, ?, ?, ?)",
+                    (username, account.get("password", ""), account.get("nickname") or username, position))
+                for blog_position, blog in enumerate(account.get("blogs", []), 1):
+                    self.connection.execute(
+                        "INSERT OR IGNORE INTO blogs (username, blog_id, name, position) VALUES (?, ?, ?, ?)",
+                        (username, blog["id"], blog.get("name") or blog["id"], blog_position))
+            if data.get("current_account"):
+                self.connection.execute("INSERT OR REPLACE INTO settings (key, value) VALUES ('current_account', ?)",
+                                        (data["current_account"],))
+            self.connection.execute("INSERT OR REPLACE INTO settings (key, value) VALUES ('migrated_json', ?)",
+                                    (os.path.abspath(json_file),))
+        print(f"{json_file}의 계정 정보를 {self.store_file}로 옮겼습니다.")
+        return True
+
+    def close(self):
+        """남은 변경을 기록하고 닫음"""
+        if self.writer is not None:
+            self.writer.stop()
+        with self.lock:
+            self.connection.close()
@@ -0,0 +1,127 @@
+"""입력 엔진에 본문을 문단 단위로 공급하는 모듈 (대용량 원고 스트리밍)"""
+import hashlib
+import mmap
+import os
+from collections import namedtuple
+
+# 문단 하나의 최대 크기 (이보다 긴 문단은 줄 단위로 나눔)
+CHUNK_SIZE = 4096
+
+# 미리보기로 보여줄 최대 크기 (바이트)
+PREVIEW_SIZE = 64 * 1024
+
+UTF8_BOM = b"\xef\xbb\xbf"
+
+# 본문 조각 (start/end는 원본 기준 위치, text는 입력할 문자열)
+TextChunk = namedtuple("TextChunk", ["start", "end", "text"])
+
+
+def _paragraph_end(data, pos, size, newline, max_size):
+    """pos에서 시작하는 문단의 끝 위치 (뒤따르는 빈 줄 포함)"""
+    limit = min(size, pos + max_size)
+    end = data.find(newline * 2, pos, limit)
+    if end != -1:
+        # 빈 줄이 여러 개 이어지면 모두 같은 문단에 포함
+        end += 2
+        while end < size and data[end:end + 1] == newline:
+            end += 1
+        return end
+    if limit == size:
+        return size
+
+    # 문단이 너무 길면 마지막 줄바꿈에서 자름
+    cut = data.rfind(newline, pos, limit)
+    if cut != -1:
+        return cut + 1
+    if isinstance(newline, bytes):
+        # UTF-8 글자 중간에서 자르지 않도록 조정
+        while limit > pos + 1 and (data[limit] & 0xC0) == 0x80:
+            limit -= 1
+    return limit
+
+
+class StringSource:
+    """문자열 본문 소스 (위치는 글자 단위)"""
+    def __init__(self, text, name="입력창"):
+        self.text = text
+        self.name = name
+
+    @property
+    def size(self):
+        return len(self.text)
+
+    def chunks(self, start=0):
+        """start 위치부터 문단 단위로 본문 조각 생성"""
+        pos = start
+        while pos < self.size:
+            end = _paragraph_end(self.text, pos, self.size, "\n", CHUNK_SIZE)
+            yield TextChunk(pos, end, self.text[pos:end])
+            pos = end
+
+    def preview(self, limit=PREVIEW_SIZE):
+        return self.text[:limit]
+
+    def identity(self):
+        """소스 식별 정보 (이름, 내용 해시)"""
+        digest = hashlib.sha1(self.text.encode("utf-8")).hexdigest()[:16]
+        return f"text:{self.name}:{digest}"
+
+
+class FileSource:
+    """파일 본문을 메모리 매핑으로 문단 단위로 읽는 소스 (위치는 바이트 단위, 전체를 메모리에 올리지 않음)"""
+    def __init__(self, path, encoding="utf-8"):
+        self.path = os.path.abspath(path)
+        self.encoding = encoding
+        self.name = os.path.basename(path)
+
+    @property
+    def size(self):
+        return os.path.getsize(self.path)
+
+    def chunks(self, start=0):
+        """start 위치부터 문단 단위로 본문 조각 생성"""
+        size = self.size
+        if size == 0:
+            return
+        with open(self.path, "rb") as f:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                pos = start
+                if pos == 0 and data[:3] == UTF8_BOM:
+                    pos = len(UTF8_BOM)
+                while pos < size:
+                    end = _paragraph_end(data, pos, size, b"\n", CHUNK_SIZE)
+                    yield TextChunk(pos, end, data[pos:end].decode(self.encoding, errors="replace"))
+                    pos = end
+
+    def preview(self, limit=PREVIEW_SIZE):
+        """파일 앞부분 미리보기"""
+        with open(self.path, "rb") as f:
+            data = f.read(limit)
+        if data.startswith(UTF8_BOM):
+            data = data[len(UTF8_BOM):]
+        text = data.decode(self.encoding, errors="ignore")
+        if self.size > limit:
+            text += "\n\n... (이하 생략, 입력 시 파일 전체를 순서대로 읽습니다)"
+        return text
+
+    def identity(self):
+        """소스 식별 정보 (경로, 크기, 수정 시각)"""
+        stat = os.stat(self.path)
+        return f"file:{self.path}:{stat.st_size}:{int(stat.st_mtime)}"
+
+
+def as_source(text_or_source):
+    """문자열이면 문자열 소스로 감싸서 반환"""
+    if isinstance(text_or_source, str):
+        return StringSource(text_or_source)
+    return text_or_source
+
+
+def source_title(text_or_source, limit=100):
+    """본문 첫 줄 (Markdown 제목 기호 제외, 원고 파일은 첫 줄이 나올 때까지만 읽음)"""
+    for chunk in as_source(text_or_source).chunks():
+        for line in chunk.text.splitlines():
+            line = line.strip().lstrip("#").strip()
+            if line:
+                return line[:limit]
+    return ""
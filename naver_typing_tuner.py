@@ -0,0 +1,109 @@
+"""글자 누락률을 측정해 가장 빠른 안전 타이핑 속도를 찾는 모듈"""
+import difflib
+import platform
+import random
+import time
+from naver_editor import EditorVerifier, normalize_text, utf16_length
+from naver_hangul import DEFAULT_INPUT_MODE, HangulComposer, contains_hangul
+
+# 속도 측정용 보정 문장 (한글, 영문, 숫자, 특수문자 혼합)
+CALIBRATION_TEXT = "네이버 블로그 입력 속도 측정 중입니다. Speed test 12345! 잠시만 기다려주세요."
+
+# 시도할 최소 지연 시간 후보 (초, 빠른 순)
+DELAY_CANDIDATES = [0.005, 0.01, 0.015, 0.02, 0.03, 0.04, 0.05, 0.07, 0.1, 0.15]
+
+# 최대 지연 시간 = 최소 지연 시간 x 비율 (기본 속도 0.05~0.15와 같은 비율)
+DELAY_SPREAD = 3.0
+
+# 허용 글자 누락률 기본값
+DEFAULT_LOSS_THRESHOLD = 0.01
+
+# QSettings 저장 키 접두사
+SETTINGS_PREFIX = "typing_tuner"
+
+
+def tuned_speed_key(username):
+    """계정과 컴퓨터별 자동 조정 속도 저장 키"""
+    machine = platform.node() or "local"
+    return f"{SETTINGS_PREFIX}/{machine}/{username or 'default'}"
+
+
+def loss_rate(expected, actual):
+    """원본 대비 빠지거나 틀린 글자 비율"""
+    if not expected:
+        return 0.0
+    matcher = difflib.SequenceMatcher(None, actual, expected, autojunk=False)
+    matched = sum(block.size for block in matcher.get_matching_blocks())
+    return 1.0 - matched / len(expected)
+
+
+class TypingSpeedTuner:
+    """보정 문장을 입력하고 에디터를 다시 읽어 누락률 기준을 만족하는 가장 빠른 지연 범위를 찾는 클래스
+
+    실제 입력과 같은 입력 방식(input_mode)으로 측정해야 조정한 속도가 그대로 맞는다.
+    """
+    def __init__(self, driver, editor_element, loss_threshold=DEFAULT_LOSS_THRESHOLD,
+                 calibration_text=CALIBRATION_TEXT, log=print, should_stop=None,
+                 input_mode=DEFAULT_INPUT_MODE):
+        self.driver = driver
+        self.editor_element = editor_element
+        self.input_mode = input_mode
+        self.loss_threshold = loss_threshold
+        self.calibration_text = normalize_text(calibration_text)
+        self.log = log
+        self.should_stop = should_stop or (lambda: False)
+        self.verifier = EditorVerifier(driver)
+        self.results = {}  # 최소 지연 시간 -> 누락률
+
+    def measure(self, min_delay):
+        """지정한 속도로 보정 문장을 입력해 누락률 측정 후 입력한 내용 삭제"""
+        if min_delay in self.results:
+            return self.results[min_delay]
+
+        max_delay = min_delay * DELAY_SPREAD
+        base = self.verifier.text_length()
+        if self.input_mode in ("word", "syllable") and contains_hangul(self.calibration_text):
+            # 한글 조합 입력 (음절/단어 단위로 확정)
+            composer = HangulComposer(self.driver, (min_delay, max_delay), self.input_mode,
+                                      should_stop=self.should_stop)
+            composer.type(self.editor_element, self.calibration_text)
+        else:
+            for char in self.calibration_text:
+                if self.should_stop():
+                    break
+                self.editor_element.send_keys(char)
+                time.sleep(random.uniform(min_delay, max_delay))
+
+        # 에디터가 입력을 마저 반영할 시간을 준 뒤 다시 읽기
+        time.sleep(0.5)
+        actual = self.verifier.read_text(base)
+        rate = loss_rate(self.calibration_text, actual)
+
+        # 측정에 사용한 문장 삭제
+        if actual:
+            self.verifier.apply_edit(0, utf16_length(actual), "", base)
+
+        self.results[min_delay] = rate
+        self.log(f"속도 측정: {min_delay:.3f}~{max_delay:.3f}초, 누락률 {rate * 100:.1f}%")
+        return rate
+
+    def tune(self):
+        """누락률 기준을 만족하는 가장 빠른 (최소, 최대, 누락률) 반환 (이분 탐색)"""
+        low, high = 0, len(DELAY_CANDIDATES) - 1
+
+        # 가장 느린 속도도 기준을 넘으면 가장 느린 속도 사용
+        if self.measure(DELAY_CANDIDATES[high]) > self.loss_threshold:
+            best = DELAY_CANDIDATES[high]
+            self.log("가장 느린 속도에서도 글자 누락이 발생합니다.")
+        else:
+            best = DELAY_CANDIDATES[high]
+            high -= 1
+            while low <= high and not self.should_stop():
+                middle = (low + high) // 2
+                if self.measure(DELAY_CANDIDATES[middle]) <= self.loss_threshold:
+                    best = DELAY_CANDIDATES[middle]
+                    high = middle - 1
+                else:
+                    low = middle + 1
+
+        return best, round(best * DELAY_SPREAD, 3), self.results.get(best, 0.0)
@@ -0,0 +1,189 @@
+"""브라우저 응답을 주기적으로 확인하고 멈추거나 종료된 브라우저를 다시 띄우는 모듈"""
+import os
+import signal
+import subprocess
+import sys
+import threading
+import time
+from naver_resources import SAMPLE_EVERY
+
+try:
+    import psutil
+except ImportError:
+    psutil = None  # psutil이 없으면 운영체제 명령으로 프로세스 종료
+
+# 계정별 크롬 프로필 폴더 (재시작해도 쿠키와 로그인 유지)
+PROFILES_DIR = "profiles"
+
+# 응답 확인 간격 (초)
+HEARTBEAT_INTERVAL = 3
+
+# 응답 확인 제한 시간 (초)
+HEARTBEAT_TIMEOUT = 8
+
+# 연속으로 이 횟수만큼 응답이 없으면 멈춘 것으로 판단 (긴 명령 실행 중 오판 방지)
+HUNG_STRIKES = 2
+
+# 명령 하나가 응답을 막기 시작한 뒤 멈춘 것으로 판단하기까지 걸리는 가장 짧은 시간 (초)
+HUNG_WINDOW = HEARTBEAT_TIMEOUT * HUNG_STRIKES + HEARTBEAT_INTERVAL * (HUNG_STRIKES - 1)
+
+# 페이지 로딩 제한 시간 (초)
+# 응답 확인은 실행 중인 드라이버 명령 뒤에서 기다리므로, 느린 페이지 로딩이 멈춤으로 판단되기 전에 끝나도록
+# HUNG_WINDOW보다 짧게 설정 (시간이 초과되어도 navigate가 페이지별 준비 조건으로 이어서 확인)
+PAGE_LOAD_TIMEOUT = HUNG_WINDOW - 5
+
+# 브라우저 세션당 최대 자동 재시작 횟수
+MAX_RESTARTS = 3
+
+# 응답 확인 결과
+ALIVE = "alive"
+HUNG = "hung"
+CRASHED = "crashed"
+
+# 브라우저가 종료됐음을 뜻하는 오류 문구
+CRASH_MESSAGES = (
+    "invalid session id",
+    "chrome not reachable",
+    "disconnected",
+    "no such session",
+    "session deleted",
+    "connection refused",
+    "max retries exceeded",
+)
+
+
+def profile_dir(username):
+    """계정별 크롬 프로필 폴더 경로"""
+    name = "".join(c for c in (username or "default") if c.isalnum() or c in "-_") or "default"
+    return os.path.abspath(os.path.join(PROFILES_DIR, name))
+
+
+def driver_pids(driver):
+    """드라이버가 띄운 프로세스 ID 목록 (chromedriver, 크롬)"""
+    pids = []
+    service = getattr(driver, "service", None)
+    process = getattr(service, "process", None)
+    if process is not None:
+        pids.append(process.pid)
+    browser_pid = getattr(driver, "browser_pid", None)  # undetected_chromedriver가 직접 띄운 크롬
+    if browser_pid:
+        pids.append(browser_pid)
+    return pids
+
+
+def kill_process_tree(pid):
+    """프로세스와 모든 하위 프로세스 강제 종료"""
+    if psutil is not None:
+        try:
+            parent = psutil.Process(pid)
+            processes = parent.children(recursive=True) + [parent]
+        except psutil.NoSuchProcess:
+            return
+        for process in processes:
+            try:
+                process.kill()
+            except psutil.NoSuchProcess:
+                pass
+        psutil.wait_procs(processes, timeout=5)
+        return
+
+    if sys.platform == "win32":
+        subprocess.run(["taskkill", "/F", "/T", "/PID", str(pid)],
+                       stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    else:
+        try:
+            os.kill(pid, signal.SIGKILL)
+        except OSError:
+            pass
+
+
+def limit_page_load(driver, timeout=PAGE_LOAD_TIMEOUT):
+    """페이지 로딩 제한 시간 설정 (기본 300초 동안 로딩이 이어지면 감시 스레드가 멈춘 브라우저로 판단함)"""
+    try:
+        driver.set_page_load_timeout(timeout)
+    except Exception as e:
+        print(f"페이지 로딩 제한 시간 설정 실패: {e}")
+
+
+def kill_driver(driver):
+    """드라이버와 브라우저 프로세스 모두 종료"""
+    for pid in driver_pids(driver):
+        kill_process_tree(pid)
+
+
+def process_exited(driver):
+    """chromedriver 프로세스가 종료됐는지 여부"""
+    process = getattr(getattr(driver, "service", None), "process", None)
+    return process is not None and process.poll() is not None
+
+
+def heartbeat(driver, timeout=HEARTBEAT_TIMEOUT):
+    """가벼운 명령으로 브라우저 응답 확인, (결과, 현재 주소) 반환"""
+    if process_exited(driver):
+        return CRASHED, None
+
+    result = {}
+
+    def probe():
+        try:
+            result["url"] = driver.current_url
+        except Exception as e:
+            result["error"] = str(e).lower()
+
+    # 멈춘 명령이 돌아오지 않아도 감시가 막히지 않도록 별도 스레드에서 실행
+    worker = threading.Thread(target=probe, daemon=True)
+    worker.start()
+    worker.join(timeout)
+    if worker.is_alive():
+        return HUNG, None
+    if "error" in result:
+        if any(message in result["error"] for message in CRASH_MESSAGES):
+            return CRASHED, None
+        # 창 닫힘 등 다른 오류는 브라우저는 살아 있는 것으로 봄
+        return ALIVE, None
+    return ALIVE, result.get("url")
+
+
+class BrowserWatchdog(threading.Thread):
+    """브라우저 스레드의 드라이버를 감시하다가 멈추거나 종료되면 재시작을 요청하는 스레드"""
+    def __init__(self, browser_thread, interval=HEARTBEAT_INTERVAL, timeout=HEARTBEAT_TIMEOUT,
+                 sample_every=SAMPLE_EVERY):
+        super().__init__()
+        self.browser_thread = browser_thread
+        self.interval = interval
+        self.timeout = timeout
+        self.sample_every = sample_every  # 응답 확인 몇 번마다 메모리/CPU 사용량을 확인할지
+        self.daemon = True
+        self.stopped = threading.Event()
+
+    def run(self):
+        strikes = 0
+        beats = 0
+        while not self.stopped.wait(self.interval):
+            browser = self.browser_thread
+            if browser.should_stop:
+                break
+            if browser.restarting or browser.driver is None:
+                continue
+
+            status, url = heartbeat(browser.driver, self.timeout)
+            if status == ALIVE:
+                strikes = 0
+                if url and url.startswith("http"):
+                    browser.last_url = url  # 재시작 후 다시 열 주소
+                beats += 1
+                if beats % self.sample_every == 0:
+                    browser.sample_resources()  # 재시작 여부는 다음 글을 시작할 때 판단
+                continue
+
+            if status == HUNG:
+                strikes += 1
+                if strikes < HUNG_STRIKES:
+                    continue
+            strikes = 0
+            reason = "응답이 없습니다" if status == HUNG else "종료되었습니다"
+            if not browser.recover(reason):
+                break
+
+    def stop(self):
+        self.stopped.set()
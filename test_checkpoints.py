@@ -0,0 +1,136 @@
+"""naver_checkpoints 입력 체크포인트 기록과 이어서 입력하기 테스트"""
+import pytest
+
+from naver_checkpoints import Checkpoint, TypingCheckpoints, TypingProgress, is_source_prefix, utf16_prefix
+from naver_editor_text import fnv1a_hash, utf16_length
+from naver_text_source import StringSource
+
+
+class FakeVerifier:
+    """에디터 본문을 문자열로 흉내 내는 EditorVerifier 대역"""
+    def __init__(self, text=""):
+        self.text = text
+        self.edits = []
+
+    def read_text(self, base=0):
+        return self.text[base:]
+
+    def content_hash(self, base=0):
+        text = self.read_text(base)
+        return utf16_length(text), fnv1a_hash(text)
+
+    def apply_edit(self, start, end, replacement, base=0):
+        self.edits.append((start, end, replacement, base))
+        self.text = self.text[:base + start] + replacement + self.text[base + end:]
+
+
+def typed_checkpoint(typed, base=0):
+    """typed까지 입력했을 때 기록되는 체크포인트"""
+    progress = TypingProgress(base)
+    checkpoint = None
+    for chunk in StringSource(typed).chunks():
+        checkpoint = progress.advance(chunk)
+    return checkpoint
+
+
+@pytest.fixture
+def checkpoints(tmp_path):
+    return TypingCheckpoints(str(tmp_path / "checkpoints.json"), interval=0)
+
+
+def test_progress_matches_whole_text_hash():
+    text = "첫 문단입니다.\n\n두 번째 문단 😀\n\n세 번째"
+    checkpoint = typed_checkpoint(text, base=3)
+    assert checkpoint == Checkpoint(len(text), 3, utf16_length(text), fnv1a_hash(text))
+
+
+def test_progress_continues_from_checkpoint():
+    source = StringSource("하나\n\n둘\n\n셋")
+    chunks = list(source.chunks())
+    first = TypingProgress(0).advance(chunks[0])
+    progress = TypingProgress(0, first)
+    for chunk in chunks[1:]:
+        checkpoint = progress.advance(chunk)
+    assert checkpoint == typed_checkpoint(source.text)
+
+
+def test_utf16_prefix_counts_surrogate_pairs():
+    assert utf16_prefix("a😀b", 3) == "a😀"
+    assert utf16_prefix("a😀b", 2) == "a"
+
+
+def test_records_are_saved_and_reloaded(checkpoints):
+    checkpoint = typed_checkpoint("본문\n\n")
+    checkpoints.record("key", checkpoint)
+    assert TypingCheckpoints(checkpoints.checkpoint_file).get("key") == checkpoint
+
+    checkpoints.clear("key")
+    assert TypingCheckpoints(checkpoints.checkpoint_file).get("key") is None
+
+
+def test_save_keeps_other_process_records(checkpoints):
+    other = TypingCheckpoints(checkpoints.checkpoint_file, interval=0)
+    other.record("other", typed_checkpoint("다른 계정\n\n"))
+    checkpoints.record("mine", typed_checkpoint("내 글\n\n"))
+    reloaded = TypingCheckpoints(checkpoints.checkpoint_file)
+    assert reloaded.get("other") is not None
+    assert reloaded.get("mine") is not None
+
+
+def test_resume_without_checkpoint(checkpoints):
+    assert checkpoints.resume("missing", FakeVerifier("내용"), log=lambda message: None) is None
+
+
+def test_resume_when_editor_matches(checkpoints):
+    checkpoint = typed_checkpoint("첫 문단\n\n", base=2)
+    checkpoints.record("key", checkpoint)
+    verifier = FakeVerifier("제목첫 문단\n\n")
+    assert checkpoints.resume("key", verifier, log=lambda message: None) == checkpoint
+    assert verifier.edits == []
+
+
+def test_resume_removes_text_typed_after_checkpoint(checkpoints):
+    checkpoint = typed_checkpoint("첫 문단\n\n")
+    checkpoints.record("key", checkpoint)
+    verifier = FakeVerifier("첫 문단\n\n두 번째 문")
+    assert checkpoints.resume("key", verifier, log=lambda message: None) == checkpoint
+    assert verifier.text == "첫 문단\n\n"
+
+
+def test_resume_mismatch_clears_text_of_this_source(checkpoints):
+    source = StringSource("첫 문단\n\n둘째 문단")
+    checkpoints.record("key", typed_checkpoint("첫 문단\n\n", base=2))
+    verifier = FakeVerifier("제목첫 문")
+    assert checkpoints.resume("key", verifier, source, log=lambda message: None) is None
+    assert verifier.text == "제목"
+
+
+def test_resume_mismatch_keeps_unrelated_content(checkpoints):
+    source = StringSource("첫 문단\n\n둘째 문단")
+    checkpoints.record("key", typed_checkpoint("첫 문단\n\n", base=2))
+    verifier = FakeVerifier("제목임시 저장된 다른 글")
+    assert checkpoints.resume("key", verifier, source, log=lambda message: None) is None
+    assert verifier.text == "제목임시 저장된 다른 글"
+    assert verifier.edits == []
+
+
+def test_resume_mismatch_without_source_keeps_content(checkpoints):
+    checkpoints.record("key", typed_checkpoint("첫 문단\n\n", base=2))
+    verifier = FakeVerifier("제목첫 문")
+    assert checkpoints.resume("key", verifier, log=lambda message: None) is None
+    assert verifier.edits == []
+
+
+def test_is_source_prefix_across_chunks():
+    source = StringSource("하나\r\n\r\n둘\n\n셋")
+    assert is_source_prefix(source, "하나\n\n둘\n")
+    assert is_source_prefix(source, "하나\n\n둘\n\n셋")
+    assert not is_source_prefix(source, "하나\n\n셋")
+    assert not is_source_prefix(source, "하나\n\n둘\n\n셋 더")
+
+
+def test_resume_mismatch_with_empty_editor(checkpoints):
+    checkpoints.record("key", typed_checkpoint("첫 문단\n\n", base=2))
+    verifier = FakeVerifier("제목")
+    assert checkpoints.resume("key", verifier, log=lambda message: None) is None
+    assert verifier.edits == []
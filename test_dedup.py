@@ -0,0 +1,90 @@
+"""naver_dedup 본문 지문(해시, MinHash)과 중복 글 확인 테스트"""
+import pytest
+
+from naver_dedup import (DuplicateIndex, band_keys, fingerprint, normalize_content, normalized_words,
+                         similarity)
+from naver_text_source import FileSource
+
+TEXT = " ".join(f"오늘은 {i}번째 문장을 작성합니다. 블로그 글 중복 확인용 본문입니다." for i in range(40))
+
+
+@pytest.fixture
+def index(tmp_path):
+    index = DuplicateIndex(str(tmp_path / "dedup.db"))
+    yield index
+    index.close()
+
+
+def test_normalize_content_ignores_markup_and_spacing():
+    assert normalize_content("<p>서울  맛집!</p>&nbsp;ＡＢＣ") == "서울 맛집 abc"
+
+
+def test_normalized_words_do_not_split_across_chunks():
+    chunks = ["<p>서울 맛", "집 탐방</", "p> 끝"]
+    assert list(normalized_words(chunks)) == normalize_content("".join(chunks)).split()
+
+
+def test_fingerprint_same_for_string_and_file(tmp_path):
+    path = tmp_path / "원고.txt"
+    path.write_text(TEXT * 20, encoding="utf-8")
+    assert fingerprint(FileSource(str(path))) == fingerprint(TEXT * 20)
+
+
+def test_fingerprint_ignores_formatting():
+    assert fingerprint("<b>서울 맛집</b>  탐방!") == fingerprint("서울 맛집 탐방")
+    assert fingerprint(" \n<br> ") is None
+
+
+def test_file_fingerprint_follows_rewrites(tmp_path):
+    path = tmp_path / "원고.txt"
+    path.write_text("첫 번째 원고입니다", encoding="utf-8")
+    source = FileSource(str(path))
+    first = fingerprint(source)
+    path.write_text("두 번째 원고입니다", encoding="utf-8")
+    assert fingerprint(source) != first
+
+
+def test_similarity_of_edited_text():
+    _, signature = fingerprint(TEXT)
+    _, edited = fingerprint(TEXT.replace("39번째", "마지막"))
+    _, other = fingerprint("전혀 다른 내용의 글입니다. " * 30)
+    assert similarity(signature, signature) == 1.0
+    assert similarity(signature, edited) > 0.8
+    assert similarity(signature, other) < 0.2
+    assert any(a == b for a, b in zip(band_keys(signature), band_keys(edited)))
+
+
+def test_check_finds_exact_and_similar_posts(index):
+    assert index.check("blog", TEXT) is None
+    index.add("blog", TEXT, "원래 글")
+
+    exact = index.check("blog", "<p>" + TEXT + "</p>")
+    assert (exact.kind, exact.title) == ("exact", "원래 글")
+
+    similar = index.check("blog", TEXT.replace("39번째", "마지막"))
+    assert similar.kind == "similar" and similar.similarity >= index.threshold
+
+    assert index.check("other-blog", TEXT) is None
+    assert index.check("blog", "전혀 다른 내용의 글입니다. " * 30) is None
+
+
+def test_index_is_reloaded_from_file(index):
+    index.add("blog", TEXT, "원래 글", post_url="https://blog.naver.com/blog/1")
+    index.add("blog", TEXT, "같은 글")  # 같은 글은 한 번만 기록
+    reloaded = DuplicateIndex(index.index_file)
+    try:
+        duplicate = reloaded.check("blog", TEXT)
+        assert (duplicate.kind, duplicate.title, duplicate.post_url) == \
+            ("exact", "원래 글", "https://blog.naver.com/blog/1")
+        assert len(reloaded.posts) == 1
+    finally:
+        reloaded.close()
+
+
+def test_precomputed_fingerprint_matches_text(index):
+    result = fingerprint(TEXT)
+    assert index.check_fingerprint("blog", result) is None
+    index.add_fingerprint("blog", result, "원래 글")
+    assert index.check("blog", TEXT).kind == "exact"
+    index.add_fingerprint("blog", None, "빈 글")  # 빈 글은 기록하지 않음
+    assert len(index.posts) == 1
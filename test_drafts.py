@@ -0,0 +1,121 @@
+"""naver_drafts 두 글자 조각 색인과 초안 검색 테스트"""
+import os
+import sqlite3
+
+import pytest
+
+import naver_drafts
+from naver_drafts import DraftLibrary, bigrams, draft_title, match_query, split_draft
+
+
+@pytest.fixture
+def library(tmp_path):
+    library = DraftLibrary(str(tmp_path / "drafts"), str(tmp_path / "drafts.db"))
+    yield library
+    library.close()
+
+
+def write_draft(library, name, content):
+    path = os.path.join(library.drafts_dir, name)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(content)
+    return path
+
+
+def titles(drafts):
+    return sorted(draft.title for draft in drafts)
+
+
+def test_bigrams_join_words():
+    assert bigrams("제주 여행") == "제주 주여 여행 행"
+    assert bigrams("서울맛집") == bigrams("서울 맛집")
+    assert bigrams(" !? ") == ""
+
+
+def test_match_query():
+    assert match_query("서울맛집") == '"서울 울맛 맛집"'
+    assert match_query("제주 여행") == '"제주" "여행"'
+    assert match_query("집") == '"집" *'
+    assert match_query("!!") == ""
+
+
+def test_draft_title_and_split():
+    assert draft_title("\n\n# 제목입니다\n본문") == "제목입니다"
+    assert draft_title("  \n") == ""
+    assert split_draft("\n# 제목\n\n본문 첫 줄\n둘째 줄\n") == ("제목", "본문 첫 줄\n둘째 줄")
+    assert split_draft("제목만") == ("제목만", "")
+
+
+def test_search_ignores_spacing(library):
+    write_draft(library, "a.txt", "서울 맛집 탐방\n종로에서 먹은 국밥 이야기")
+    write_draft(library, "b.txt", "서울의 맛집\n조사가 들어간 제목")
+    write_draft(library, "c.md", "# 제주 여행\n바다를 봤습니다")
+    assert library.sync() == (3, 0)
+    assert titles(library.search("서울맛집")) == ["서울 맛집 탐방"]
+    assert titles(library.search("서울")) == ["서울 맛집 탐방", "서울의 맛집"]
+    assert titles(library.search("국밥 종로")) == ["서울 맛집 탐방"]
+    assert titles(library.search("바")) == ["제주 여행"]
+    assert library.search("부산") == []
+
+
+def test_search_snippet_and_recent(library):
+    write_draft(library, "a.txt", "제목\n" + "앞부분 " * 30 + "국밥 이야기")
+    library.sync()
+    draft, = library.search("국밥")
+    assert draft.path == os.path.join(library.drafts_dir, "a.txt")
+    assert draft.snippet.startswith("…") and "국밥 이야기" in draft.snippet
+    assert titles(library.search("  ")) == ["제목"]
+
+
+def test_title_ranks_before_content(library):
+    write_draft(library, "a.txt", "일상 기록\n오늘은 캠핑을 다녀왔다")
+    write_draft(library, "b.txt", "캠핑 준비물\n텐트와 침낭")
+    library.sync()
+    assert [draft.title for draft in library.search("캠핑")] == ["캠핑 준비물", "일상 기록"]
+
+
+def test_sync_only_changed_files(library):
+    path = write_draft(library, "sub/a.txt", "첫 제목\n본문")
+    write_draft(library, "b.txt", "둘째 제목\n본문")
+    write_draft(library, "무시.jpg", "그림")
+    assert library.sync() == (2, 0)
+    assert library.sync() == (0, 0)
+
+    with open(path, "w", encoding="utf-8") as f:
+        f.write("바뀐 제목\n본문 내용이 바뀜")
+    os.utime(path, (1, 1))
+    os.remove(os.path.join(library.drafts_dir, "b.txt"))
+    assert library.sync() == (1, 1)
+    assert titles(library.search("")) == ["바뀐 제목"]
+    assert library.search("첫제목") == []
+
+
+def test_save_indexes_immediately(library, tmp_path):
+    path = library.save("새 초안 제목\n본문")
+    assert os.path.dirname(path) == library.drafts_dir
+    assert titles(library.search("새초안")) == ["새 초안 제목"]
+    outside = library.save("밖에 저장한 글", str(tmp_path / "outside.txt"))
+    assert os.path.exists(outside)
+    assert library.count() == 1
+
+
+def test_upgrade_index_rebuilds_old_index(tmp_path):
+    drafts_dir = str(tmp_path / "drafts")
+    library_file = str(tmp_path / "drafts.db")
+    library = DraftLibrary(drafts_dir, library_file)
+    write_draft(library, "a.txt", "서울 맛집\n본문")
+    library.sync()
+    library.close()
+
+    connection = sqlite3.connect(library_file)
+    connection.execute(f"PRAGMA user_version = {naver_drafts.INDEX_VERSION - 1}")
+    connection.close()
+
+    library = DraftLibrary(drafts_dir, library_file)
+    try:
+        assert library.count() == 0
+        assert library.sync() == (1, 0)
+        assert titles(library.search("서울맛집")) == ["서울 맛집"]
+    finally:
+        library.close()
@@ -0,0 +1,100 @@
+"""naver_journal 발행 작업 기록 복원/정리와 발행 여부 확인 테스트"""
+import pytest
+
+from naver_journal import (STATE_CONFIRMED, STATE_EDITOR_OPEN, STATE_FAILED, STATE_PUBLISH_CLICKED,
+                           STATE_QUEUED, PostJournal, resolve_ambiguous_job)
+
+
+@pytest.fixture
+def journal_file(tmp_path):
+    return str(tmp_path / "journal.jsonl")
+
+
+def test_replay_restores_last_state(journal_file):
+    journal = PostJournal(journal_file)
+    job_id = journal.enqueue("blog", "제목", "본문")
+    journal.append(job_id, STATE_EDITOR_OPEN)
+    journal.append(job_id, STATE_PUBLISH_CLICKED, last_log_no=10)
+
+    job = PostJournal(journal_file).get(job_id)
+    assert job["state"] == STATE_PUBLISH_CLICKED
+    assert job["title"] == "제목"
+    assert job["last_log_no"] == 10
+
+
+def test_enqueue_same_job_id_once(journal_file):
+    journal = PostJournal(journal_file)
+    assert journal.enqueue("blog", "제목", "본문", job_id="job") == "job"
+    assert journal.enqueue("blog", "제목", "본문", job_id="job") == "job"
+    with open(journal_file, encoding="utf-8") as f:
+        assert len(f.readlines()) == 1
+
+
+def test_replay_truncates_partial_last_line(journal_file):
+    journal = PostJournal(journal_file)
+    job_id = journal.enqueue("blog", "제목", "본문")
+    with open(journal_file, "ab") as f:
+        f.write(b'{"job": "' + job_id.encode() + b'", "state": "conf')
+
+    journal = PostJournal(journal_file)
+    assert journal.state(job_id) == STATE_QUEUED
+    journal.append(job_id, STATE_CONFIRMED)
+    assert PostJournal(journal_file).state(job_id) == STATE_CONFIRMED
+
+
+def test_replay_skips_broken_lines(journal_file):
+    journal = PostJournal(journal_file)
+    job_id = journal.enqueue("blog", "제목", "본문")
+    with open(journal_file, "ab") as f:
+        f.write(b"not json\n")
+    journal.append(job_id, STATE_EDITOR_OPEN)
+    assert PostJournal(journal_file).state(job_id) == STATE_EDITOR_OPEN
+
+
+def test_pending_jobs_and_compact(journal_file):
+    journal = PostJournal(journal_file)
+    done = journal.enqueue("blog", "끝난 글", "본문")
+    failed = journal.enqueue("blog", "실패한 글", "본문")
+    pending = journal.enqueue("blog", "남은 글", "본문")
+    journal.append(done, STATE_CONFIRMED, post_url="https://blog.naver.com/blog/1")
+    journal.append(failed, STATE_FAILED)
+
+    assert [job_id for job_id, _ in journal.pending_jobs()] == [pending]
+    assert [blog_id for blog_id, _ in journal.confirmed_posts(0)] == ["blog"]
+
+    assert journal.compact()
+    reloaded = PostJournal(journal_file)
+    assert list(reloaded.jobs) == [pending]
+    assert reloaded.get(pending)["title"] == "남은 글"
+
+
+def test_resolve_ignores_unambiguous_jobs(journal_file):
+    journal = PostJournal(journal_file)
+    job_id = journal.enqueue("blog", "제목", "본문")
+    assert not resolve_ambiguous_job(journal, job_id, lambda *args: pytest.fail("확인하지 않아야 함"),
+                                     log=lambda message: None)
+    assert journal.state(job_id) == STATE_QUEUED
+
+
+def test_resolve_confirms_post_after_click(journal_file):
+    journal = PostJournal(journal_file)
+    job_id = journal.enqueue("blog", "제목", "본문")
+    journal.append(job_id, STATE_PUBLISH_CLICKED, last_log_no=10)
+    calls = []
+
+    def find_post(blog_id, title, after_log_no):
+        calls.append((blog_id, title, after_log_no))
+        return "https://blog.naver.com/blog/11"
+
+    assert resolve_ambiguous_job(journal, job_id, find_post, log=lambda message: None)
+    assert calls == [("blog", "제목", 10)]
+    assert journal.state(job_id) == STATE_CONFIRMED
+    assert journal.get(job_id)["post_url"] == "https://blog.naver.com/blog/11"
+
+
+def test_resolve_requeues_unpublished_job(journal_file):
+    journal = PostJournal(journal_file)
+    job_id = journal.enqueue("blog", "제목", "본문")
+    journal.append(job_id, STATE_PUBLISH_CLICKED, last_log_no=10)
+    assert not resolve_ambiguous_job(journal, job_id, lambda *args: None, log=lambda message: None)
+    assert PostJournal(journal_file).state(job_id) == STATE_QUEUED
@@ -0,0 +1,94 @@
+"""naver_keywords 금지어/주의어 오토마톤과 목록 파일 검사 테스트"""
+import os
+
+import pytest
+
+from naver_keywords import (LEVEL_BLOCK, LEVEL_WARN, KeywordAutomaton, KeywordMatch, KeywordScanner,
+                            has_blocked, read_keywords, summarize_matches)
+from naver_text_source import FileSource
+
+
+def found(matches):
+    return sorted((match.start, match.end, match.keyword) for match in matches)
+
+
+def test_overlapping_keywords():
+    automaton = KeywordAutomaton([("he", LEVEL_WARN), ("she", LEVEL_WARN), ("his", LEVEL_WARN),
+                                  ("hers", LEVEL_WARN)])
+    assert found(automaton.scan("ushers")) == [(1, 4, "she"), (2, 4, "he"), (2, 6, "hers")]
+
+
+def test_spaced_and_fullwidth_variants():
+    automaton = KeywordAutomaton([("카지노", LEVEL_BLOCK), ("casino", LEVEL_BLOCK)])
+    text = "오늘 카 지.노 말고 ＣＡＳＩＮＯ 얘기"
+    assert found(automaton.scan(text)) == [(3, 8, "카지노"), (12, 18, "casino")]
+    assert text[3:8] == "카 지.노"
+
+
+def test_block_level_wins_for_same_keyword():
+    automaton = KeywordAutomaton([("대출", LEVEL_WARN), ("대 출", LEVEL_BLOCK), ("!!", LEVEL_WARN)])
+    assert len(automaton) == 1
+    assert automaton.scan("무서류 대출") == [KeywordMatch(4, 6, "대 출", LEVEL_BLOCK)]
+
+
+def test_empty_automaton_finds_nothing():
+    assert KeywordAutomaton([]).scan("아무 글") == []
+
+
+@pytest.mark.parametrize("size", [1, 2, 3, 7])
+def test_chunked_scan_matches_whole_text(size):
+    automaton = KeywordAutomaton([("수익 보장", LEVEL_WARN), ("카지노", LEVEL_BLOCK), ("보장", LEVEL_WARN)])
+    text = "확실한 수익보장! 카 지 노 이벤트, 원금 보장까지"
+    chunks = [text[i:i + size] for i in range(0, len(text), size)]
+    assert automaton.scan(chunks) == automaton.scan(text)
+    assert len(automaton.scan(text)) == 4
+
+
+def test_read_keywords(tmp_path):
+    path = tmp_path / "keywords.txt"
+    path.write_text("# 주석\n\n!카지노\n대출 \n! 도박\n", encoding="utf-8")
+    assert read_keywords(str(path)) == [("카지노", LEVEL_BLOCK), ("대출", LEVEL_WARN), ("도박", LEVEL_BLOCK)]
+
+
+def test_scanner_without_file_scans_nothing(tmp_path):
+    scanner = KeywordScanner(str(tmp_path / "없음.txt"))
+    assert scanner.scan("카지노") == []
+
+
+def test_scanner_uses_cache_and_reloads(tmp_path):
+    path = tmp_path / "keywords.txt"
+    path.write_text("!카지노\n", encoding="utf-8")
+    scanner = KeywordScanner(str(path))
+    assert os.path.exists(scanner.cache_file)
+    assert [match.keyword for match in KeywordScanner(str(path)).scan("카지노")] == ["카지노"]
+
+    path.write_text("!카지노\n대출\n", encoding="utf-8")
+    os.utime(path, (scanner.mtime + 10, scanner.mtime + 10))
+    assert scanner.reload_if_changed()
+    assert not scanner.reload_if_changed()
+    assert [match.keyword for match in scanner.scan("대출")] == ["대출"]
+
+
+def test_scan_post_ignores_markup(tmp_path):
+    path = tmp_path / "keywords.txt"
+    path.write_text("!카지노\nspan\n", encoding="utf-8")
+    scanner = KeywordScanner(str(path))
+    matches = scanner.scan_post("제목", '<p><span style="x">카</span>지&nbsp;노</p>')
+    assert [match.keyword for match in matches] == ["카지노"]
+
+
+def test_scan_source_reads_file(tmp_path):
+    path = tmp_path / "keywords.txt"
+    path.write_text("!카지노\n", encoding="utf-8")
+    manuscript = tmp_path / "원고.txt"
+    manuscript.write_text("첫 문단\n\n" * 1000 + "카지\n노 이야기", encoding="utf-8")
+    scanner = KeywordScanner(str(path))
+    assert [match.keyword for match in scanner.scan_source(FileSource(str(manuscript)))] == ["카지노"]
+
+
+def test_summarize_and_has_blocked():
+    matches = [KeywordMatch(0, 2, "대출", LEVEL_WARN), KeywordMatch(3, 6, "카지노", LEVEL_BLOCK),
+               KeywordMatch(7, 9, "대출", LEVEL_WARN)]
+    assert summarize_matches(matches) == "금지어: 카지노 / 주의어: 대출"
+    assert has_blocked(matches)
+    assert not has_blocked(matches[:1])
@@ -0,0 +1,49 @@
+"""naver_markdown Markdown/서식 텍스트 블록 변환 테스트"""
+from naver_markdown import MarkdownBlocks, inline_to_html, inline_to_text, parse_markdown, parse_rich_text
+from naver_text_source import StringSource
+
+
+def test_inline_formatting():
+    assert inline_to_html("**굵게** *기울임* _밑줄 아님_") == "<b>굵게</b> <i>기울임</i> <i>밑줄 아님</i>"
+    assert inline_to_text("**굵게** *기울임* [링크](http://a.com)") == "굵게 기울임 링크"
+    assert inline_to_html("1 < 2 & 3") == "1 &lt; 2 &amp; 3"
+
+
+def test_link_url_is_escaped_once():
+    assert inline_to_html("[x](http://x.com/?a=1&b=2)") == '<a href="http://x.com/?a=1&amp;b=2">x</a>'
+    assert inline_to_html('[x](http://x.com/"a)') == '<a href="http://x.com/&quot;a">x</a>'
+
+
+def test_code_spans_keep_markup():
+    assert inline_to_html("`a**b**c` **d**") == "<code>a**b**c</code> <b>d</b>"
+    assert inline_to_html("`<b>`") == "<code>&lt;b&gt;</code>"
+    assert inline_to_text("`a_b_c` _d_") == "a_b_c d"
+
+
+def test_parse_markdown_blocks():
+    blocks = parse_markdown("# 제목\n\n첫 줄\n둘째 줄\n\n> 인용\n\n- 하나\n- 둘\n1. 순서\n\n---")
+    assert [block.kind for block in blocks] == ["heading", "paragraph", "quote", "list", "list", "divider"]
+    assert blocks[0].level == 1 and blocks[0].text == "제목"
+    assert blocks[1].to_html() == "<p>첫 줄<br>둘째 줄</p>"
+    assert blocks[3].to_text() == "- 하나\n- 둘"
+    assert blocks[4].ordered and blocks[4].to_html() == "<ol><li>순서</li></ol>"
+
+
+def test_markdown_blocks_read_source_by_paragraph():
+    source = StringSource("# 제목\n\n본문 **굵게**\n\n- 항목")
+    assert [block.to_html() for block in MarkdownBlocks(source)] == \
+        ["<h1>제목</h1>", "<p>본문 <b>굵게</b></p>", "<ul><li>항목</li></ul>"]
+
+
+def test_parse_rich_text_formatting():
+    rich_html = ('<html><body><p>보통 <span style=" font-weight:600;">굵게</span></p>'
+                 '<ul><li>항목</li></ul><p><a href="http://a.com/?x=1&amp;y=2">링크</a></p></body></html>')
+    blocks = parse_rich_text(rich_html)
+    assert [block.kind for block in blocks] == ["paragraph", "list", "paragraph"]
+    assert blocks[0].html == "보통 <b>굵게</b>"
+    assert blocks[2].html == '<a href="http://a.com/?x=1&amp;y=2">링크</a>'
+
+
+def test_plain_rich_text_is_read_as_markdown():
+    rich_html = "<html><body><p># 제목</p><p></p><p>본문</p></body></html>"
+    assert [block.kind for block in parse_rich_text(rich_html)] == ["heading", "paragraph"]
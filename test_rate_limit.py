@@ -0,0 +1,99 @@
+"""naver_rate_limit 토큰 버킷과 발행 작업 선택 테스트"""
+import time
+
+import pytest
+
+import naver_rate_limit
+from naver_rate_limit import RateLimiter, TokenBucket, format_rates
+
+
+class Clock:
+    """time.monotonic 대신 쓰는 수동 시계"""
+    def __init__(self, now=1000.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(naver_rate_limit.time, "monotonic", clock)
+    return clock
+
+
+def test_bucket_allows_burst_then_waits_for_refill():
+    bucket = TokenBucket(6, 2, now=0)
+    assert bucket.wait_time(0) == 0
+    bucket.consume(0)
+    bucket.consume(0)
+    assert bucket.wait_time(0) == pytest.approx(600)
+    assert bucket.wait_time(300) == pytest.approx(300)
+    assert bucket.wait_time(600) == 0
+
+
+def test_bucket_never_exceeds_capacity():
+    bucket = TokenBucket(6, 2, now=0)
+    bucket.refill(100000)
+    assert bucket.tokens == 2
+
+
+def test_bucket_without_rate_waits_forever():
+    bucket = TokenBucket(0, 1, now=0)
+    bucket.consume(0)
+    assert bucket.wait_time(10) == float("inf")
+
+
+def test_acquire_applies_min_spacing(clock):
+    limiter = RateLimiter(account_rate=6, account_burst=2, min_spacing=120, jitter=0)
+    limiter.acquire("a")
+    assert limiter.wait_time("a") == pytest.approx(120)
+    clock.now += 120
+    assert limiter.wait_time("a") == 0
+    limiter.acquire("a")
+    # 버킷이 비었으므로 간격보다 토큰이 채워지는 시간이 더 김
+    assert limiter.wait_time("a") == pytest.approx(600 - 120)
+
+
+def test_choose_skips_busy_and_limited_accounts(clock):
+    limiter = RateLimiter(account_rate=6, account_burst=1, min_spacing=0)
+    limiter.acquire("a")
+    assert limiter.choose([("a", "blog1"), ("b", "blog2")]) == (1, 0.0)
+    assert limiter.choose([("a", "blog1"), ("b", "blog2")], busy={"b"}) == (None, pytest.approx(600))
+    assert limiter.choose([("b", "blog2")], busy={"b"}) == (None, None)
+
+
+def test_blog_buckets_limit_each_blog(clock):
+    limiter = RateLimiter(account_rate=60, account_burst=5, blog_rate=1, blog_burst=1, min_spacing=0)
+    limiter.acquire("a", "blog1")
+    assert limiter.wait_time("a", "blog1") == pytest.approx(3600)
+    assert limiter.wait_time("a", "blog2") == 0
+
+
+def test_restore_counts_recent_posts(clock):
+    limiter = RateLimiter(account_rate=6, account_burst=2, min_spacing=120, jitter=0)
+    now = time.time()
+    limiter.restore("a", [("blog1", now - 60), ("blog1", now - 30), ("blog1", now - 7200)])
+    # 한 시간 넘은 기록은 무시하고 최근 두 글로 버킷을 비움
+    assert limiter.wait_time("a") == pytest.approx(600 - 60, abs=1)
+    assert limiter.rates() == [("계정 a", 2.0, 6)]
+
+
+def test_set_rates_keeps_tokens(clock):
+    limiter = RateLimiter(account_rate=6, account_burst=1, min_spacing=0)
+    limiter.acquire("a")
+    limiter.set_rates(account_rate=60)
+    assert limiter.wait_time("a") == pytest.approx(60)
+
+
+def test_achieved_rate_drops_old_posts(clock):
+    limiter = RateLimiter(min_spacing=0)
+    limiter.acquire("a")
+    clock.now += naver_rate_limit.RATE_WINDOW + 1
+    assert limiter.rates() == [("계정 a", 0.0, naver_rate_limit.ACCOUNT_POSTS_PER_HOUR)]
+
+
+def test_format_rates():
+    assert format_rates([]) == "발행 속도: 기록 없음"
+    assert format_rates([("계정 a", 2.0, 6)]) == "발행 속도 (시간당 실제/허용): 계정 a 2.0/6"
@@ -0,0 +1,97 @@
+"""naver_schedule 예약 작업 저장소와 예약 발행 스레드 테스트"""
+import threading
+import time
+
+import pytest
+
+from naver_schedule import (SCHEDULE_CANCELED, SCHEDULE_QUEUED, PublishScheduler, ScheduleStore)
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = ScheduleStore(str(tmp_path / "schedule.db"))
+    yield store
+    store.close()
+
+
+def test_next_due_returns_earliest_pending(store):
+    later = store.add(2000, "blog1", "나중 글", "본문")
+    first = store.add(1000, "blog1", "먼저 글", "본문", category="일상", format_blocks=True, account="a")
+    job = store.next_due()
+    assert job["id"] == first
+    assert (job["title"], job["category"], job["format_blocks"], job["account"]) == ("먼저 글", "일상", 1, "a")
+    assert store.next_due(exclude={first})["id"] == later
+    assert store.next_due(exclude={first, later}) is None
+
+
+def test_mark_removes_job_from_pending(store):
+    first = store.add(1000, "blog1", "글1", "본문")
+    second = store.add(2000, "blog1", "글2", "본문")
+    store.mark(first, SCHEDULE_QUEUED, "job-1")
+    store.mark(second, SCHEDULE_CANCELED)
+    assert store.pending_count() == 0
+    assert store.upcoming() == []
+    row = store.connection.execute("SELECT state, job_id FROM scheduled_posts WHERE id = ?", (first,)).fetchone()
+    assert tuple(row) == (SCHEDULE_QUEUED, "job-1")
+
+
+def test_schedule_survives_restart(tmp_path):
+    path = str(tmp_path / "schedule.db")
+    store = ScheduleStore(path)
+    store.add(1000, "blog1", "글", "본문")
+    store.close()
+    store = ScheduleStore(path)
+    assert [job["title"] for job in store.upcoming()] == ["글"]
+    store.close()
+
+
+def test_scheduler_fires_due_job_once(store):
+    due = []
+    fired = threading.Event()
+
+    def on_due(job):
+        due.append(job["id"])
+        fired.set()
+
+    scheduler = PublishScheduler(store, on_due)
+    scheduler.start()
+    try:
+        schedule_id = scheduler.add(time.time() - 1, "blog1", "글", "본문")
+        assert fired.wait(5)
+        # 대기열 반영(complete) 전에는 다시 넘겨주지 않음
+        time.sleep(0.1)
+        assert due == [schedule_id]
+        scheduler.complete(schedule_id, "job-1")
+        assert scheduler.next_due_at() is None
+    finally:
+        scheduler.stop()
+        scheduler.join(5)
+
+
+def test_scheduler_prewarms_before_due(store):
+    prewarmed = threading.Event()
+    due = []
+    scheduler = PublishScheduler(store, due.append, on_prewarm=lambda job: prewarmed.set(), prewarm_lead=60)
+    scheduler.start()
+    try:
+        scheduler.add(time.time() + 30, "blog1", "글", "본문")
+        assert prewarmed.wait(5)
+        assert due == []
+    finally:
+        scheduler.stop()
+        scheduler.join(5)
+
+
+def test_canceled_job_is_not_fired(store):
+    due = []
+    scheduler = PublishScheduler(store, due.append)
+    schedule_id = scheduler.add(time.time() - 1, "blog1", "글", "본문")
+    scheduler.cancel(schedule_id)
+    scheduler.start()
+    try:
+        time.sleep(0.1)
+        assert due == []
+        assert scheduler.next_due_at() is None
+    finally:
+        scheduler.stop()
+        scheduler.join(5)
@@ -0,0 +1,190 @@
+"""naver_store 계정/블로그/카테고리/글 작성 기록 저장소 테스트"""
+import json
+import sqlite3
+import time
+
+import pytest
+
+from naver_store import POST_PUBLISHED, POST_TYPED, AccountStore, WriteBehind
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = AccountStore(str(tmp_path / "store.db"), write_delay=0)
+    yield store
+    store.close()
+
+
+def test_accounts_keep_order_and_blogs(store):
+    store.upsert_account("b", "pw", "둘째")
+    store.upsert_account("a", "pw", "첫째")
+    store.add_blog("b", "blog2")
+    store.add_blog("b", "blog1", "블로그 하나")
+    store.add_blog("b", "blog2", "무시됨")
+    accounts = store.accounts()
+    assert [account["username"] for account in accounts] == ["b", "a"]
+    assert accounts[0]["blogs"] == [{"id": "blog2", "name": "blog2"}, {"id": "blog1", "name": "블로그 하나"}]
+    assert accounts[1]["blogs"] == []
+
+
+def test_upsert_updates_without_moving(store):
+    store.upsert_account("a", "pw", "첫째")
+    store.upsert_account("b", "pw", "둘째")
+    store.upsert_account("a", "new", "새 이름")
+    accounts = store.accounts()
+    assert [(account["username"], account["password"], account["nickname"]) for account in accounts] == [
+        ("a", "new", "새 이름"), ("b", "pw", "둘째")]
+
+
+def test_delete_account_cascades(store):
+    store.upsert_account("a", "pw", "첫째")
+    store.add_blog("a", "blog1")
+    store.set_categories("a", "blog1", ["일상", "맛집"])
+    store.delete_account("a")
+    assert store.accounts() == []
+    assert store.categories("a", "blog1") == []
+
+
+def test_set_categories_replaces_list(store):
+    store.upsert_account("a", "pw", "첫째")
+    store.add_blog("a", "blog1")
+    store.set_categories("a", "blog1", ["일상", "맛집"])
+    store.set_categories("a", "blog1", ["여행"])
+    assert store.categories("a", "blog1") == ["여행"]
+
+
+def test_blog_for_missing_account_is_skipped(store, capsys):
+    store.add_blog("없는계정", "blog1")
+    assert store.query("SELECT * FROM blogs") == []
+    assert "저장하지 않은 변경" in capsys.readouterr().out
+
+
+def test_post_history_filters(store):
+    store.record_post("a", "blog1", "글1", POST_TYPED)
+    store.record_post("a", "blog2", "글2", POST_PUBLISHED, post_url="https://blog.naver.com/blog2/1")
+    store.record_post("b", "blog1", "글3", POST_TYPED)
+    assert {post["title"] for post in store.post_history(username="a")} == {"글1", "글2"}
+    assert {post["title"] for post in store.post_history(blog_id="blog1")} == {"글1", "글3"}
+    assert len(store.post_history(limit=2)) == 2
+
+
+def test_settings(store):
+    assert store.get_setting("current_account", "기본") == "기본"
+    store.set_setting("current_account", "a")
+    store.set_setting("current_account", "b")
+    assert store.get_setting("current_account") == "b"
+
+
+def test_migrate_json_once(store, tmp_path):
+    json_file = tmp_path / "accounts.json"
+    json_file.write_text(json.dumps({
+        "accounts": [{"username": "a", "password": "pw", "nickname": "첫째",
+                      "blogs": [{"id": "blog1", "name": "블로그"}]}],
+        "current_account": "a",
+    }), encoding="utf-8")
+    assert store.migrate_json(str(json_file))
+    assert store.accounts()[0]["blogs"] == [{"id": "blog1", "name": "블로그"}]
+    assert store.get_setting("current_account") == "a"
+    store.delete_account("a")
+    assert not store.migrate_json(str(json_file))
+    assert store.accounts() == []
+
+
+def test_migrate_json_missing_file(store, tmp_path):
+    assert not store.migrate_json(str(tmp_path / "없음.json"))
+
+
+class RecordingStore:
+    """WriteBehind가 기록한 변경을 모으는 저장소 (fail 횟수만큼 잠김 오류를 냄)"""
+    def __init__(self, fail=0):
+        self.batches = []
+        self.fail = fail
+
+    def apply(self, batch):
+        if self.fail:
+            self.fail -= 1
+            raise sqlite3.OperationalError("database is locked")
+        self.batches.append(batch)
+
+
+def test_write_behind_keeps_last_change_per_key():
+    store = RecordingStore()
+    writer = WriteBehind(store, delay=60)
+    writer.start()
+    writer.put(("setting", "a"), ["1"])
+    writer.put(None, ["기록1"])
+    writer.put(("setting", "a"), ["2"])
+    writer.put(None, ["기록2"])
+    assert store.batches == []
+    writer.flush()
+    assert store.batches == [[["2"], ["기록1"], ["기록2"]]]
+    writer.stop()
+
+
+def test_write_behind_writes_after_delay():
+    store = RecordingStore()
+    writer = WriteBehind(store, delay=0.05)
+    writer.start()
+    writer.put("key", ["1"])
+    deadline = time.monotonic() + 5
+    while not store.batches and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert store.batches == [[["1"]]]
+    writer.stop()
+
+
+def test_write_behind_discard_and_stop():
+    store = RecordingStore()
+    writer = WriteBehind(store, delay=60)
+    writer.start()
+    writer.put(("account", "a"), ["계정"])
+    writer.put(("blog", "a", "blog1"), ["블로그"])
+    writer.put(("account", "b"), ["다른 계정"])
+    writer.discard(lambda key: key[1] == "a")
+    writer.stop()
+    assert not writer.is_alive()
+    assert store.batches == [[["다른 계정"]]]
+
+
+def test_write_behind_retries_locked_database(capsys):
+    store = RecordingStore(fail=1)
+    writer = WriteBehind(store, delay=0.05, max_delay=0.05)
+    writer.start()
+    writer.put("key", ["1"])
+    writer.flush()
+    assert store.batches == [[["1"]]]
+    assert "다시 시도" in capsys.readouterr().out
+    writer.stop()
+
+
+def test_write_behind_retry_keeps_newer_change():
+    store = RecordingStore(fail=1)
+    writer = WriteBehind(store)
+    writer.put("key", ["1"])
+    writer.put("other", ["기록"])
+    batch = list(writer.pending.items())
+    writer.pending = {}
+    writer.put("key", ["2"])
+    writer.write(batch)
+    assert writer.pending == {"key": ["2"], "other": ["기록"]}
+
+
+def test_write_behind_flush_without_thread():
+    store = RecordingStore()
+    writer = WriteBehind(store)
+    writer.put("key", ["1"])
+    writer.flush()
+    assert store.batches == [[["1"]]]
+
+
+def test_delayed_store_reads_pending_changes(tmp_path):
+    path = str(tmp_path / "store.db")
+    store = AccountStore(path, write_delay=60)
+    store.upsert_account("a", "pw", "첫째")
+    store.add_blog("a", "blog1")
+    assert store.accounts()[0]["blogs"] == [{"id": "blog1", "name": "blog1"}]
+    store.set_setting("current_account", "a")
+    store.close()
+    store = AccountStore(path, write_delay=0)
+    assert store.get_setting("current_account") == "a"
+    store.close()
@@ -0,0 +1,89 @@
+"""naver_text_source 문단 단위 본문 조각과 이어서 읽기 테스트"""
+import pytest
+
+from naver_text_source import CHUNK_SIZE, UTF8_BOM, FileSource, StringSource, as_source, source_title
+
+
+def joined(source, start=0):
+    return "".join(chunk.text for chunk in source.chunks(start))
+
+
+@pytest.fixture
+def write_file(tmp_path):
+    def write(data, name="원고.txt"):
+        path = tmp_path / name
+        path.write_bytes(data)
+        return FileSource(str(path))
+    return write
+
+
+def test_string_chunks_split_at_blank_lines():
+    source = StringSource("첫 문단\n둘째 줄\n\n\n두 번째 문단\n\n마지막")
+    chunks = list(source.chunks())
+    assert [chunk.text for chunk in chunks] == ["첫 문단\n둘째 줄\n\n\n", "두 번째 문단\n\n", "마지막"]
+    assert all(source.text[chunk.start:chunk.end] == chunk.text for chunk in chunks)
+
+
+def test_long_paragraph_is_cut_at_line_breaks():
+    line = "가" * 1000 + "\n"
+    source = StringSource(line * 10)
+    chunks = list(source.chunks())
+    assert len(chunks) > 1
+    assert all(len(chunk.text) <= CHUNK_SIZE and chunk.text.endswith("\n") for chunk in chunks)
+    assert joined(source) == source.text
+
+
+def test_string_resume_from_chunk_end():
+    source = StringSource("하나\n\n둘\n\n셋")
+    first = next(source.chunks())
+    assert joined(source, first.end) == "둘\n\n셋"
+
+
+def test_file_chunks_skip_bom_and_use_byte_offsets(write_file):
+    text = "첫 문단\n\n두 번째 문단\n\n마지막"
+    source = write_file(UTF8_BOM + text.encode("utf-8"))
+    chunks = list(source.chunks())
+    assert chunks[0].start == len(UTF8_BOM)
+    assert "".join(chunk.text for chunk in chunks) == text
+    assert joined(source, chunks[1].start) == "두 번째 문단\n\n마지막"
+
+
+def test_file_cut_does_not_split_utf8_characters(write_file):
+    source = write_file(("가" * CHUNK_SIZE).encode("utf-8"))
+    chunks = list(source.chunks())
+    assert len(chunks) > 1
+    assert "�" not in joined(source)
+    assert joined(source) == "가" * CHUNK_SIZE
+
+
+def test_empty_file_has_no_chunks(write_file):
+    assert list(write_file(b"").chunks()) == []
+
+
+def test_preview_marks_truncated_file(write_file):
+    source = write_file(("본문\n" * 100).encode("utf-8"))
+    assert source.preview(limit=14).startswith("본문\n본문\n")
+    assert "이하 생략" in source.preview(limit=14)
+    assert "이하 생략" not in source.preview()
+
+
+def test_identity_changes_with_content(write_file):
+    assert StringSource("가").identity() != StringSource("나").identity()
+    assert StringSource("가").identity() == StringSource("가").identity()
+    source = write_file(b"abc")
+    identity = source.identity()
+    write_file(b"abcd")
+    assert source.identity() != identity
+
+
+def test_as_source_wraps_strings_only(write_file):
+    assert isinstance(as_source("본문"), StringSource)
+    source = write_file(b"abc")
+    assert as_source(source) is source
+
+
+def test_source_title_reads_first_line(write_file):
+    assert source_title("\n\n# 제목입니다\n본문") == "제목입니다"
+    assert source_title("   \n") == ""
+    source = write_file(("\n" * 5000 + "## 파일 제목\n\n본문").encode("utf-8"))
+    assert source_title(source) == "파일 제목"